@@ -1,6 +1,7 @@
-__all__ = ["Post", "User", "Category", "PostToCategory", "Comment", "SavedPost", "Subscribe"]
+__all__ = ["Post", "User", "Category", "PostToCategory", "Comment", "SavedPost", "Subscribe", "FeedEntry"]
 
 from blog_system_backend.src.api.categories.models import Category, PostToCategory
+from blog_system_backend.src.api.feed.models import FeedEntry
 from blog_system_backend.src.api.posts.comments.models import Comment
 from blog_system_backend.src.api.posts.models import Post
 from blog_system_backend.src.api.posts.saved_posts.models import SavedPost
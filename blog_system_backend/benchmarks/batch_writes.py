@@ -0,0 +1,112 @@
+"""Импорт N постов и N подписок: по запросу на элемент против пакетных эндпоинтов.
+
+Одиночный POST — отдельная транзакция (commit и fsync) и перечитывание записи после вставки. Пакетный пишет
+все элементы многострочными INSERT в одной транзакции. БД открыта с профилем PRAGMA `SQLITE_PROFILE`.
+
+    poetry run python -m blog_system_backend.benchmarks.batch_writes --items 500
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from blog_system_backend.src.api.users.deps import get_current_user
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.app import app
+from blog_system_backend.src.db.deps import get_session
+from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.db.pragmas import SQLITE_PROFILES, apply_pragmas
+from blog_system_backend.src.settings import settings
+
+READER = User(id=1, login="bench", email="bench@example.com", password="-")
+
+
+def seed(url: str, authors: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [dict(id=i, login=f"user{i}", email=f"user{i}@example.com", password="-") for i in range(1, authors + 2)],
+        )
+
+    engine.dispose()
+
+
+async def one_by_one(client: AsyncClient, items: int) -> None:
+    for i in range(items):
+        response = await client.post("/api/posts", json=dict(title=f"post {i}", content="lorem ipsum " * 50))
+        response.raise_for_status()
+
+    for author in range(2, items + 2):
+        response = await client.post(f"/api/users/{author}/subscribe")
+        response.raise_for_status()
+
+
+async def batched(client: AsyncClient, items: int) -> None:
+    posts = [dict(title=f"post {i}", content="lorem ipsum " * 50) for i in range(items)]
+    for start in range(0, items, settings.batch_max_size):
+        response = await client.post(
+            "/api/posts:batch", json=dict(items=posts[start : start + settings.batch_max_size])
+        )
+        response.raise_for_status()
+
+    authors = list(range(2, items + 2))
+    for start in range(0, items, settings.batch_max_size):
+        response = await client.post(
+            "/api/users/me/subscriptions:batch", json=dict(authorIds=authors[start : start + settings.batch_max_size])
+        )
+        response.raise_for_status()
+
+
+async def measure(strategy: Callable[[AsyncClient, int], Awaitable[None]], items: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        seed(f"sqlite:///{path}", items)
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        apply_pragmas(engine, SQLITE_PROFILES[settings.sqlite.profile])
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def get_bench_session() -> AsyncIterator[AsyncSession]:
+            async with factory() as session:
+                yield session
+
+        async def get_bench_user() -> User:
+            return READER
+
+        app.dependency_overrides[get_session] = get_bench_session
+        app.dependency_overrides[get_current_user] = get_bench_user
+
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                started = time.perf_counter()
+                await strategy(client, items)
+                return time.perf_counter() - started
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
+
+
+async def main(items: int) -> None:
+    print(f"items={items} (posts + subscriptions), profile={settings.sqlite.profile}")
+
+    for name, strategy in (("one request per item", one_by_one), ("batch endpoints", batched)):
+        elapsed = await measure(strategy, items)
+        print(f"{name:22} {elapsed * 1000:9.1f} ms   {items * 2 / elapsed:9.1f} items/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items))
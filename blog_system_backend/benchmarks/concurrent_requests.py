@@ -0,0 +1,139 @@
+"""Пропускная способность GET /api/posts при конкурентных запросах.
+
+Сравнивает синхронный доступ к БД из async-обработчика (как было раньше: `Session` блокирует event loop)
+с асинхронным слоем на aiosqlite. Помимо req/s измеряется задержка event loop под нагрузкой
+(на сколько позже положенного просыпается `asyncio.sleep`): она показывает, насколько запросы к БД
+блокируют обработку всех остальных запросов воркера.
+
+    poetry run python -m blog_system_backend.benchmarks.concurrent_requests --requests 400 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, or_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.schemas import PostResponse, PostsPaginationResponse
+from blog_system_backend.src.api.users.deps import get_current_user
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.app import app
+from blog_system_backend.src.db.deps import get_session
+from blog_system_backend.src.db.fts import load_tables
+from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.pagination import PaginationResponse, PaginationSearchParamsDepends
+
+
+def seed(url: str, posts: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(User(id=1, login="bench", email="bench@example.com", password="-"))
+        session.add_all(Post(authorId=1, title=f"post {i}", content=f"lorem ipsum {i} " * 200) for i in range(posts))
+        session.commit()
+
+    engine.dispose()
+
+
+def build_legacy_app(url: str) -> FastAPI:
+    engine = create_engine(url)
+    legacy = FastAPI()
+
+    @legacy.get("/api/posts")
+    async def get_posts(search_params: PaginationSearchParamsDepends) -> PostsPaginationResponse:
+        with Session(engine) as session:
+            query = session.query(Post)
+            if search_params.q:
+                query = query.filter(
+                    or_(Post.title.icontains(search_params.q), Post.content.icontains(search_params.q))
+                )
+            count = query.count()
+            posts = query.order_by(Post.createdAt.desc()).offset(search_params.offset).limit(search_params.limit)
+
+            return PostsPaginationResponse(
+                pagination=PaginationResponse.from_search_params(search_params, total_items=count),
+                posts=[PostResponse.from_orm(post) for post in posts],
+            )
+
+    return legacy
+
+
+async def run(application: FastAPI, requests: int, concurrency: int, params: dict[str, Any]) -> tuple[float, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async with AsyncClient(transport=ASGITransport(app=application), base_url="http://bench") as client:
+
+        async def request() -> None:
+            async with semaphore:
+                response = await client.get("/api/posts", params=params)
+                response.raise_for_status()
+
+        async def probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                latencies.append(time.perf_counter() - started - 0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(requests)))
+        throughput = requests / (time.perf_counter() - started)
+        done.set()
+        await probe_task
+
+    latencies.sort()
+    return throughput, latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0
+
+
+async def main(requests: int, concurrency: int, posts: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    seed(f"sqlite:///{path}", posts)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    await load_tables(engine)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_bench_session() -> AsyncIterator[AsyncSession]:
+        async with factory() as session:
+            yield session
+
+    async def get_bench_user() -> User:
+        return User(id=1, login="bench", email="bench@example.com", password="-")
+
+    app.dependency_overrides[get_session] = get_bench_session
+    app.dependency_overrides[get_current_user] = get_bench_user
+
+    legacy = build_legacy_app(f"sqlite:///{path}")
+    params = dict(q="ipsum 7", limit=20)
+
+    try:
+        before = await run(legacy, requests, concurrency, params)
+        after = await run(app, requests, concurrency, params)
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+    print(f"posts={posts} requests={requests} concurrency={concurrency}")
+    print(f"sync Session (before): {before[0]:8.1f} req/s, p99 event loop lag {before[1]:8.1f} ms")
+    print(f"AsyncSession (after):  {after[0]:8.1f} req/s, p99 event loop lag {after[1]:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency, args.posts))
@@ -0,0 +1,154 @@
+"""Стоимость страницы ленты, собранной при чтении, в зависимости от числа авторов в подписках.
+
+Сравнивает k-way слияние (`merge_feed`: новейший пост каждого автора по индексу, куча и дочитывание только авторов
+страницы), выборку `authorId IN (все авторы) ORDER BY createdAt` и материализованную ленту feed_entries.
+Измеряется только выборка ключей страницы; загрузка самих постов у всех вариантов одинаковая.
+
+    poetry run python -m blog_system_backend.benchmarks.feed_merge --authors 10 1000 10000 --posts 20 --limit 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from blog_system_backend.src.api.feed.merge import FeedKey, merge_feed
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.feed.repository import FeedRepository
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.api.users.subscribes.repository import SubscribeRepository
+from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.pagination import PaginationSearchParams, encode_cursor
+
+READER = 1
+
+
+def seed(url: str, authors: int, posts: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    random.seed(authors)
+    # Явные даты пишутся с микросекундами: курсор сравнивает ту же строку (см. audit_timestamp).
+    start = datetime(2024, 1, 1, microsecond=1)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [dict(id=i, login=f"user{i}", email=f"user{i}@example.com", password="-") for i in range(1, authors + 2)],
+        )
+        connection.execute(
+            insert(Subscribe), [dict(authorId=author, subscriberId=READER) for author in range(2, authors + 2)]
+        )
+        connection.execute(
+            insert(Post),
+            [
+                dict(
+                    authorId=author,
+                    title="title",
+                    content="content",
+                    createdAt=start + timedelta(minutes=random.randint(0, 60 * 24 * 365)),
+                )
+                for author in range(2, authors + 2)
+                for _ in range(posts)
+            ],
+        )
+        connection.execute(
+            text(
+                'INSERT INTO feed_entries ("userId", "postId", "createdAt") '
+                'SELECT subscribes."subscriberId", posts.id, posts."createdAt" '
+                'FROM subscribes JOIN posts ON posts."authorId" = subscribes."authorId"'
+            )
+        )
+        connection.exec_driver_sql("ANALYZE")
+
+    engine.dispose()
+
+
+def params(limit: int, cursor: str | None) -> PaginationSearchParams:
+    return PaginationSearchParams.model_construct(q=None, offset=0, limit=limit, cursor=cursor, include_total=False)
+
+
+async def merged(session: AsyncSession, search_params: PaginationSearchParams) -> list[FeedKey]:
+    return await merge_feed(session, READER, search_params, search_params.limit)
+
+
+async def in_list(session: AsyncSession, search_params: PaginationSearchParams) -> list[FeedKey]:
+    authors = await SubscribeRepository(session).get_author_ids(READER)
+    query = select(Post.createdAt, Post.id).filter(Post.authorId.in_(authors))
+    query = PostRepository.keyset.paginate(query, search_params)
+
+    return [(created_at, post_id) for created_at, post_id in await session.execute(query)]
+
+
+async def entries(session: AsyncSession, search_params: PaginationSearchParams) -> list[FeedKey]:
+    query = select(FeedEntry.createdAt, FeedEntry.postId).filter(FeedEntry.userId == READER)
+    query = FeedRepository.keyset.paginate(query, search_params)
+
+    return [(created_at, post_id) for created_at, post_id in await session.execute(query)]
+
+
+Strategy = Callable[[AsyncSession, PaginationSearchParams], Awaitable[list[FeedKey]]]
+
+
+async def measure(
+    session: AsyncSession, strategy: Strategy, search_params: PaginationSearchParams, repeat: int
+) -> float:
+    await strategy(session, search_params)
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        await strategy(session, search_params)
+
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def main(authors: list[int], posts: int, limit: int, depth: int, repeat: int) -> None:
+    strategies: tuple[tuple[str, Strategy], ...] = (
+        ("merge_feed", merged),
+        ("IN (all authors)", in_list),
+        ("feed_entries", entries),
+    )
+
+    for count in authors:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "feed.db")
+            seed(f"sqlite:///{path}", count, posts)
+            engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+            async with async_sessionmaker(engine)() as session:
+                # Курсор на глубине `depth` страниц: ключи считает эталонная выборка.
+                keys = await entries(session, params(limit * depth, None))
+                deep = encode_cursor(keys[-1]) if keys else None
+                results: dict[str, Any] = {}
+
+                for name, strategy in strategies:
+                    results[name] = await strategy(session, params(limit, deep))
+                    first = await measure(session, strategy, params(limit, None), repeat)
+                    later = await measure(session, strategy, params(limit, deep), repeat)
+                    print(f"authors={count:<6} {name:18} page 1 {first:8.2f} ms   page {depth + 1:<3} {later:8.2f} ms")
+
+                assert len({tuple(page) for page in results.values()}) == 1, "стратегии вернули разные страницы"
+
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--authors", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--posts", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.authors, args.posts, args.limit, args.depth, args.repeat))
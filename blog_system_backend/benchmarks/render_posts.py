@@ -0,0 +1,97 @@
+"""Стоимость сериализации страницы из 100 постов с большим `content`.
+
+Сравнивает путь FastAPI по умолчанию (повторная валидация `response_model`, `jsonable`-словарь и `json.dumps`),
+тот же путь с `ORJSONResponse` и `rendered`: заранее скомпилированный `TypeAdapter.dump_python` без валидации
+и orjson. Для сравнения выводится и `TypeAdapter.dump_json`: на длинном не-ASCII тексте он медленнее orjson.
+
+    poetry run python -m blog_system_backend.benchmarks.render_posts --posts 100 --content 20000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from pydantic import TypeAdapter
+
+from blog_system_backend.src.api.posts.schemas import PostResponse, PostsPaginationResponse
+from blog_system_backend.src.pagination import PaginationResponse, PaginationSearchParams
+
+
+def build_page(posts: int, content: int) -> PostsPaginationResponse:
+    search_params = PaginationSearchParams(q=None, offset=0, limit=posts, cursor=None, include_total=True)
+
+    return PostsPaginationResponse(
+        pagination=PaginationResponse.from_search_params(search_params, total_items=posts * 10),
+        posts=[
+            PostResponse(
+                id=i + 1,
+                authorId=1,
+                title=f"Пост {i}",
+                content=("Съешь же ещё этих мягких французских булок. " * (content // 44 + 1))[:content],
+                categories=["python", "sqlite"],
+                commentsCount=12,
+                savesCount=3,
+                createdAt=datetime(2024, 1, 1),
+                updatedAt=datetime(2024, 1, 2),
+            )
+            for i in range(posts)
+        ],
+    )
+
+
+async def measure(render: Callable[[], Awaitable[bytes]], repeat: int) -> float:
+    await render()
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        await render()
+
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def main(posts: int, content: int, repeat: int) -> None:
+    page = build_page(posts, content)
+
+    async def endpoint() -> PostsPaginationResponse:
+        return page
+
+    field = APIRoute("/api/posts", endpoint, response_model=PostsPaginationResponse).response_field
+    adapter = TypeAdapter(PostsPaginationResponse)
+
+    async def fastapi_default() -> bytes:
+        return bytes(JSONResponse(await serialize_response(field=field, response_content=page)).body)
+
+    async def fastapi_orjson() -> bytes:
+        return bytes(ORJSONResponse(await serialize_response(field=field, response_content=page)).body)
+
+    async def fast_path() -> bytes:
+        return orjson.dumps(adapter.dump_python(page, by_alias=True), option=orjson.OPT_UTC_Z)
+
+    async def dump_json() -> bytes:
+        return adapter.dump_json(page, by_alias=True)
+
+    size = len(await fast_path())
+    print(f"posts={posts} content={content} body={size / 1024:.0f} KiB repeat={repeat}")
+
+    for name, render in (
+        ("FastAPI + JSONResponse", fastapi_default),
+        ("FastAPI + ORJSONResponse", fastapi_orjson),
+        ("rendered", fast_path),
+        ("TypeAdapter.dump_json", dump_json),
+    ):
+        print(f"{name:26} {await measure(render, repeat):8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--content", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.posts, args.content, args.repeat))
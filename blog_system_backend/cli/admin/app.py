@@ -2,6 +2,8 @@ __all__ = [
     "app",
 ]
 
+import asyncio
+
 from typer import Option, Typer
 
 from blog_system_backend.cli.admin.service import create_superuser
@@ -40,4 +42,4 @@ def create(
         help="Пароль нового админа",
     ),
 ) -> None:
-    create_superuser(login, email, password)
+    asyncio.run(create_superuser(login, email, password))
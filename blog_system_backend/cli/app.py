@@ -1,7 +1,8 @@
 from typer import Typer
 
-from blog_system_backend.cli import admin
+from blog_system_backend.cli import admin, counters
 
 app = Typer()
 
 app.add_typer(admin.app)
+app.add_typer(counters.app)
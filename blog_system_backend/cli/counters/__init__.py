@@ -0,0 +1,5 @@
+__all__ = [
+    "app",
+]
+
+from blog_system_backend.cli.counters.app import app
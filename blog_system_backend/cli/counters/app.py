@@ -0,0 +1,21 @@
+__all__ = [
+    "app",
+]
+
+import asyncio
+
+from typer import Typer
+
+from blog_system_backend.cli.counters.service import rebuild_all_counters
+
+app = Typer(
+    name="counters",
+    help="Денормализованные счетчики",
+)
+
+
+@app.command(
+    help="Пересчет счетчиков подписчиков, подписок, постов, комментариев и сохранений по данным",
+)
+def rebuild() -> None:
+    asyncio.run(rebuild_all_counters())
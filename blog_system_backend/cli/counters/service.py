@@ -0,0 +1,25 @@
+from typer import Exit, colors, secho
+
+from blog_system_backend.src.api.posts.comments.models import POST_COMMENTS
+from blog_system_backend.src.api.posts.models import USER_POSTS
+from blog_system_backend.src.api.posts.saved_posts.models import POST_SAVES
+from blog_system_backend.src.api.users.subscribes.models import USER_FOLLOWERS, USER_SUBSCRIPTIONS
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope
+from blog_system_backend.src.db.counters import rebuild_counters
+from blog_system_backend.src.db.deps import get_write_session
+
+COUNTERS = (USER_FOLLOWERS, USER_SUBSCRIPTIONS, USER_POSTS, POST_COMMENTS, POST_SAVES)
+
+
+async def rebuild_all_counters() -> None:
+    async for session in get_write_session():
+        try:
+            await rebuild_counters(session, COUNTERS)
+        except Exception as exception:
+            secho(f"Не удалось пересчитать счетчики:\n\n{exception}", fg=colors.RED)
+            raise Exit(1)
+
+        # Версии рассылаются по настроенному каналу: с Redis их получат все серверы. У кэша в памяти общего канала
+        # нет, и серверы сбрасывают кэш сами, когда видят чужой коммит пересчета через PRAGMA data_version.
+        await RESPONSE_CACHE.bump(CacheScope.users, CacheScope.posts)
+        secho("Счетчики пересчитаны.", fg=colors.GREEN)
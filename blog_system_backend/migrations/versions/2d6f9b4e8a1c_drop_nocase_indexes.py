@@ -0,0 +1,30 @@
+"""drop nocase indexes
+
+Revision ID: 2d6f9b4e8a1c
+Revises: 7b2e4d9a1c63
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d6f9b4e8a1c"
+down_revision: Union[str, Sequence[str], None] = "7b2e4d9a1c63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_categories_title_nocase", table_name="categories")
+    op.drop_index("ix_users_login_nocase", table_name="users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_users_login_nocase", "users", [sa.text("login COLLATE NOCASE")], unique=False)
+    op.create_index("ix_categories_title_nocase", "categories", [sa.text("title COLLATE NOCASE")], unique=False)
@@ -0,0 +1,69 @@
+"""add denormalized counters
+
+Revision ID: 3c9f1e6a8d52
+Revises: e5a3c8f17b40
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9f1e6a8d52"
+down_revision: Union[str, Sequence[str], None] = "e5a3c8f17b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (таблица счетчика, колонка, таблица-источник, ссылка источника) — SQL ниже зафиксирован на момент ревизии
+# и не зависит от кода приложения.
+COUNTERS = (
+    ("users", "followersCount", "subscribes", "authorId"),
+    ("users", "subscriptionsCount", "subscribes", "subscriberId"),
+    ("users", "postsCount", "posts", "authorId"),
+    ("posts", "commentsCount", "comments", "postId"),
+    ("posts", "savesCount", "saved_posts", "postId"),
+)
+
+
+def create_statements(target: str, column: str, source: str, key: str) -> list[str]:
+    name = f"{target}_{column}"
+    increment = f'UPDATE {target} SET "{column}" = "{column}" + 1 WHERE id = new."{key}";'
+    decrement = f'UPDATE {target} SET "{column}" = "{column}" - 1 WHERE id = old."{key}";'
+
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {source} BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {source} BEGIN {decrement} END",
+        f'CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF "{key}" ON {source} '
+        f'WHEN old."{key}" IS NOT new."{key}" BEGIN {decrement} {increment} END',
+        f'UPDATE {target} SET "{column}" = (SELECT count(*) FROM {source} WHERE {source}."{key}" = {target}.id)',
+    ]
+
+
+def drop_statements(target: str, column: str) -> list[str]:
+    return [f"DROP TRIGGER IF EXISTS {target}_{column}_{event}" for event in ("update", "delete", "insert")]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for target, column, _, _ in COUNTERS:
+        op.add_column(target, sa.Column(column, sa.Integer(), server_default="0", nullable=False))
+
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for counter in COUNTERS:
+        for statement in create_statements(*counter):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for target, column, _, _ in reversed(COUNTERS):
+        if op.get_bind().dialect.name == "sqlite":
+            for statement in drop_statements(target, column):
+                op.execute(statement)
+
+        op.drop_column(target, column)
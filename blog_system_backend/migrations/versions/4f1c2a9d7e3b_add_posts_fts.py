@@ -0,0 +1,65 @@
+"""add posts fts
+
+Revision ID: 4f1c2a9d7e3b
+Revises: b364c310aeb2
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f1c2a9d7e3b"
+down_revision: Union[str, Sequence[str], None] = "b364c310aeb2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQL зафиксирован на момент ревизии: миграция не должна меняться вместе с кодом приложения.
+CREATE_POSTS_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(title, content, content='posts', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN "
+    "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+)
+REBUILD_POSTS_FTS = "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"
+DROP_POSTS_FTS = (
+    "DROP TRIGGER IF EXISTS posts_fts_update",
+    "DROP TRIGGER IF EXISTS posts_fts_delete",
+    "DROP TRIGGER IF EXISTS posts_fts_insert",
+    "DROP TABLE IF EXISTS posts_fts",
+)
+
+
+def fts5_supported() -> bool:
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        return False
+
+    return bool(connection.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not fts5_supported():
+        return
+
+    for statement in CREATE_POSTS_FTS:
+        op.execute(statement)
+
+    op.execute(REBUILD_POSTS_FTS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for statement in DROP_POSTS_FTS:
+        op.execute(statement)
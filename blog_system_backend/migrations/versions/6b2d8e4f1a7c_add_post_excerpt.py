@@ -0,0 +1,50 @@
+"""add post excerpt
+
+Revision ID: 6b2d8e4f1a7c
+Revises: 9a7e5d3c1b2f
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b2d8e4f1a7c"
+down_revision: Union[str, Sequence[str], None] = "9a7e5d3c1b2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+posts = sa.table("posts", sa.column("id", sa.Integer), sa.column("content", sa.String), sa.column("excerpt", sa.String))
+
+# Длина и правила обрезки зафиксированы на момент ревизии; дальше excerpt пишет приложение.
+EXCERPT_LENGTH = 280
+
+
+def make_excerpt(content: str) -> str:
+    text = " ".join(content.split())
+
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+
+    cut = text[: EXCERPT_LENGTH - 1]
+    if text[EXCERPT_LENGTH - 1] != " " and " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+
+    return cut.rstrip(" .,;:!?-") + "…"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("posts", sa.Column("excerpt", sa.String(), server_default="", nullable=False))
+
+    connection = op.get_bind()
+    for id, content in connection.execute(sa.select(posts.c.id, posts.c.content)).all():
+        connection.execute(sa.update(posts).where(posts.c.id == id).values(excerpt=make_excerpt(content)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("posts", "excerpt")
@@ -0,0 +1,62 @@
+"""add feed entries
+
+Revision ID: 7b2e4d9a1c63
+Revises: 3c9f1e6a8d52
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e4d9a1c63"
+down_revision: Union[str, Sequence[str], None] = "3c9f1e6a8d52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "feed_entries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("userId", sa.Integer(), nullable=False),
+        sa.Column("postId", sa.Integer(), nullable=False),
+        sa.Column("createdAt", sa.DateTime(), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False),
+        sa.Column("updatedAt", sa.DateTime(), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False),
+        sa.ForeignKeyConstraint(["postId"], ["posts.id"], name="fk_feed_entries_post", onupdate="CASCADE"),
+        sa.ForeignKeyConstraint(["userId"], ["users.id"], name="fk_feed_entries_user", onupdate="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.add_column("posts", sa.Column("fannedOut", sa.Boolean(), server_default="1", nullable=False))
+
+    # Существующие посты раскладываются по лентам текущих подписчиков до создания индексов.
+    op.execute(
+        'INSERT INTO feed_entries ("userId", "postId", "createdAt") '
+        'SELECT subscribes."subscriberId", posts.id, posts."createdAt" '
+        'FROM subscribes JOIN posts ON posts."authorId" = subscribes."authorId"'
+    )
+
+    op.create_index(op.f("ix_feed_entries_postId"), "feed_entries", ["postId"], unique=False)
+    op.create_index("ix_feed_entries_userId_createdAt", "feed_entries", ["userId", "createdAt", "postId"], unique=False)
+    op.create_index("uq_feed_entries_userId_postId", "feed_entries", ["userId", "postId"], unique=True)
+    op.create_index(
+        "ix_posts_pulled_authorId_createdAt",
+        "posts",
+        ["authorId", "createdAt"],
+        unique=False,
+        sqlite_where=sa.text('"fannedOut" IS 0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_pulled_authorId_createdAt", table_name="posts", sqlite_where=sa.text('"fannedOut" IS 0'))
+    op.drop_column("posts", "fannedOut")
+    op.drop_index("uq_feed_entries_userId_postId", table_name="feed_entries")
+    op.drop_index("ix_feed_entries_userId_createdAt", table_name="feed_entries")
+    op.drop_index(op.f("ix_feed_entries_postId"), table_name="feed_entries")
+    op.drop_table("feed_entries")
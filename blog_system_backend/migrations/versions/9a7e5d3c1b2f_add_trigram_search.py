@@ -0,0 +1,76 @@
+"""add trigram search
+
+Revision ID: 9a7e5d3c1b2f
+Revises: 4f1c2a9d7e3b
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a7e5d3c1b2f"
+down_revision: Union[str, Sequence[str], None] = "4f1c2a9d7e3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (индекс, таблица, колонка) — SQL ниже зафиксирован на момент ревизии и не зависит от кода приложения.
+TRIGRAM_INDEXES = (("users_login_trgm", "users", "login"), ("categories_title_trgm", "categories", "title"))
+
+
+def create_statements(name: str, table: str, column: str) -> list[str]:
+    delete = f"INSERT INTO {name}({name}, rowid, {column}) VALUES ('delete', old.id, old.{column});"
+    insert = f"INSERT INTO {name}(rowid, {column}) VALUES (new.id, new.{column});"
+
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({column}, content='{table}', content_rowid='id', "
+        "tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF {column} ON {table} BEGIN {delete} {insert} END",
+        f"INSERT INTO {name}({name}) VALUES ('rebuild')",
+    ]
+
+
+def drop_statements(name: str) -> list[str]:
+    return [
+        f"DROP TRIGGER IF EXISTS {name}_update",
+        f"DROP TRIGGER IF EXISTS {name}_delete",
+        f"DROP TRIGGER IF EXISTS {name}_insert",
+        f"DROP TABLE IF EXISTS {name}",
+    ]
+
+
+def fts5_supported() -> bool:
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        return False
+
+    return bool(connection.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_users_login_nocase", "users", [sa.text("login COLLATE NOCASE")], unique=False)
+    op.create_index("ix_categories_title_nocase", "categories", [sa.text("title COLLATE NOCASE")], unique=False)
+
+    if not fts5_supported():
+        return
+
+    for index in TRIGRAM_INDEXES:
+        for statement in create_statements(*index):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for name, _, _ in reversed(TRIGRAM_INDEXES):
+            for statement in drop_statements(name):
+                op.execute(statement)
+
+    op.drop_index("ix_categories_title_nocase", table_name="categories")
+    op.drop_index("ix_users_login_nocase", table_name="users")
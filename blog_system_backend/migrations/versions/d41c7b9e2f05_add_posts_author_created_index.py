@@ -0,0 +1,29 @@
+"""add posts (authorId, createdAt) index
+
+Revision ID: d41c7b9e2f05
+Revises: 6b2d8e4f1a7c
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41c7b9e2f05"
+down_revision: Union[str, Sequence[str], None] = "6b2d8e4f1a7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_posts_authorId_createdAt", "posts", ["authorId", "createdAt"], unique=False)
+    op.drop_index(op.f("ix_posts_authorId"), table_name="posts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_posts_authorId"), "posts", ["authorId"], unique=False)
+    op.drop_index("ix_posts_authorId_createdAt", table_name="posts")
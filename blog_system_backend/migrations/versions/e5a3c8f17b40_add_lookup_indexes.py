@@ -0,0 +1,49 @@
+"""add lookup indexes and unique pairs
+
+Revision ID: e5a3c8f17b40
+Revises: d41c7b9e2f05
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a3c8f17b40"
+down_revision: Union[str, Sequence[str], None] = "d41c7b9e2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_posts_createdAt", "posts", ["createdAt"], unique=False)
+    op.create_index("ix_comments_postId_createdAt", "comments", ["postId", "createdAt"], unique=False)
+    op.drop_index(op.f("ix_comments_postId"), table_name="comments")
+    op.create_index("ix_post_to_category_postId", "post_to_category", ["postId", "categoryId"], unique=False)
+    op.create_index("ix_posts_updatedAt", "posts", ["updatedAt"], unique=False)
+    op.create_index("ix_users_updatedAt", "users", ["updatedAt"], unique=False)
+    op.create_index("ix_comments_updatedAt", "comments", ["updatedAt"], unique=False)
+
+    # Повторные пары могли появиться при параллельных запросах: оставляем самую раннюю запись.
+    op.execute('DELETE FROM saved_posts WHERE id NOT IN (SELECT min(id) FROM saved_posts GROUP BY "userId", "postId")')
+    op.execute(
+        'DELETE FROM subscribes WHERE id NOT IN (SELECT min(id) FROM subscribes GROUP BY "authorId", "subscriberId")'
+    )
+    op.create_index("uq_saved_posts_userId_postId", "saved_posts", ["userId", "postId"], unique=True)
+    op.create_index("uq_subscribes_authorId_subscriberId", "subscribes", ["authorId", "subscriberId"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_subscribes_authorId_subscriberId", table_name="subscribes")
+    op.drop_index("uq_saved_posts_userId_postId", table_name="saved_posts")
+    op.drop_index("ix_comments_updatedAt", table_name="comments")
+    op.drop_index("ix_users_updatedAt", table_name="users")
+    op.drop_index("ix_posts_updatedAt", table_name="posts")
+    op.drop_index("ix_post_to_category_postId", table_name="post_to_category")
+    op.create_index(op.f("ix_comments_postId"), "comments", ["postId"], unique=False)
+    op.drop_index("ix_comments_postId_createdAt", table_name="comments")
+    op.drop_index("ix_posts_createdAt", table_name="posts")
@@ -1,10 +1,12 @@
 from fastapi import APIRouter
 
-from blog_system_backend.src.api import auth, categories, posts, users
+from blog_system_backend.src.api import auth, categories, export, feed, posts, users
 
 router = APIRouter(prefix="/api")
 
 router.include_router(auth.router)
 router.include_router(users.router)
 router.include_router(posts.router)
+router.include_router(feed.router)
 router.include_router(categories.router)
+router.include_router(export.router)
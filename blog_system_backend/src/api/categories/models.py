@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from blog_system_backend.src.db.fts import TrigramIndex
 from blog_system_backend.src.db.models import Base
 
 if TYPE_CHECKING:
@@ -22,6 +23,10 @@ class Category(Base):
     )
 
 
+TITLE_TRIGRAM = TrigramIndex("categories", "title")
+TITLE_TRIGRAM.attach(Category.__table__)
+
+
 class PostToCategory(Base):
     __tablename__ = "post_to_category"
 
@@ -31,3 +36,7 @@ class PostToCategory(Base):
     postId: Mapped[int] = mapped_column(
         ForeignKey("posts.id", onupdate="CASCADE", name="fk_post_to_category_post"), primary_key=True
     )
+
+
+# Первичный ключ начинается с categoryId; категории поста ищутся по postId.
+Index("ix_post_to_category_postId", PostToCategory.postId, PostToCategory.categoryId)
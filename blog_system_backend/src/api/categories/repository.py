@@ -1,54 +1,70 @@
-from typing import Annotated
+from collections.abc import Collection
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import Select, select
 
-from blog_system_backend.src.api.categories.models import Category
+from blog_system_backend.src.api.categories.models import TITLE_TRIGRAM, Category
 from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest, CategoryUpdateRequest
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
 
 
 class CategoryRepository:
+    keyset = Keyset(Category.title, Category.id)
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get_by_id(self, id: int) -> Category | None:
-        return self.session.get(Category, id)
+    async def get_by_id(self, id: int) -> Category | None:
+        return await self.session.get(Category, id)
+
+    async def get_by_title(self, title: str) -> Category | None:
+        return (await self.session.scalars(select(Category).filter(Category.title == title).limit(1))).first()
 
-    def get_by_title(self, title: str) -> Category | None:
-        return self.session.query(Category).filter(Category.title == title).first()
+    async def get_by_ids(self, ids: Collection[int]) -> dict[int, Category]:
+        query = select(Category).filter(Category.id.in_(ids))
+        return {category.id: category for category in await self.session.scalars(query)}
 
-    def list(self, search_params: PaginationSearchParams | None = None) -> list[Category]:
-        search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Category)
+    async def get_validators(self, id: int) -> Validators | None:
+        updated_at = (await self.session.scalars(select(Category.updatedAt).filter(Category.id == id).limit(1))).first()
+        return Validators.from_parts(id, updated_at, last_modified=updated_at) if updated_at else None
 
-        query = query.filter(Category.title.icontains(search_params.q)) if search_params.q else query
-        query = query.order_by(Category.title).offset(search_params.offset).limit(search_params.limit)
+    async def list_page(self, search_params: PaginationSearchParams) -> Page[Category]:
+        query = await self._filter(select(Category), search_params)
 
-        return query.all()
+        return await self.keyset.fetch(self.session, query, search_params)
 
-    def count(self, search_params: PaginationSearchParams | None = None) -> int:
-        search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Category)
-        query = query.filter(Category.title.icontains(search_params.q)) if search_params.q else query
+    async def list_validators(self, search_params: PaginationSearchParams) -> Validators:
+        query = await self._filter(select(Category), search_params)
 
-        return query.count()
+        return await self.keyset.validators(self.session, query, search_params, Category.updatedAt)
 
-    def create(self, args: CategoryCreateRequest) -> Category:
+    async def create(self, args: CategoryCreateRequest) -> Category:
         category = Category(title=args.title)
         self.session.add(category)
-        self.session.commit()
-        self.session.refresh(category)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.categories)
+        await self.session.refresh(category)
         return category
 
-    def update(self, category: Category, args: CategoryUpdateRequest) -> None:
+    async def update(self, category: Category, args: CategoryUpdateRequest) -> None:
         category.update(args.dict())
-        self.session.commit()
-        self.session.refresh(category)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.categories)
+        await self.session.refresh(category)
+
+    async def delete(self, category: Category) -> None:
+        await self.session.delete(category)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.categories)
+
+    async def _filter(self, query: Select[Any], search_params: PaginationSearchParams) -> Select[Any]:
+        if not search_params.q:
+            return query
 
-    def delete(self, category: Category) -> None:
-        self.session.delete(category)
-        self.session.commit()
+        return query.filter(await TITLE_TRIGRAM.search(self.session, Category.title, Category.id, search_params.q))
 
 
 CategoryRepositoryDepends = Annotated[CategoryRepository, Depends()]
@@ -1,10 +1,9 @@
-from functools import lru_cache
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from blog_system_backend.src.api.categories.models import Category
 from blog_system_backend.src.api.categories.repository import CategoryRepositoryDepends
 from blog_system_backend.src.api.categories.schemas import (
+    CategoryBatchResponse,
     CategoryCreateRequest,
     CategoryPaginationResponse,
     CategoryResponse,
@@ -12,36 +11,62 @@ from blog_system_backend.src.api.categories.schemas import (
 )
 from blog_system_backend.src.api.users.deps import CurrentUserDepends
 from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.batch import BatchIds, pick
+from blog_system_backend.src.cache import CacheScope, cached, check_not_modified
 from blog_system_backend.src.pagination import PaginationResponse, PaginationSearchParamsDepends
-from blog_system_backend.src.settings import settings
+from blog_system_backend.src.rendering import rendered
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("", response_model=CategoryPaginationResponse)
+@rendered
+@cached(CacheScope.categories)
 async def get_categories(
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
     repository: CategoryRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> CategoryPaginationResponse:
-    categories = repository.list(search_params)
-    count = repository.count(search_params)
+    check_not_modified(request, response, await repository.list_validators(search_params))
+
+    page = await repository.list_page(search_params)
     return CategoryPaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=count),
-        categories=[CategoryResponse.from_orm(cat) for cat in categories],
+        pagination=PaginationResponse.from_page(search_params, page),
+        categories=[CategoryResponse.from_orm(cat) for cat in page.items],
+    )
+
+
+@router.get(":batch", response_model=CategoryBatchResponse)
+@rendered
+@cached(CacheScope.categories)
+async def get_categories_batch(
+    ids: BatchIds, repository: CategoryRepositoryDepends, current_user: CurrentUserDepends
+) -> CategoryBatchResponse:
+    categories, missing = pick(ids, await repository.get_by_ids(ids))
+
+    return CategoryBatchResponse(
+        categories=[CategoryResponse.from_orm(category) for category in categories], missingIds=missing
     )
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{category_id}", response_model=CategoryResponse)
+@rendered
+@cached(CacheScope.categories)
 async def get_category(
-    category_id: int, repository: CategoryRepositoryDepends, current_user: CurrentUserDepends
-) -> Category:
-    category = repository.get_by_id(category_id)
+    category_id: int,
+    request: Request,
+    response: Response,
+    repository: CategoryRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> CategoryResponse:
+    check_not_modified(request, response, await repository.get_validators(category_id))
+
+    category = await repository.get_by_id(category_id)
     if not category:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Категория с id {category_id} не найдена")
-    return category
+    return CategoryResponse.from_orm(category)
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -51,11 +76,11 @@ async def create_category(
     if current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Доступно только администраторам")
 
-    existing = repository.get_by_title(args.title)
+    existing = await repository.get_by_title(args.title)
     if existing:
         raise HTTPException(status.HTTP_409_CONFLICT, f"Категория {args.title} уже существует")
 
-    return repository.create(args)
+    return await repository.create(args)
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
@@ -68,15 +93,15 @@ async def update_category(
     if current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Доступно только администраторам")
 
-    category = repository.get_by_id(category_id)
+    category = await repository.get_by_id(category_id)
     if not category:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Категория с id {category_id} не найдена")
 
-    other = repository.get_by_title(args.title)
+    other = await repository.get_by_title(args.title)
     if other and other.id != category_id:
         raise HTTPException(status.HTTP_409_CONFLICT, f"Категория с названием {args.title} уже существует")
 
-    repository.update(category, args)
+    await repository.update(category, args)
     return category
 
 
@@ -87,8 +112,8 @@ async def delete_category(
     if current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Доступно только администраторам")
 
-    category = repository.get_by_id(category_id)
+    category = await repository.get_by_id(category_id)
     if not category:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Категория с id {category_id} не найдена")
 
-    repository.delete(category)
+    await repository.delete(category)
@@ -34,3 +34,8 @@ class CategoryResponse(BaseModel):
 class CategoryPaginationResponse(BaseModel):
     pagination: PaginationResponse
     categories: list[CategoryResponse]
+
+
+class CategoryBatchResponse(BaseModel):
+    categories: list[CategoryResponse]
+    missingIds: list[PositiveInt]
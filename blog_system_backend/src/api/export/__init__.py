@@ -0,0 +1,3 @@
+__all__ = ["router"]
+
+from blog_system_backend.src.api.export.routes import router
@@ -0,0 +1,73 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+
+from blog_system_backend.src.api.posts.comments.repository import CommentRepositoryDepends
+from blog_system_backend.src.api.posts.comments.schemas import CommentResponse
+from blog_system_backend.src.api.posts.repository import PostRepositoryDepends
+from blog_system_backend.src.api.posts.schemas import PostResponse
+from blog_system_backend.src.api.users.deps import CurrentUserDepends
+from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.api.users.principal import Principal
+from blog_system_backend.src.api.users.repository import UserRepositoryDepends
+from blog_system_backend.src.api.users.schemas import UserResponse
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+NDJSON = "application/x-ndjson"
+
+
+@router.get("/posts", response_class=StreamingResponse)
+async def export_posts(
+    repository: PostRepositoryDepends, current_user: CurrentUserDepends, since: datetime | None = None
+) -> StreamingResponse:
+    check_admin(current_user)
+    return StreamingResponse(
+        ndjson(PostResponse, repository.export(since), exclude={"snippet", "isSaved"}), media_type=NDJSON
+    )
+
+
+@router.get("/users", response_class=StreamingResponse)
+async def export_users(
+    repository: UserRepositoryDepends, current_user: CurrentUserDepends, since: datetime | None = None
+) -> StreamingResponse:
+    check_admin(current_user)
+    return StreamingResponse(
+        ndjson(UserResponse, repository.export(since), exclude={"isSubscribed"}), media_type=NDJSON
+    )
+
+
+@router.get("/comments", response_class=StreamingResponse)
+async def export_comments(
+    repository: CommentRepositoryDepends, current_user: CurrentUserDepends, since: datetime | None = None
+) -> StreamingResponse:
+    check_admin(current_user)
+    return StreamingResponse(ndjson(CommentResponse, repository.export(since)), media_type=NDJSON)
+
+
+def check_admin(current_user: Principal) -> None:
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Доступно только администраторам")
+
+
+async def ndjson(
+    model: type[BaseModel], partitions: AsyncIterator[Sequence[Row[Any]]], exclude: set[str] | None = None
+) -> AsyncIterator[bytes]:
+    """Кодирует пачки строк в NDJSON: по одному объекту на строку, один кусок ответа на пачку."""
+
+    adapter: TypeAdapter[Any] = TypeAdapter(model)
+
+    async for rows in partitions:
+        yield b"".join(
+            orjson.dumps(
+                adapter.dump_python(model.model_validate(row, from_attributes=True), exclude=exclude),
+                option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE,
+            )
+            for row in rows
+        )
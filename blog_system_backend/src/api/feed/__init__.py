@@ -0,0 +1,3 @@
+__all__ = ["router"]
+
+from blog_system_backend.src.api.feed.routes import router
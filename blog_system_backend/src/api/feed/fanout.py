@@ -0,0 +1,44 @@
+from sqlalchemy import Delete, Insert, delete, insert, literal, select
+
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.users.subscribes.models import Subscribe
+
+
+def fan_out(*post_ids: int) -> Insert:
+    """Одна вставка записей о постах во все ленты подписчиков их авторов."""
+
+    followers = (
+        select(Subscribe.subscriberId, Post.id, Post.createdAt)
+        .join(Post, Post.authorId == Subscribe.authorId)
+        .filter(Post.id.in_(post_ids))
+    )
+
+    return insert(FeedEntry).from_select(["userId", "postId", "createdAt"], followers)
+
+
+def backfill(user_id: int, author_id: int, limit: int) -> Insert:
+    """Добавляет в ленту нового подписчика последние `limit` разложенных постов автора."""
+
+    posts = (
+        select(Post.id, Post.createdAt)
+        .filter(Post.authorId == author_id, Post.fannedOut.is_(True))
+        .order_by(Post.createdAt.desc(), Post.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    entries = select(literal(user_id), posts.c.id, posts.c.createdAt)
+
+    # Запись могла остаться от параллельной подписки; ON CONFLICT после INSERT ... SELECT SQLite не разбирает.
+    return insert(FeedEntry).prefix_with("OR IGNORE").from_select(["userId", "postId", "createdAt"], entries)
+
+
+def retract_post(post_id: int) -> Delete:
+    return delete(FeedEntry).where(FeedEntry.postId == post_id)
+
+
+def retract_author(user_id: int, author_id: int) -> Delete:
+    """Убирает из ленты пользователя посты автора, от которого он отписался."""
+
+    posts = select(Post.id).filter(Post.authorId == author_id)
+    return delete(FeedEntry).where(FeedEntry.userId == user_id, FeedEntry.postId.in_(posts))
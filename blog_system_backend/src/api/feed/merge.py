@@ -0,0 +1,74 @@
+import heapq
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import CompoundSelect, Row, Select, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.pagination import PaginationSearchParams, encode_cursor
+
+FeedKey = tuple[datetime, int]
+
+
+async def merge_feed(
+    session: AsyncSession, subscriber_id: int, search_params: PaginationSearchParams, want: int
+) -> list[FeedKey]:
+    """Первые `want` ключей ленты после курсора: k-way слияние постов авторов из подписок (fan-out-on-read).
+
+    Первый запрос берет по индексу (authorId, createdAt) новейший пост каждого автора и оставляет `want` лучших:
+    автор, чей новейший пост в них не вошел, на страницу не попадет. Второй дочитывает только этих авторов,
+    и каждого не больше, чем он может занять мест на странице. Куча сливает их посты и останавливается, как только
+    страница заполнена; списка IN (все авторы) и сортировки всех их постов нет.
+    """
+
+    heads = list(await session.execute(newest_per_author(subscriber_id, search_params, want)))
+    if not heads:
+        return []
+
+    tails: defaultdict[int, list[FeedKey]] = defaultdict(list)
+    if (query := following(heads, want)) is not None:
+        for author_id, created_at, post_id in await session.execute(query):
+            tails[author_id].append((created_at, post_id))
+
+    streams = [
+        [(created_at, post_id), *sorted(tails[author_id], reverse=True)] for author_id, created_at, post_id in heads
+    ]
+
+    return list(islice(heapq.merge(*streams, reverse=True), want))
+
+
+def newest_per_author(subscriber_id: int, search_params: PaginationSearchParams, want: int) -> Select[Any]:
+    # Коррелированный подзапрос с LIMIT 1 — один поиск по индексу (authorId, createdAt) на автора.
+    keyset = PostRepository.keyset
+    newest = keyset.paginate(select(Post.id).filter(Post.authorId == Subscribe.authorId), search_params).limit(1)
+    latest = select(newest.scalar_subquery().label("postId")).filter(Subscribe.subscriberId == subscriber_id).subquery()
+
+    return (
+        select(Post.authorId, Post.createdAt, Post.id)
+        .join(latest, latest.c.postId == Post.id)
+        .order_by(*(column.desc() for column in keyset.columns))
+        .limit(want)
+    )
+
+
+def following(heads: Sequence[Row[Any]], want: int) -> CompoundSelect[Any] | None:
+    """Посты авторов после их новейшего: автору на i-м месте среди голов достается не больше want - i мест."""
+
+    branches = []
+    for i, (author_id, created_at, post_id) in enumerate(heads):
+        if (limit := want - i - 1) <= 0:
+            break
+
+        search_params = PaginationSearchParams.model_construct(
+            q=None, offset=0, limit=limit, cursor=encode_cursor((created_at, post_id)), include_total=False
+        )
+        query = select(Post.authorId, Post.createdAt, Post.id).filter(Post.authorId == author_id)
+        branches.append(select(PostRepository.keyset.paginate(query, search_params).subquery()))
+
+    return union_all(*branches) if branches else None
@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from blog_system_backend.src.db.models import Base
+
+
+class FeedEntry(Base):
+    """Пост в материализованной ленте подписчика (fan-out-on-write).
+
+    `createdAt` копирует posts.createdAt: страница ленты читается по индексу (userId, createdAt) без join к posts.
+    """
+
+    __tablename__ = "feed_entries"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    userId: Mapped[int] = mapped_column(ForeignKey("users.id", onupdate="CASCADE", name="fk_feed_entries_user"))
+    postId: Mapped[int] = mapped_column(
+        ForeignKey("posts.id", onupdate="CASCADE", name="fk_feed_entries_post"), index=True
+    )
+
+
+# Лента пользователя в порядке (createdAt, postId); postId в паре с userId уникален и однозначно задает порядок.
+Index("ix_feed_entries_userId_createdAt", FeedEntry.userId, FeedEntry.createdAt, FeedEntry.postId)
+Index("uq_feed_entries_userId_postId", FeedEntry.userId, FeedEntry.postId, unique=True)
@@ -0,0 +1,97 @@
+from typing import Annotated, Any
+
+from fastapi import Depends
+from sqlalchemy import Select, select, union
+
+from blog_system_backend.src.api.feed.merge import FeedKey, merge_feed
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.db.deps import SessionDepends
+from blog_system_backend.src.db.loading import LoadingProfile
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams, encode_cursor
+from blog_system_backend.src.settings import settings
+
+
+class FeedRepository:
+    # Тот же порядок, что у PostRepository.keyset: курсоры обеих веток и итоговой страницы совпадают.
+    keyset = Keyset(FeedEntry.createdAt, FeedEntry.postId, descending=True)
+
+    def __init__(self, session: SessionDepends) -> None:
+        self.session = session
+
+    async def get_page(
+        self, user_id: int, search_params: PaginationSearchParams, profile: LoadingProfile | None = None
+    ) -> Page[Post]:
+        """Страница ленты: записи из feed_entries вместе с неразложенными постами подписок (fan-out-on-read).
+
+        Каждая ветка отдает не больше limit + 1 ключей по своему индексу, посты загружаются только для них.
+        Холодная лента и лента пользователя с подписками не больше `FEED_MERGE_MAX_SUBSCRIPTIONS` собираются
+        при чтении слиянием постов авторов (src/api/feed/merge.py) и от feed_entries не зависят.
+        """
+
+        profile = profile or PostRepository.cards
+        if await self._merges(user_id):
+            merged = await merge_feed(self.session, user_id, search_params, search_params.limit + 1)
+            return await self._load(merged, search_params, profile)
+
+        keys = union(
+            select(self._entries(user_id, search_params).subquery()),
+            select(self._pulled(user_id, search_params).subquery()),
+        ).subquery()
+        query = select(Post).join(keys, keys.c.id == Post.id).options(*profile.options(*PostRepository.keyset.columns))
+
+        return await PostRepository.keyset.fetch(self.session, query, search_params)
+
+    async def _merges(self, user_id: int) -> bool:
+        """Собирать ли ленту слиянием при чтении.
+
+        Теплая лента из feed_entries быстрее слияния при любом числе подписок (benchmarks/feed_merge.py), поэтому
+        по умолчанию слияние читает только холодную ленту: подписки есть, а записей нет (таблицу перестраивают
+        или база поднята без нее). Такую ленту иначе пришлось бы собирать через IN (все авторы), а на 10000 подписок
+        слияние дешевле.
+        """
+
+        warm = select(FeedEntry.id).filter(FeedEntry.userId == User.id).exists()
+        row = (await self.session.execute(select(User.subscriptionsCount, warm).filter(User.id == user_id))).first()
+        if row is None:
+            return True
+
+        subscriptions, has_entries = row
+        return subscriptions <= settings.feed_merge_max_subscriptions or not has_entries
+
+    async def _load(
+        self, keys: list[FeedKey], search_params: PaginationSearchParams, profile: LoadingProfile
+    ) -> Page[Post]:
+        has_next_page = len(keys) > search_params.limit
+        keys = keys[: search_params.limit]
+
+        query = (
+            select(Post)
+            .filter(Post.id.in_([post_id for _, post_id in keys]))
+            .options(*profile.options(*PostRepository.keyset.columns))
+        )
+        posts = {post.id: post for post in await self.session.scalars(query)}
+
+        return Page(
+            # Пост могли удалить между слиянием и загрузкой.
+            items=[posts[post_id] for _, post_id in keys if post_id in posts],
+            total_items=None,
+            has_next_page=has_next_page,
+            next_cursor=encode_cursor(keys[-1]) if has_next_page else None,
+        )
+
+    def _entries(self, user_id: int, search_params: PaginationSearchParams) -> Select[Any]:
+        query = select(FeedEntry.createdAt, FeedEntry.postId.label("id")).filter(FeedEntry.userId == user_id)
+        return self.keyset.paginate(query, search_params).limit(search_params.limit + 1)
+
+    @staticmethod
+    def _pulled(user_id: int, search_params: PaginationSearchParams) -> Select[Any]:
+        authors = select(Subscribe.authorId).filter(Subscribe.subscriberId == user_id)
+        query = select(Post.createdAt, Post.id).filter(Post.fannedOut.is_(False), Post.authorId.in_(authors))
+        return PostRepository.keyset.paginate(query, search_params).limit(search_params.limit + 1)
+
+
+FeedRepositoryDepends = Annotated[FeedRepository, Depends()]
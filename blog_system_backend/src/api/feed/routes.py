@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+
+from blog_system_backend.src.api.feed.repository import FeedRepositoryDepends
+from blog_system_backend.src.api.feed.schemas import FeedSearchParamsDepends
+from blog_system_backend.src.api.posts.repository import PostRepositoryDepends
+from blog_system_backend.src.api.posts.saved_posts.repository import SavedPostRepositoryDepends
+from blog_system_backend.src.api.posts.schemas import PostResponse, PostsPaginationResponse, PostSummaryResponse
+from blog_system_backend.src.api.users.deps import CurrentUserDepends
+from blog_system_backend.src.cache import CacheScope, cached
+from blog_system_backend.src.fieldsets import FieldsetParamsDepends
+from blog_system_backend.src.pagination import PaginationResponse
+from blog_system_backend.src.rendering import rendered
+
+router = APIRouter(prefix="/feed", tags=["feed"])
+
+
+@router.get("", response_model=PostsPaginationResponse)
+@rendered
+@cached(CacheScope.posts, CacheScope.categories, CacheScope.comments, CacheScope.saved_posts, CacheScope.subscribes)
+async def get_feed(
+    feed_params: FeedSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
+    feed_repository: FeedRepositoryDepends,
+    post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> PostsPaginationResponse:
+    fieldset = fieldset_params.select(PostResponse, PostSummaryResponse)
+    search_params = feed_params.to_search_params()
+
+    page = await feed_repository.get_page(current_user.id, search_params, post_repository.cards.narrow(fieldset))
+
+    saved: set[int] = set()
+    if "isSaved" in fieldset:
+        saved = set(await saved_posts_repository.get_saved_post_ids(current_user.id, [post.id for post in page.items]))
+
+    return PostsPaginationResponse(
+        pagination=PaginationResponse.from_page(search_params, page),
+        posts=[fieldset.model.from_orm(post, fields=fieldset.fields, is_saved=post.id in saved) for post in page.items],
+    )
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import Depends
+from pydantic import BaseModel
+
+from blog_system_backend.src.pagination import (
+    PaginationSearchParams,
+    PaginationSearchParamsCursor,
+    PaginationSearchParamsLimit,
+)
+
+
+class FeedSearchParams(BaseModel):
+    """Лента листается только курсором: поиска, смещения и общего количества у нее нет."""
+
+    limit: PaginationSearchParamsLimit
+    cursor: PaginationSearchParamsCursor
+
+    def to_search_params(self) -> PaginationSearchParams:
+        return PaginationSearchParams.model_construct(
+            q=None, offset=0, limit=self.limit, cursor=self.cursor, include_total=False
+        )
+
+
+FeedSearchParamsDepends = Annotated[FeedSearchParams, Depends(FeedSearchParams)]
@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from blog_system_backend.src.db.counters import Counter
 from blog_system_backend.src.db.models import Base
 
 if TYPE_CHECKING:
@@ -18,9 +19,18 @@ class Comment(Base):
         ForeignKey("users.id", onupdate="CASCADE", name="fk_comments_author"), index=True, nullable=False
     )
     postId: Mapped[int] = mapped_column(
-        ForeignKey("posts.id", onupdate="CASCADE", name="fk_comments_post"), index=True, nullable=False
+        ForeignKey("posts.id", onupdate="CASCADE", name="fk_comments_post"), nullable=False
     )
     content: Mapped[str] = mapped_column(nullable=False)
 
     post: Mapped["Post"] = relationship("Post", back_populates="comments")
     author: Mapped["User"] = relationship("User", back_populates="comments")
+
+
+# Комментарии поста в порядке (createdAt, id).
+Index("ix_comments_postId_createdAt", Comment.postId, Comment.createdAt)
+# Инкрементальная выгрузка идет в порядке (updatedAt, id).
+Index("ix_comments_updatedAt", Comment.updatedAt)
+
+POST_COMMENTS = Counter("posts", "commentsCount", "comments", "postId")
+POST_COMMENTS.attach(Comment.__table__)
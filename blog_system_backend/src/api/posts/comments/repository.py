@@ -1,45 +1,83 @@
-from typing import Annotated
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import Row, select
 
 from blog_system_backend.src.api.posts.comments.models import Comment
 from blog_system_backend.src.api.posts.comments.schemas import CommentCreateRequest, CommentUpdateRequest
+from blog_system_backend.src.batch import BatchItemResult, BatchItemStatus, insert_rows
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.db.export import stream_rows
+from blog_system_backend.src.db.loading import LoadingProfile
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
 
 
 class CommentRepository:
+    keyset = Keyset(Comment.createdAt, Comment.id, descending=True)
+    cards = LoadingProfile(Comment)
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get_by_id(self, id: int) -> Comment | None:
-        return self.session.get(Comment, id)
+    async def get_by_id(self, id: int) -> Comment | None:
+        return await self.session.get(Comment, id)
 
-    def get_by_post(self, post_id: int, search_params: PaginationSearchParams | None = None) -> list[Comment]:
+    async def get_by_post(
+        self, post_id: int, search_params: PaginationSearchParams | None = None, profile: LoadingProfile | None = None
+    ) -> Page[Comment]:
         search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Comment).filter(Comment.postId == post_id)
-        query = query.order_by(Comment.createdAt.desc()).offset(search_params.offset).limit(search_params.limit)
-        return query.all()
+        query = (
+            select(Comment)
+            .options(*(profile or self.cards).options(*self.keyset.columns))
+            .filter(Comment.postId == post_id)
+        )
+        return await self.keyset.fetch(self.session, query, search_params)
+
+    async def get_by_post_validators(self, post_id: int, search_params: PaginationSearchParams) -> Validators:
+        query = select(Comment).filter(Comment.postId == post_id)
+        return await self.keyset.validators(self.session, query, search_params, Comment.updatedAt)
+
+    def export(self, since: datetime | None = None) -> AsyncIterator[Sequence[Row[Any]]]:
+        query = select(
+            Comment.id, Comment.authorId, Comment.postId, Comment.content, Comment.createdAt, Comment.updatedAt
+        )
 
-    def count(self, post_id: int) -> int:
-        query = self.session.query(Comment).filter(Comment.postId == post_id)
-        return query.count()
+        return stream_rows(self.session, query, Comment.updatedAt, Comment.id, since)
 
-    def create(self, author_id: int, post_id: int, args: CommentCreateRequest) -> Comment:
+    async def create(self, author_id: int, post_id: int, args: CommentCreateRequest) -> Comment:
         comment = Comment(authorId=author_id, postId=post_id, content=args.content)
         self.session.add(comment)
-        self.session.commit()
-        self.session.refresh(comment)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.comments)
+        await self.session.refresh(comment)
         return comment
 
-    def update(self, comment: Comment, args: CommentUpdateRequest) -> None:
+    async def create_many(
+        self, author_id: int, post_id: int, items: Sequence[CommentCreateRequest]
+    ) -> list[BatchItemResult]:
+        """Создает комментарии к посту одной вставкой и одной транзакцией."""
+
+        rows = [dict(authorId=author_id, postId=post_id, content=item.content) for item in items]
+        ids = await insert_rows(self.session, Comment.id, rows)
+        results = [BatchItemResult(index=index, status=BatchItemStatus.created, id=id) for index, id in enumerate(ids)]
+
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.comments)
+        return results
+
+    async def update(self, comment: Comment, args: CommentUpdateRequest) -> None:
         comment.update(args.dict())
-        self.session.commit()
-        self.session.refresh(comment)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.comments)
+        await self.session.refresh(comment)
 
-    def delete(self, comment: Comment) -> None:
-        self.session.delete(comment)
-        self.session.commit()
+    async def delete(self, comment: Comment) -> None:
+        await self.session.delete(comment)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.comments)
 
 
 CommentRepositoryDepends = Annotated[CommentRepository, Depends()]
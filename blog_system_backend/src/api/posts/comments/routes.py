@@ -1,28 +1,48 @@
-from functools import lru_cache
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from blog_system_backend.src.api.posts.comments.models import Comment
 from blog_system_backend.src.api.posts.comments.repository import CommentRepositoryDepends
 from blog_system_backend.src.api.posts.comments.schemas import (
+    CommentBatchCreateRequest,
     CommentCreateRequest,
     CommentResponse,
+    CommentSearchParamsDepends,
+    CommentSummaryResponse,
     CommentUpdateRequest,
 )
 from blog_system_backend.src.api.posts.repository import PostRepositoryDepends
 from blog_system_backend.src.api.users.deps import CurrentUserDepends
 from blog_system_backend.src.api.users.enums import UserRole
-from blog_system_backend.src.settings import settings
+from blog_system_backend.src.batch import BatchResponse
+from blog_system_backend.src.cache import CacheScope, cached, check_not_modified
+from blog_system_backend.src.fieldsets import FieldsetParamsDepends
+from blog_system_backend.src.rendering import rendered
 
 router = APIRouter(prefix="/comments")
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
-@router.get("", response_model=list[CommentResponse])
+@router.get("", response_model=list[CommentResponse | CommentSummaryResponse])
+@rendered
+@cached(CacheScope.comments)
 async def get_comments(
-    post_id: int, repository: CommentRepositoryDepends, current_user: CurrentUserDepends
-) -> list[CommentResponse]:
-    return [CommentResponse.from_orm(c) for c in repository.get_by_post(post_id)]
+    post_id: int,
+    request: Request,
+    response: Response,
+    comment_params: CommentSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
+    repository: CommentRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> list[CommentResponse | CommentSummaryResponse]:
+    search_params = comment_params.to_search_params()
+    fieldset = fieldset_params.select(CommentResponse, CommentSummaryResponse)
+    check_not_modified(request, response, await repository.get_by_post_validators(post_id, search_params))
+
+    page = await repository.get_by_post(post_id, search_params, repository.cards.narrow(fieldset))
+
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    return [fieldset.model.from_orm(c, fieldset.fields) for c in page.items]
 
 
 @router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -33,13 +53,27 @@ async def create_comment(
     repository: CommentRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> Comment:
-    post = post_repo.get_post_by_id(post_id)
+    post = await post_repo.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пост с id {post_id} не найден")
-    comment = repository.create(current_user.id, post_id, args)
+    comment = await repository.create(current_user.id, post_id, args)
     return comment
 
 
+@router.post(":batch", response_model=BatchResponse)
+async def create_comments(
+    post_id: int,
+    args: CommentBatchCreateRequest,
+    post_repo: PostRepositoryDepends,
+    repository: CommentRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> BatchResponse:
+    if not await post_repo.get_post_by_id(post_id):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пост с id {post_id} не найден")
+
+    return BatchResponse(results=await repository.create_many(current_user.id, post_id, args.items))
+
+
 @router.put("/{comment_id}", response_model=CommentResponse)
 async def update_comment(
     post_id: int,
@@ -48,14 +82,14 @@ async def update_comment(
     repository: CommentRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> Comment:
-    comment = repository.get_by_id(comment_id)
+    comment = await repository.get_by_id(comment_id)
     if not comment or comment.postId != post_id:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Комментарий не найден")
 
     if comment.authorId != current_user.id:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Недостаточно прав на редактирование комментария")
 
-    repository.update(comment, args)
+    await repository.update(comment, args)
     return comment
 
 
@@ -63,11 +97,11 @@ async def update_comment(
 async def delete_comment(
     post_id: int, comment_id: int, repository: CommentRepositoryDepends, current_user: CurrentUserDepends
 ) -> None:
-    comment = repository.get_by_id(comment_id)
+    comment = await repository.get_by_id(comment_id)
     if not comment or comment.postId != post_id:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Комментарий не найден")
 
     if comment.authorId != current_user.id and current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Недостаточно прав на удаление комментария")
 
-    repository.delete(comment)
+    await repository.delete(comment)
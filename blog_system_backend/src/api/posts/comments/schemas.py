@@ -1,20 +1,49 @@
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Self
 
+from fastapi import Depends
 from pydantic import BaseModel, PositiveInt, constr
 
 from blog_system_backend.src.api.posts.comments.models import Comment
+from blog_system_backend.src.batch import BatchItems
+from blog_system_backend.src.fieldsets import SparseModel
+from blog_system_backend.src.pagination import (
+    PaginationSearchParams,
+    PaginationSearchParamsCursor,
+    PaginationSearchParamsLimit,
+    PaginationSearchParamsOffset,
+)
+
+
+class CommentSearchParams(BaseModel):
+    """Комментарии отдаются списком: поиска и общего количества у них нет, только смещение или курсор."""
+
+    offset: PaginationSearchParamsOffset
+    limit: PaginationSearchParamsLimit
+    cursor: PaginationSearchParamsCursor
+
+    def to_search_params(self) -> PaginationSearchParams:
+        return PaginationSearchParams.model_construct(
+            q=None, offset=self.offset, limit=self.limit, cursor=self.cursor, include_total=False
+        )
+
+
+CommentSearchParamsDepends = Annotated[CommentSearchParams, Depends(CommentSearchParams)]
 
 
 class CommentCreateRequest(BaseModel):
     content: Annotated[str, constr(min_length=1, max_length=10000)]
 
 
+class CommentBatchCreateRequest(BaseModel):
+    items: BatchItems[CommentCreateRequest]
+
+
 class CommentUpdateRequest(BaseModel):
     content: Annotated[str, constr(min_length=1, max_length=10000)]
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(SparseModel):
     id: PositiveInt
     authorId: PositiveInt
     postId: PositiveInt
@@ -23,12 +52,18 @@ class CommentResponse(BaseModel):
     updatedAt: datetime
 
     @classmethod
-    def from_orm(cls, c: Comment) -> "CommentResponse":
-        return cls(
-            id=c.id,
-            authorId=c.authorId,
-            postId=c.postId,
-            content=c.content,
-            createdAt=c.createdAt,
-            updatedAt=c.updatedAt,
-        )
+    def from_orm(cls, c: Comment, fields: frozenset[str] | None = None) -> Self:
+        return cls.from_attributes(c, fields)
+
+
+class CommentSummaryResponse(SparseModel):
+    """Комментарий без текста: для счетчиков и списков авторов."""
+
+    id: PositiveInt
+    authorId: PositiveInt
+    postId: PositiveInt
+    createdAt: datetime
+
+    @classmethod
+    def from_orm(cls, c: Comment, fields: frozenset[str] | None = None) -> Self:
+        return cls.from_attributes(c, fields)
@@ -0,0 +1,17 @@
+from blog_system_backend.src.settings import settings
+
+
+def make_excerpt(content: str, length: int | None = None) -> str:
+    """Начало текста поста для карточек: пробелы схлопнуты, обрезка по границе слова с многоточием."""
+
+    length = length or settings.post_excerpt_length
+    text = " ".join(content.split())
+
+    if len(text) <= length:
+        return text
+
+    cut = text[: length - 1]
+    if text[length - 1] != " " and " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+
+    return cut.rstrip(" .,;:!?-") + "…"
@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from blog_system_backend.src.api.posts.search import create_posts_fts, drop_posts_fts
+from blog_system_backend.src.db.counters import Counter
 from blog_system_backend.src.db.models import Base
 
 if TYPE_CHECKING:
@@ -14,9 +16,15 @@ if TYPE_CHECKING:
 class Post(Base):
     __tablename__ = "posts"
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    authorId: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    authorId: Mapped[int] = mapped_column(ForeignKey("users.id"))
     title: Mapped[str] = mapped_column()
     content: Mapped[str] = mapped_column()
+    excerpt: Mapped[str] = mapped_column(default="", server_default="")
+    # Счетчики поддерживают триггеры (см. src/db/counters.py).
+    commentsCount: Mapped[int] = mapped_column(default=0, server_default="0")
+    savesCount: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Разложен ли пост по лентам подписчиков (api/feed/fanout.py); посты популярных авторов подмешиваются при чтении.
+    fannedOut: Mapped[bool] = mapped_column(default=True, server_default="1")
 
     author: Mapped["User"] = relationship("User", back_populates="posts")
     categories: Mapped[list["Category"]] = relationship(
@@ -25,3 +33,19 @@ class Post(Base):
         back_populates="posts",
     )
     comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="post")
+
+
+# Лента в порядке (createdAt, id): id — это rowid, он уже есть в каждой записи индекса.
+Index("ix_posts_createdAt", Post.createdAt)
+# Посты автора в порядке ленты; одиночный индекс по authorId не нужен — это префикс составного.
+Index("ix_posts_authorId_createdAt", Post.authorId, Post.createdAt)
+# Инкрементальная выгрузка идет в порядке (updatedAt, id).
+Index("ix_posts_updatedAt", Post.updatedAt)
+# Неразложенные посты для ленты: частичный индекс не растет вместе с остальными постами подписок.
+Index("ix_posts_pulled_authorId_createdAt", Post.authorId, Post.createdAt, sqlite_where=Post.fannedOut.is_(False))
+
+event.listen(Post.__table__, "after_create", create_posts_fts)
+event.listen(Post.__table__, "before_drop", drop_posts_fts)
+
+USER_POSTS = Counter("users", "postsCount", "posts", "authorId")
+USER_POSTS.attach(Post.__table__)
@@ -1,75 +1,269 @@
-from typing import Annotated
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+from typing import Annotated, Any
 
 from fastapi import Depends
-from sqlalchemy import or_
+from sqlalchemy import JSON, ColumnElement, Row, ScalarSelect, Select, func, insert, or_, select, type_coerce
+from sqlalchemy.orm import selectinload
 
-from blog_system_backend.src.api.categories.models import Category
+from blog_system_backend.src.api.categories.models import Category, PostToCategory
+from blog_system_backend.src.api.feed.fanout import fan_out, retract_post
+from blog_system_backend.src.api.posts.excerpt import make_excerpt
 from blog_system_backend.src.api.posts.models import Post
 from blog_system_backend.src.api.posts.schemas import PostCreateRequest, PostUpdateRequest
+from blog_system_backend.src.api.posts.search import POSTS_FTS, fts_match, fts_query, fts_snippet, has_posts_fts
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.batch import BatchItemResult, BatchItemStatus, insert_rows
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.db.export import stream_rows
+from blog_system_backend.src.db.loading import LoadingProfile
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
+from blog_system_backend.src.settings import settings
 
 
 class PostRepository:
+    keyset = Keyset(Post.createdAt, Post.id, descending=True)
+    cards = LoadingProfile(Post, ("categories",))
+    # Счетчики меняют триггеры, не трогая updatedAt, поэтому валидаторы учитывают их отдельно.
+    counters = (Post.commentsCount, Post.savesCount)
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get_post_by_id(self, id: int) -> Post | None:
-        return self.session.get(Post, id)
+    async def get_post_by_id(self, id: int) -> Post | None:
+        return await self.session.get(Post, id, options=[selectinload(Post.categories)])
+
+    async def get_posts_by_ids(self, ids: Collection[int], profile: LoadingProfile | None = None) -> dict[int, Post]:
+        """Посты по списку id одним IN-запросом (категории — вторым, на все посты сразу)."""
 
-    def get_posts(self, search_params: PaginationSearchParams | None = None) -> list[Post]:
-        search_params = search_params or PaginationSearchParams.model_construct()
+        query = select(Post).options(*(profile or self.cards).options()).filter(Post.id.in_(ids))
+        return {post.id: post for post in await self.session.scalars(query)}
 
-        query = self.session.query(Post)
+    async def get_post_validators(self, id: int, viewer_flags: Sequence[ColumnElement[bool]] = ()) -> Validators | None:
         query = (
-            query.filter(or_(Post.title.icontains(search_params.q), Post.content.icontains(search_params.q)))
-            if search_params.q
-            else query
+            select(
+                Post.updatedAt,
+                *self.counters,
+                *viewer_flags,
+                func.group_concat(Category.id),
+                func.max(Category.updatedAt),
+            )
+            .outerjoin(PostToCategory, PostToCategory.postId == Post.id)
+            .outerjoin(Category, Category.id == PostToCategory.categoryId)
+            .filter(Post.id == id)
+            .group_by(Post.id)
         )
-        query = query.order_by(Post.createdAt.desc()).offset(search_params.offset).limit(search_params.limit)
 
-        return query.all()
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            return None
 
-    def count_posts(self, search_params: PaginationSearchParams | None = None) -> int:
-        search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Post)
-        query = (
-            query.filter(or_(Post.title.icontains(search_params.q), Post.content.icontains(search_params.q)))
-            if search_params.q
-            else query
+        updated_at, *parts, category_ids, categories_updated_at = row
+        last_modified = max(updated_at, categories_updated_at or updated_at)
+
+        return Validators.from_parts(
+            id, updated_at, *parts, category_ids, categories_updated_at, last_modified=last_modified
         )
 
-        return query.count()
+    async def get_posts_page(
+        self, search_params: PaginationSearchParams, profile: LoadingProfile | None = None, author_id: int | None = None
+    ) -> Page[Post]:
+        """Страница постов, с `author_id` — только постов автора (индекс по (authorId, createdAt))."""
+
+        query, ranked = await self._page_query(search_params, author_id)
+        query = query.options(*(profile or self.cards).options(*self.keyset.columns))
+
+        page = await self.keyset.fetch(self.session, query, search_params)
+        if ranked:
+            page.next_cursor = None
+
+        return page
+
+    async def get_posts_validators(
+        self,
+        search_params: PaginationSearchParams,
+        author_id: int | None = None,
+        viewer_flags: Sequence[ColumnElement[bool]] = (),
+    ) -> Validators:
+        query, _ = await self._page_query(search_params, author_id)
+
+        return await self.keyset.validators(
+            self.session,
+            query,
+            search_params,
+            Post.updatedAt,
+            *self.counters,
+            *viewer_flags,
+            *self.categories_fingerprint(),
+        )
+
+    def export(self, since: datetime | None = None) -> AsyncIterator[Sequence[Row[Any]]]:
+        categories = (
+            select(func.json_group_array(Category.title))
+            .join(PostToCategory, PostToCategory.categoryId == Category.id)
+            .filter(PostToCategory.postId == Post.id)
+            .scalar_subquery()
+        )
+        query = select(
+            Post.id,
+            Post.authorId,
+            Post.title,
+            Post.content,
+            type_coerce(categories, JSON).label("categories"),
+            *self.counters,
+            Post.createdAt,
+            Post.updatedAt,
+        )
+
+        return stream_rows(self.session, query, Post.updatedAt, Post.id, since)
+
+    async def get_snippets(self, ids: list[int], q: str) -> dict[int, str]:
+        match = fts_query(q)
+        if not ids or match is None or not has_posts_fts(self.session):
+            return {}
+
+        query = select(POSTS_FTS.c.rowid, fts_snippet()).filter(fts_match(match), POSTS_FTS.c.rowid.in_(ids))
+        return {id: snippet for id, snippet in await self.session.execute(query)}
+
+    async def create_post(self, args: PostCreateRequest, author_id: int) -> Post:
+        """Создает пост и в той же транзакции раскладывает его по лентам подписчиков автора.
+
+        У автора с подписчиками больше `FEED_FANOUT_MAX_FOLLOWERS` пост не раскладывается: лента подмешивает его
+        при чтении.
+        """
 
-    def create_post(self, args: PostCreateRequest, author_id: int) -> Post:
         post = Post(
             authorId=author_id,
             title=args.title,
             content=args.content,
+            excerpt=make_excerpt(args.content),
+            fannedOut=await self._fans_out(author_id),
         )
 
-        if args.categoryIds:
-            categories = self.session.query(Category).filter(Category.id.in_(args.categoryIds)).all()
-            post.categories = categories
+        post.categories = await self._get_categories(args.categoryIds)
 
         self.session.add(post)
-        self.session.commit()
-        self.session.refresh(post)
+        if post.fannedOut:
+            await self.session.flush()
+            await self.session.execute(fan_out(post.id))
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.posts)
+        await self._refresh(post)
 
         return post
 
-    def update_post(self, post: Post, args: PostUpdateRequest) -> None:
+    async def create_posts(self, items: Sequence[PostCreateRequest], author_id: int) -> list[BatchItemResult]:
+        """Создает посты одной транзакцией: посты, их категории и записи лент вставляются пачками.
+
+        Пост со ссылкой на несуществующую категорию не создается и получает `not_found`, остальные создаются.
+        """
+
+        category_ids = {id for item in items for id in item.categoryIds}
+        known = {category.id for category in await self._get_categories(list(category_ids))}
+
+        results: list[BatchItemResult] = []
+        valid: list[tuple[int, PostCreateRequest]] = []
+        for index, item in enumerate(items):
+            if missing := sorted(set(item.categoryIds) - known):
+                detail = f"Категории с id {', '.join(map(str, missing))} не найдены"
+                results.append(BatchItemResult(index=index, status=BatchItemStatus.not_found, detail=detail))
+            else:
+                valid.append((index, item))
+
+        if valid:
+            fanned_out = await self._fans_out(author_id)
+            rows = [
+                dict(
+                    authorId=author_id,
+                    title=item.title,
+                    content=item.content,
+                    excerpt=make_excerpt(item.content),
+                    fannedOut=fanned_out,
+                )
+                for _, item in valid
+            ]
+            ids = await insert_rows(self.session, Post.id, rows)
+
+            links = [
+                dict(postId=id, categoryId=category_id)
+                for id, (_, item) in zip(ids, valid, strict=True)
+                for category_id in set(item.categoryIds)
+            ]
+            if links:
+                await self.session.execute(insert(PostToCategory), links)
+            if fanned_out:
+                await self.session.execute(fan_out(*ids))
+
+            await self.session.commit()
+            await RESPONSE_CACHE.bump(CacheScope.posts)
+
+            results += [
+                BatchItemResult(index=index, status=BatchItemStatus.created, id=id)
+                for id, (index, _) in zip(ids, valid, strict=True)
+            ]
+
+        return sorted(results, key=lambda result: result.index)
+
+    async def update_post(self, post: Post, args: PostUpdateRequest) -> None:
         post.update({k: v for k, v in args.dict().items() if k != "categoryIds"})
+        post.excerpt = make_excerpt(args.content)
         if args.categoryIds is not None:
-            categories = self.session.query(Category).filter(Category.id.in_(args.categoryIds)).all()
-            post.categories = categories
+            post.categories = await self._get_categories(args.categoryIds)
+
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.posts)
+        await self._refresh(post)
+
+    async def delete_post(self, post: Post) -> None:
+        await self.session.execute(retract_post(post.id))
+        await self.session.delete(post)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.posts, CacheScope.comments, CacheScope.saved_posts)
+
+    async def _page_query(
+        self, search_params: PaginationSearchParams, author_id: int | None = None
+    ) -> tuple[Select[Any], bool]:
+        query = select(Post) if author_id is None else select(Post).filter(Post.authorId == author_id)
+
+        # Курсор строится по (createdAt, id), поэтому ранжирование по релевантности есть только у постраничного режима.
+        return await self._filter(query, search_params, rank=search_params.cursor is None)
+
+    @staticmethod
+    def categories_fingerprint() -> tuple[ScalarSelect[Any], ScalarSelect[Any]]:
+        # Категории поста и их названия входят в ответ, но не меняют posts.updatedAt.
+        category_ids = select(func.group_concat(PostToCategory.categoryId)).filter(PostToCategory.postId == Post.id)
+        categories_updated_at = select(func.max(Category.updatedAt))
+
+        return category_ids.scalar_subquery(), categories_updated_at.scalar_subquery()
+
+    async def _fans_out(self, author_id: int) -> bool:
+        followers = await self.session.scalar(select(User.followersCount).filter(User.id == author_id))
+        return (followers or 0) <= settings.feed_fanout_max_followers
+
+    async def _refresh(self, post: Post) -> None:
+        await self.session.get(Post, post.id, options=[selectinload(Post.categories)], populate_existing=True)
+
+    async def _get_categories(self, ids: list[int]) -> list[Category]:
+        if not ids:
+            return []
+
+        return list(await self.session.scalars(select(Category).filter(Category.id.in_(ids))))
+
+    async def _filter(
+        self, query: Select[Any], search_params: PaginationSearchParams, *, rank: bool = False
+    ) -> tuple[Select[Any], bool]:
+        if not search_params.q:
+            return query, False
 
-        self.session.commit()
-        self.session.refresh(post)
+        match = fts_query(search_params.q)
+        if match is None or not has_posts_fts(self.session):
+            return query.filter(
+                or_(Post.title.icontains(search_params.q), Post.content.icontains(search_params.q))
+            ), False
 
-    def delete_post(self, post: Post) -> None:
-        self.session.delete(post)
-        self.session.commit()
+        query = query.join(POSTS_FTS, POSTS_FTS.c.rowid == Post.id).filter(fts_match(match))
+        return (query.order_by(POSTS_FTS.c.rank), True) if rank else (query, False)
 
 
 PostRepositoryDepends = Annotated[PostRepository, Depends()]
@@ -1,49 +1,115 @@
-from functools import lru_cache
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from blog_system_backend.src.api.posts.repository import PostRepositoryDepends
+from blog_system_backend.src.api.posts.saved_posts.repository import SavedPostRepositoryDepends
 from blog_system_backend.src.api.posts.schemas import (
+    PostBatchCreateRequest,
     PostCreateRequest,
     PostResponse,
+    PostsBatchResponse,
     PostsPaginationResponse,
+    PostSummaryResponse,
     PostUpdateRequest,
 )
 from blog_system_backend.src.api.users.deps import CurrentUserDepends
 from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.batch import BatchIds, BatchResponse, pick
+from blog_system_backend.src.cache import CacheScope, cached, check_not_modified
+from blog_system_backend.src.fieldsets import FieldsetParamsDepends
 from blog_system_backend.src.pagination import PaginationResponse, PaginationSearchParamsDepends
-from blog_system_backend.src.settings import settings
+from blog_system_backend.src.rendering import rendered
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("", response_model=PostsPaginationResponse)
+@rendered
+@cached(CacheScope.posts, CacheScope.categories, CacheScope.comments, CacheScope.saved_posts)
 async def get_posts(
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
     post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
     current_user: CurrentUserDepends,
+    highlight: bool = False,
 ) -> PostsPaginationResponse:
-    posts = post_repository.get_posts(search_params)
-    count = post_repository.count_posts(search_params)
+    fieldset = fieldset_params.select(PostResponse, PostSummaryResponse)
+    check_not_modified(
+        request,
+        response,
+        await post_repository.get_posts_validators(
+            search_params, viewer_flags=[saved_posts_repository.is_saved_by(current_user.id)]
+        ),
+    )
+
+    page = await post_repository.get_posts_page(search_params, post_repository.cards.narrow(fieldset))
+
+    snippets = {}
+    if highlight and search_params.q and "snippet" in fieldset:
+        snippets = await post_repository.get_snippets([post.id for post in page.items], search_params.q)
+
+    saved: set[int] = set()
+    if "isSaved" in fieldset:
+        saved = set(await saved_posts_repository.get_saved_post_ids(current_user.id, [post.id for post in page.items]))
 
     return PostsPaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=count),
-        posts=[PostResponse.from_orm(post) for post in posts],
+        pagination=PaginationResponse.from_page(search_params, page),
+        posts=[
+            fieldset.model.from_orm(post, snippets.get(post.id), fieldset.fields, post.id in saved)
+            for post in page.items
+        ],
+    )
+
+
+@router.get(":batch", response_model=PostsBatchResponse)
+@rendered
+@cached(CacheScope.posts, CacheScope.categories, CacheScope.comments, CacheScope.saved_posts)
+async def get_posts_batch(
+    ids: BatchIds,
+    fieldset_params: FieldsetParamsDepends,
+    post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> PostsBatchResponse:
+    fieldset = fieldset_params.select(PostResponse, PostSummaryResponse)
+    posts, missing = pick(ids, await post_repository.get_posts_by_ids(ids, post_repository.cards.narrow(fieldset)))
+
+    saved: set[int] = set()
+    if "isSaved" in fieldset:
+        saved = set(await saved_posts_repository.get_saved_post_ids(current_user.id, [post.id for post in posts]))
+
+    return PostsBatchResponse(
+        posts=[fieldset.model.from_orm(post, fields=fieldset.fields, is_saved=post.id in saved) for post in posts],
+        missingIds=missing,
     )
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{post_id}", response_model=PostResponse)
+@rendered
+@cached(CacheScope.posts, CacheScope.categories, CacheScope.comments, CacheScope.saved_posts)
 async def get_post(
-    post_id: int, post_repository: PostRepositoryDepends, current_user: CurrentUserDepends
+    post_id: int,
+    request: Request,
+    response: Response,
+    post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    current_user: CurrentUserDepends,
 ) -> PostResponse:
-    post = post_repository.get_post_by_id(post_id)
+    check_not_modified(
+        request,
+        response,
+        await post_repository.get_post_validators(post_id, [saved_posts_repository.is_saved_by(current_user.id)]),
+    )
+
+    post = await post_repository.get_post_by_id(post_id)
 
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пост с id {post_id} не найден")
 
-    return PostResponse.from_orm(post)
+    saved = await saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
+    return PostResponse.from_orm(post, is_saved=saved is not None)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=PostResponse)
@@ -52,15 +118,28 @@ async def create_post(
     post_repository: PostRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> PostResponse:
-    post = post_repository.create_post(args, current_user.id)
+    post = await post_repository.create_post(args, current_user.id)
     return PostResponse.from_orm(post)
 
 
+@router.post(":batch", response_model=BatchResponse)
+async def create_posts(
+    args: PostBatchCreateRequest,
+    post_repository: PostRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> BatchResponse:
+    return BatchResponse(results=await post_repository.create_posts(args.items, current_user.id))
+
+
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
-    post_id: int, args: PostUpdateRequest, post_repository: PostRepositoryDepends, current_user: CurrentUserDepends
+    post_id: int,
+    args: PostUpdateRequest,
+    post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    current_user: CurrentUserDepends,
 ) -> PostResponse:
-    post = post_repository.get_post_by_id(post_id)
+    post = await post_repository.get_post_by_id(post_id)
 
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пост с id {post_id} не найден")
@@ -70,13 +149,14 @@ async def update_post(
             status.HTTP_403_FORBIDDEN, "Пост недоступен для редактирования, так как принадлежит другому пользователю"
         )
 
-    post_repository.update_post(post, args)
-    return PostResponse.from_orm(post)
+    await post_repository.update_post(post, args)
+    saved = await saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
+    return PostResponse.from_orm(post, is_saved=saved is not None)
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(post_id: int, post_repository: PostRepositoryDepends, current_user: CurrentUserDepends) -> None:
-    post = post_repository.get_post_by_id(post_id)
+    post = await post_repository.get_post_by_id(post_id)
 
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пост с id {post_id} не найден")
@@ -84,4 +164,4 @@ async def delete_post(post_id: int, post_repository: PostRepositoryDepends, curr
     if post.authorId != current_user.id and current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Недостаточно прав для удаления поста")
 
-    post_repository.delete_post(post)
+    await post_repository.delete_post(post)
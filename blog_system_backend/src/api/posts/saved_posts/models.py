@@ -1,6 +1,7 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from blog_system_backend.src.db.counters import Counter
 from blog_system_backend.src.db.models import Base
 
 
@@ -17,3 +18,10 @@ class SavedPost(Base):
 
     user = relationship("User")
     post = relationship("Post")
+
+
+# Одиночный индекс по userId остается: в нем сохраненные посты пользователя идут по id, как в списке.
+Index("uq_saved_posts_userId_postId", SavedPost.userId, SavedPost.postId, unique=True)
+
+POST_SAVES = Counter("posts", "savesCount", "saved_posts", "postId")
+POST_SAVES.attach(SavedPost.__table__)
@@ -1,39 +1,132 @@
+from collections.abc import Collection, Sequence
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import ColumnElement, exists, insert, select
+from sqlalchemy.exc import IntegrityError
 
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
 from blog_system_backend.src.api.posts.saved_posts.models import SavedPost
+from blog_system_backend.src.batch import BatchItemResult, link_results
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.db.loading import LoadingProfile
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
 
 
 class SavedPostRepository:
+    keyset = Keyset(SavedPost.id)
+    post_cards = LoadingProfile(SavedPost, nested={"post": PostRepository.cards})
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get_by_id(self, id: int) -> SavedPost | None:
-        return self.session.get(SavedPost, id)
+    async def get_by_id(self, id: int) -> SavedPost | None:
+        return await self.session.get(SavedPost, id)
+
+    async def get_by_user_and_post(self, user_id: int, post_id: int) -> SavedPost | None:
+        return (
+            await self.session.scalars(
+                select(SavedPost).filter(SavedPost.userId == user_id, SavedPost.postId == post_id).limit(1)
+            )
+        ).first()
+
+    @staticmethod
+    def is_saved_by(user_id: int) -> ColumnElement[bool]:
+        """Флаг «пост сохранен пользователем» для выборки по `posts`: входит в валидаторы, ведь isSaved
+        меняется без posts.updatedAt. Коррелирует только с `posts`, поэтому годится и для выборки по `saved_posts`."""
+
+        return exists().where(SavedPost.postId == Post.id, SavedPost.userId == user_id).correlate(Post)
 
-    def get_by_user_and_post(self, user_id: int, post_id: int) -> SavedPost | None:
-        return self.session.query(SavedPost).filter(SavedPost.userId == user_id, SavedPost.postId == post_id).first()
+    async def get_saved_post_ids(self, user_id: int, post_ids: Collection[int] | None = None) -> list[int]:
+        """Отсортированные id сохраненных пользователем постов; с `post_ids` — только среди них (один IN-запрос)."""
 
-    def get_by_user(
-        self, user_id: int, search_params: PaginationSearchParams | None = None
-    ) -> tuple[list[SavedPost], int]:
+        query = select(SavedPost.postId).filter(SavedPost.userId == user_id).order_by(SavedPost.postId)
+        if post_ids is not None:
+            if not post_ids:
+                return []
+            query = query.filter(SavedPost.postId.in_(post_ids))
+
+        return list(await self.session.scalars(query))
+
+    async def get_by_user(
+        self,
+        user_id: int,
+        search_params: PaginationSearchParams | None = None,
+        profile: LoadingProfile | None = None,
+    ) -> Page[SavedPost]:
         search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(SavedPost).filter(SavedPost.userId == user_id)
-        return query.offset(search_params.offset).limit(search_params.limit).all(), query.count()
+        query = (
+            select(SavedPost)
+            .options(*(profile or self.post_cards).options(*self.keyset.columns))
+            .filter(SavedPost.userId == user_id)
+        )
+
+        return await self.keyset.fetch(self.session, query, search_params)
+
+    async def get_by_user_validators(
+        self,
+        user_id: int,
+        search_params: PaginationSearchParams,
+        viewer_flags: Sequence[ColumnElement[bool]] = (),
+    ) -> Validators:
+        query = select(SavedPost).join(Post, Post.id == SavedPost.postId).filter(SavedPost.userId == user_id)
+
+        return await self.keyset.validators(
+            self.session,
+            query,
+            search_params,
+            Post.updatedAt,
+            *PostRepository.counters,
+            *viewer_flags,
+            *PostRepository.categories_fingerprint(),
+        )
+
+    async def create(self, user_id: int, post_id: int) -> SavedPost:
+        """Сохраняет пост; если параллельный запрос успел раньше, возвращает его запись."""
 
-    def create(self, user_id: int, post_id: int) -> SavedPost:
         saved = SavedPost(userId=user_id, postId=post_id)
         self.session.add(saved)
-        self.session.commit()
-        self.session.refresh(saved)
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            existing = await self.get_by_user_and_post(user_id, post_id)
+            if existing is None:
+                raise
+            return existing
+        await RESPONSE_CACHE.bump(CacheScope.saved_posts)
+        await self.session.refresh(saved)
         return saved
 
-    def delete(self, saved: SavedPost) -> None:
-        self.session.delete(saved)
-        self.session.commit()
+    async def create_many(self, user_id: int, post_ids: Sequence[int]) -> list[BatchItemResult]:
+        """Сохраняет посты одной вставкой; уже сохраненные, в том числе параллельным запросом, получают `exists`."""
+
+        posts = set(await self.session.scalars(select(Post.id).filter(Post.id.in_(set(post_ids)))))
+        created: dict[int, int] = {}
+        if posts:
+            statement = insert(SavedPost).prefix_with("OR IGNORE").returning(SavedPost.postId, SavedPost.id)
+            rows = [dict(userId=user_id, postId=post_id) for post_id in posts]
+            created = {post_id: id for post_id, id in await self.session.execute(statement, rows)}
+
+        existing: dict[int, int] = {}
+        if rest := posts - created.keys():
+            query = select(SavedPost.postId, SavedPost.id).filter(
+                SavedPost.userId == user_id, SavedPost.postId.in_(rest)
+            )
+            existing = {post_id: id for post_id, id in await self.session.execute(query)}
+
+        await self.session.commit()
+        if created:
+            await RESPONSE_CACHE.bump(CacheScope.saved_posts)
+
+        return link_results(post_ids, created, existing, "Пост не найден")
+
+    async def delete(self, saved: SavedPost) -> None:
+        await self.session.delete(saved)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.saved_posts)
 
 
 SavedPostRepositoryDepends = Annotated[SavedPostRepository, Depends()]
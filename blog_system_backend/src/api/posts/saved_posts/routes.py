@@ -16,15 +16,15 @@ async def save_post(
     post_repository: PostRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> SavedPost:
-    post = post_repository.get_post_by_id(post_id)
+    post = await post_repository.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Пост не найден")
 
-    existing = saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
+    existing = await saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
     if existing:
         return existing
 
-    saved = saved_posts_repository.create(current_user.id, post_id)
+    saved = await saved_posts_repository.create(current_user.id, post_id)
     return saved
 
 
@@ -35,10 +35,10 @@ async def unsave_post(
     post_repository: PostRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> None:
-    post = post_repository.get_post_by_id(post_id)
+    post = await post_repository.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Пост не найден")
 
-    existing = saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
+    existing = await saved_posts_repository.get_by_user_and_post(current_user.id, post_id)
     if existing:
-        saved_posts_repository.delete(existing)
+        await saved_posts_repository.delete(existing)
@@ -3,6 +3,11 @@ from datetime import datetime
 from pydantic import BaseModel, PositiveInt
 
 from blog_system_backend.src.api.posts.saved_posts.models import SavedPost
+from blog_system_backend.src.batch import BatchItems
+
+
+class SavedPostBatchCreateRequest(BaseModel):
+    postIds: BatchItems[PositiveInt]
 
 
 class SavedPostResponse(BaseModel):
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Self
 
-from pydantic import BaseModel, PositiveInt, constr
+from pydantic import BaseModel, NonNegativeInt, PositiveInt, constr
 
 from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.batch import BatchItems
+from blog_system_backend.src.fieldsets import SparseModel
 from blog_system_backend.src.pagination import PaginationResponse
 
 
@@ -13,34 +15,71 @@ class PostCreateRequest(BaseModel):
     categoryIds: list[PositiveInt] = []
 
 
+class PostBatchCreateRequest(BaseModel):
+    items: BatchItems[PostCreateRequest]
+
+
 class PostUpdateRequest(BaseModel):
     title: Annotated[str, constr(max_length=500)]
     content: Annotated[str, constr(max_length=100000)]
     categoryIds: list[PositiveInt] = []
 
 
-class PostResponse(BaseModel):
+class PostResponse(SparseModel):
     id: PositiveInt
     authorId: PositiveInt
     title: Annotated[str, constr(max_length=500)]
     content: Annotated[str, constr(max_length=100000)]
     categories: list[str] = []
+    commentsCount: NonNegativeInt
+    savesCount: NonNegativeInt
+    createdAt: datetime
+    updatedAt: datetime
+    snippet: str | None = None
+    isSaved: bool = False
+
+    @classmethod
+    def from_orm(
+        cls, post: Post, snippet: str | None = None, fields: frozenset[str] | None = None, is_saved: bool = False
+    ) -> Self:
+        return cls.from_attributes(post, fields, snippet=snippet, isSaved=is_saved, **_categories(post, fields))
+
+
+class PostSummaryResponse(SparseModel):
+    """Пост для списков: вместо `content` — сохраненный `excerpt`."""
+
+    id: PositiveInt
+    authorId: PositiveInt
+    title: Annotated[str, constr(max_length=500)]
+    excerpt: str
+    categories: list[str] = []
+    commentsCount: NonNegativeInt
+    savesCount: NonNegativeInt
     createdAt: datetime
     updatedAt: datetime
+    snippet: str | None = None
+    isSaved: bool = False
 
     @classmethod
-    def from_orm(cls, post: Post) -> "PostResponse":
-        return cls(
-            id=post.id,
-            authorId=post.authorId,
-            title=post.title,
-            content=post.content,
-            categories=[cat.title for cat in post.categories],
-            createdAt=post.createdAt,
-            updatedAt=post.updatedAt,
-        )
+    def from_orm(
+        cls, post: Post, snippet: str | None = None, fields: frozenset[str] | None = None, is_saved: bool = False
+    ) -> Self:
+        return cls.from_attributes(post, fields, snippet=snippet, isSaved=is_saved, **_categories(post, fields))
 
 
 class PostsPaginationResponse(BaseModel):
     pagination: PaginationResponse
-    posts: list[PostResponse]
+    posts: list[PostResponse | PostSummaryResponse]
+
+
+class PostsBatchResponse(BaseModel):
+    posts: list[PostResponse | PostSummaryResponse]
+    missingIds: list[PositiveInt]
+
+
+def _categories(post: Post, fields: frozenset[str] | None) -> dict[str, list[str]]:
+    # Связь читается, только если поле выбрано: иначе она не загружена.
+    if fields is not None and "categories" not in fields:
+        return {}
+
+    return {"categories": [cat.title for cat in post.categories]}
@@ -0,0 +1,67 @@
+import re
+from typing import Any
+
+from sqlalchemy import ColumnElement, Connection, column, literal_column, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.db.fts import fts5_supported, has_table
+
+POSTS_FTS = table("posts_fts", column("rowid"), column("title"), column("content"), column("rank"))
+
+CREATE_POSTS_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+    "title, content, content='posts', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN "
+    "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+)
+
+DROP_POSTS_FTS = (
+    "DROP TRIGGER IF EXISTS posts_fts_update",
+    "DROP TRIGGER IF EXISTS posts_fts_delete",
+    "DROP TRIGGER IF EXISTS posts_fts_insert",
+    "DROP TABLE IF EXISTS posts_fts",
+)
+
+REBUILD_POSTS_FTS = "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"
+
+
+def create_posts_fts(target: Any, connection: Connection, **kw: Any) -> None:
+    if not fts5_supported(connection):
+        return
+
+    for statement in CREATE_POSTS_FTS:
+        connection.exec_driver_sql(statement)
+
+
+def drop_posts_fts(target: Any, connection: Connection, **kw: Any) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+
+    for statement in DROP_POSTS_FTS:
+        connection.exec_driver_sql(statement)
+
+
+def has_posts_fts(session: AsyncSession) -> bool:
+    return has_table(session, "posts_fts")
+
+
+def fts_query(q: str) -> str | None:
+    """Превращает пользовательскую строку в запрос FTS5: каждое слово ищется по префиксу, все слова обязательны.
+
+    Синтаксис FTS5 (кавычки, NEAR, OR, `-`) из строки не пропускается.
+    """
+    terms = re.findall(r"\w+", q)
+    return " ".join(f'"{term}"*' for term in terms) or None
+
+
+def fts_match(query: str) -> ColumnElement[bool]:
+    return literal_column("posts_fts").op("MATCH")(query)
+
+
+def fts_snippet() -> ColumnElement[str]:
+    return literal_column("snippet(posts_fts, 1, '<mark>', '</mark>', '…', 16)")
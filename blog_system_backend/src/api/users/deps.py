@@ -6,22 +6,35 @@ from fastapi import Depends, HTTPException, status
 from blog_system_backend.src.api.auth.deps import PasswordBearerDepends
 from blog_system_backend.src.api.auth.schemas import JWT
 from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.principal import PRINCIPAL_CACHE, Principal
 from blog_system_backend.src.db.deps import SessionDepends
 from blog_system_backend.src.settings import settings
 
 
-def get_current_user(session: SessionDepends, raw: PasswordBearerDepends) -> User:
-    try:
-        data = JWT(**jwt.decode(raw, settings.jwt_secret, algorithms=[settings.jwt_algorithm]))
-    except Exception:
-        raise HTTPException(status.HTTP_403_FORBIDDEN, "Неверный логин или пароль") from None
+async def get_current_user(session: SessionDepends, raw: PasswordBearerDepends) -> Principal:
+    user_id = PRINCIPAL_CACHE.get_token(raw)
 
-    user = session.get(User, data.sub)
+    if user_id is None:
+        try:
+            data = JWT(**jwt.decode(raw, settings.jwt_secret, algorithms=[settings.jwt_algorithm]))
+            user_id = int(str(data.sub))
+        except Exception:
+            raise HTTPException(status.HTTP_403_FORBIDDEN, "Неверный логин или пароль") from None
 
-    if not user:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Пользователь не найден")
+        PRINCIPAL_CACHE.set_token(raw, user_id, data.exp)
 
-    return user
+    principal = PRINCIPAL_CACHE.get_principal(user_id)
 
+    if principal is None:
+        user = await session.get(User, user_id)
 
-CurrentUserDepends = Annotated[User, Depends(get_current_user)]
+        if not user:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Пользователь не найден")
+
+        principal = Principal.from_orm(user)
+        PRINCIPAL_CACHE.set_principal(principal)
+
+    return principal
+
+
+CurrentUserDepends = Annotated[Principal, Depends(get_current_user)]
@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.db.fts import TrigramIndex
 from blog_system_backend.src.db.models import Base
 
 if TYPE_CHECKING:
@@ -17,6 +19,17 @@ class User(Base):
     login: Mapped[str] = mapped_column(index=True, unique=True)
     password: Mapped[str] = mapped_column()
     role: Mapped[UserRole] = mapped_column(default=UserRole.user)
+    # Счетчики поддерживают триггеры (см. src/db/counters.py).
+    followersCount: Mapped[int] = mapped_column(default=0, server_default="0")
+    subscriptionsCount: Mapped[int] = mapped_column(default=0, server_default="0")
+    postsCount: Mapped[int] = mapped_column(default=0, server_default="0")
 
     posts: Mapped[list["Post"]] = relationship("Post", back_populates="author")
     comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="author")
+
+
+# Инкрементальная выгрузка идет в порядке (updatedAt, id).
+Index("ix_users_updatedAt", User.updatedAt)
+
+LOGIN_TRIGRAM = TrigramIndex("users", "login")
+LOGIN_TRIGRAM.attach(User.__table__)
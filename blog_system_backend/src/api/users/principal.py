@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.cache import CHANNEL, MISSING, InvalidationChannel, TTLCache
+from blog_system_backend.src.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Авторизованный пользователь: только поля, нужные для проверок доступа."""
+
+    id: int
+    role: UserRole
+    login: str
+
+    @classmethod
+    def from_orm(cls, user: User) -> "Principal":
+        return cls(id=user.id, role=user.role, login=user.login)
+
+
+class PrincipalCache:
+    """Кэш проверенных токенов и пользователей, от имени которых они выпущены.
+
+    Токен хранится не дольше своего `exp`, пользователь - до изменения или удаления в `UserRepository`.
+    Записи живут в памяти воркера, чтобы авторизация не ходила ни в базу, ни в бэкенд кэша. Об изменении
+    пользователя остальные воркеры узнают из канала инвалидации.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float, channel: InvalidationChannel | None = None) -> None:
+        self.tokens = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.principals = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.channel = channel
+
+        if channel is not None:
+            channel.subscribe(self._on_message)
+
+    def get_token(self, raw: str) -> int | None:
+        user_id = self.tokens.get(raw)
+        return None if user_id is MISSING else user_id
+
+    def set_token(self, raw: str, user_id: int, expires_at: datetime | None) -> None:
+        ttl = None if expires_at is None else (expires_at - datetime.now(UTC)).total_seconds()
+        self.tokens.set(raw, user_id, ttl=ttl)
+
+    def get_principal(self, user_id: int) -> Principal | None:
+        principal = self.principals.get(user_id)
+        return None if principal is MISSING else principal
+
+    def set_principal(self, principal: Principal) -> None:
+        self.principals.set(principal.id, principal)
+
+    async def invalidate(self, user_id: int) -> None:
+        self.principals.pop(user_id)
+
+        if self.channel is not None:
+            await self.channel.publish(f"principal:{user_id}")
+
+    def clear(self) -> None:
+        self.tokens.reset()
+        self.principals.reset()
+
+    async def _on_message(self, message: str | None) -> None:
+        if message is None:
+            self.principals.clear()
+            return
+
+        kind, _, user_id = message.partition(":")
+        if kind == "principal":
+            self.principals.pop(int(user_id))
+
+    @property
+    def hits(self) -> int:
+        return self.tokens.hits + self.principals.hits
+
+    @property
+    def misses(self) -> int:
+        return self.tokens.misses + self.principals.misses
+
+
+PRINCIPAL_CACHE = PrincipalCache(
+    maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl, channel=CHANNEL
+)
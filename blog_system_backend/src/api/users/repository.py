@@ -1,45 +1,76 @@
-from typing import Annotated
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import ColumnElement, Row, Select, select
 
 from blog_system_backend.src.api.users.enums import UserRole
-from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.models import LOGIN_TRIGRAM, User
+from blog_system_backend.src.api.users.principal import PRINCIPAL_CACHE
 from blog_system_backend.src.api.users.schemas import UserRequest, UserUpdateRequest
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.db.export import stream_rows
+from blog_system_backend.src.db.loading import LoadingProfile
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
 from blog_system_backend.src.security import get_password_hash
 
 
 class UserRepository:
+    keyset = Keyset(User.login, User.id)
+    cards = LoadingProfile(User)
+    # Счетчики меняют триггеры, не трогая updatedAt, поэтому валидаторы учитывают их отдельно.
+    counters = (User.followersCount, User.subscriptionsCount, User.postsCount)
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get_user_by_id(self, id: int) -> User | None:
-        return self.session.get(User, id)
+    async def get_user_by_id(self, id: int) -> User | None:
+        return await self.session.get(User, id)
+
+    async def get_user_by_login(self, login: str) -> User | None:
+        return (await self.session.scalars(select(User).filter(User.login == login).limit(1))).first()
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        return (await self.session.scalars(select(User).filter(User.email == email).limit(1))).first()
+
+    async def get_users_by_ids(self, ids: Collection[int], profile: LoadingProfile | None = None) -> dict[int, User]:
+        query = select(User).options(*(profile or self.cards).options()).filter(User.id.in_(ids))
+        return {user.id: user for user in await self.session.scalars(query)}
 
-    def get_user_by_login(self, login: str) -> User | None:
-        return self.session.query(User).filter(User.login == login).first()
+    async def get_user_validators(self, id: int, viewer_flags: Sequence[ColumnElement[bool]] = ()) -> Validators | None:
+        query = select(User.updatedAt, *self.counters, *viewer_flags).filter(User.id == id).limit(1)
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            return None
 
-    def get_user_by_email(self, email: str) -> User | None:
-        return self.session.query(User).filter(User.email == email).first()
+        updated_at, *parts = row
+        return Validators.from_parts(id, updated_at, *parts, last_modified=updated_at)
 
-    def get_users(self, search_params: PaginationSearchParams | None = None) -> list[User]:
-        search_params = search_params or PaginationSearchParams.model_construct()
+    async def get_users_page(
+        self, search_params: PaginationSearchParams, profile: LoadingProfile | None = None
+    ) -> Page[User]:
+        query = await self._filter(select(User), search_params)
+        query = query.options(*(profile or self.cards).options(*self.keyset.columns))
 
-        query = self.session.query(User)
-        query = query.filter(User.login.icontains(search_params.q)) if search_params.q else query
-        query = query.order_by(User.login).offset(search_params.offset).limit(search_params.limit)
+        return await self.keyset.fetch(self.session, query, search_params)
 
-        return query.all()
+    async def get_users_validators(
+        self, search_params: PaginationSearchParams, viewer_flags: Sequence[ColumnElement[bool]] = ()
+    ) -> Validators:
+        query = await self._filter(select(User), search_params)
 
-    def count_users(self, search_params: PaginationSearchParams | None = None) -> int:
-        search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(User)
-        query = query.filter(User.login.icontains(search_params.q)) if search_params.q else query
+        return await self.keyset.validators(
+            self.session, query, search_params, User.updatedAt, *self.counters, *viewer_flags
+        )
+
+    def export(self, since: datetime | None = None) -> AsyncIterator[Sequence[Row[Any]]]:
+        query = select(User.id, User.email, User.login, User.role, *self.counters, User.createdAt, User.updatedAt)
 
-        return query.count()
+        return stream_rows(self.session, query, User.updatedAt, User.id, since)
 
-    def create_user(self, args: UserRequest, is_admin: bool = False) -> User:
+    async def create_user(self, args: UserRequest, is_admin: bool = False) -> User:
         user = User(
             login=args.login,
             email=args.email,
@@ -48,20 +79,31 @@ class UserRepository:
         )
 
         self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.users)
+        await self.session.refresh(user)
 
         return user
 
-    def update_user(self, user: User, args: UserUpdateRequest) -> None:
+    async def update_user(self, user: User, args: UserUpdateRequest) -> None:
         user.update(args.dict())
 
-        self.session.commit()
-        self.session.refresh(user)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.users)
+        await PRINCIPAL_CACHE.invalidate(user.id)
+        await self.session.refresh(user)
+
+    async def delete_user(self, user: User) -> None:
+        await self.session.delete(user)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.users)
+        await PRINCIPAL_CACHE.invalidate(user.id)
+
+    async def _filter(self, query: Select[Any], search_params: PaginationSearchParams) -> Select[Any]:
+        if not search_params.q:
+            return query
 
-    def delete_user(self, user: User) -> None:
-        self.session.delete(user)
-        self.session.commit()
+        return query.filter(await LOGIN_TRIGRAM.search(self.session, User.login, User.id, search_params.q))
 
 
 UserRepositoryDepends = Annotated[UserRepository, Depends()]
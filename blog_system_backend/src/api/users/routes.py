@@ -1,39 +1,90 @@
-from functools import lru_cache
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
+from blog_system_backend.src.api.posts.repository import PostRepositoryDepends
 from blog_system_backend.src.api.posts.saved_posts.repository import SavedPostRepositoryDepends
-from blog_system_backend.src.api.posts.schemas import PostResponse, PostsPaginationResponse
+from blog_system_backend.src.api.posts.saved_posts.schemas import SavedPostBatchCreateRequest
+from blog_system_backend.src.api.posts.schemas import PostResponse, PostsPaginationResponse, PostSummaryResponse
 from blog_system_backend.src.api.users.deps import CurrentUserDepends
 from blog_system_backend.src.api.users.enums import UserRole
 from blog_system_backend.src.api.users.models import User
 from blog_system_backend.src.api.users.repository import UserRepositoryDepends
 from blog_system_backend.src.api.users.schemas import (
     UserResponse,
+    UsersBatchResponse,
     UsersPaginationResponse,
+    UserSummaryResponse,
     UserUpdateRequest,
+    ViewerStateResponse,
 )
 from blog_system_backend.src.api.users.subscribes.repository import SubscribeRepositoryDepends
-from blog_system_backend.src.api.users.subscribes.schemas import SubscribePaginationResponse, SubscribeResponse
+from blog_system_backend.src.api.users.subscribes.schemas import (
+    SubscribeBatchCreateRequest,
+    SubscribePaginationResponse,
+    SubscribeResponse,
+)
+from blog_system_backend.src.batch import BatchIds, BatchResponse, pick
+from blog_system_backend.src.cache import CacheScope, Validators, cached, check_not_modified
+from blog_system_backend.src.fieldsets import FieldsetParamsDepends
 from blog_system_backend.src.pagination import PaginationResponse, PaginationSearchParamsDepends
-from blog_system_backend.src.settings import settings
+from blog_system_backend.src.rendering import rendered
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("", response_model=UsersPaginationResponse)
+@rendered
+@cached(CacheScope.users, CacheScope.posts, CacheScope.subscribes)
 async def get_users(
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
     user_repository: UserRepositoryDepends,
+    subscribe_repository: SubscribeRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> UsersPaginationResponse:
-    count = user_repository.count_users(search_params)
-    users = user_repository.get_users(search_params)
+    fieldset = fieldset_params.select(UserResponse, UserSummaryResponse)
+    check_not_modified(
+        request,
+        response,
+        await user_repository.get_users_validators(
+            search_params, [subscribe_repository.is_subscribed_by(current_user.id)]
+        ),
+    )
+
+    page = await user_repository.get_users_page(search_params, user_repository.cards.narrow(fieldset))
+
+    subscribed: set[int] = set()
+    if "isSubscribed" in fieldset:
+        subscribed = set(await subscribe_repository.get_author_ids(current_user.id, [user.id for user in page.items]))
+
+    return UsersPaginationResponse(
+        pagination=PaginationResponse.from_page(search_params, page),
+        users=[fieldset.model.from_orm(user, fieldset.fields, user.id in subscribed) for user in page.items],
+    )
 
-    pagination = PaginationResponse.from_search_params(search_params, total_items=count)
 
-    return UsersPaginationResponse(pagination=pagination, users=[UserResponse.from_orm(user) for user in users])
+@router.get(":batch", response_model=UsersBatchResponse)
+@rendered
+@cached(CacheScope.users, CacheScope.posts, CacheScope.subscribes)
+async def get_users_batch(
+    ids: BatchIds,
+    fieldset_params: FieldsetParamsDepends,
+    user_repository: UserRepositoryDepends,
+    subscribe_repository: SubscribeRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> UsersBatchResponse:
+    fieldset = fieldset_params.select(UserResponse, UserSummaryResponse)
+    users, missing = pick(ids, await user_repository.get_users_by_ids(ids, user_repository.cards.narrow(fieldset)))
+
+    subscribed: set[int] = set()
+    if "isSubscribed" in fieldset:
+        subscribed = set(await subscribe_repository.get_author_ids(current_user.id, [user.id for user in users]))
+
+    return UsersBatchResponse(
+        users=[fieldset.model.from_orm(user, fieldset.fields, user.id in subscribed) for user in users],
+        missingIds=missing,
+    )
 
 
 @router.get(
@@ -42,27 +93,84 @@ async def get_users(
     status_code=status.HTTP_200_OK,
 )
 async def get_current_user(
+    user_repository: UserRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> User:
-    return current_user
+    user = await user_repository.get_user_by_id(current_user.id)
+
+    if not user:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Пользователь не найден")
+
+    return user
+
+
+@router.get("/me/state", response_model=ViewerStateResponse)
+@rendered
+@cached(CacheScope.saved_posts, CacheScope.subscribes)
+async def get_viewer_state(
+    request: Request,
+    response: Response,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    subscribe_repository: SubscribeRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> ViewerStateResponse:
+    saved_post_ids = await saved_posts_repository.get_saved_post_ids(current_user.id)
+    subscribed_author_ids = await subscribe_repository.get_author_ids(current_user.id)
+
+    check_not_modified(request, response, Validators.from_parts(saved_post_ids, subscribed_author_ids))
+
+    return ViewerStateResponse(savedPostIds=saved_post_ids, subscribedAuthorIds=subscribed_author_ids)
+
+
+@router.post("/me/saved-posts:batch", response_model=BatchResponse)
+async def save_posts(
+    args: SavedPostBatchCreateRequest,
+    saved_posts_repository: SavedPostRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> BatchResponse:
+    return BatchResponse(results=await saved_posts_repository.create_many(current_user.id, args.postIds))
+
+
+@router.post("/me/subscriptions:batch", response_model=BatchResponse)
+async def subscribe_many(
+    args: SubscribeBatchCreateRequest,
+    subscribe_repository: SubscribeRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> BatchResponse:
+    return BatchResponse(results=await subscribe_repository.create_many(args.authorIds, current_user.id))
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, user_repository: UserRepositoryDepends, current_user: CurrentUserDepends) -> User:
-    user = user_repository.get_user_by_id(user_id)
+@rendered
+@cached(CacheScope.users, CacheScope.posts, CacheScope.subscribes)
+async def get_user(
+    user_id: int,
+    request: Request,
+    response: Response,
+    user_repository: UserRepositoryDepends,
+    subscribe_repository: SubscribeRepositoryDepends,
+    current_user: CurrentUserDepends,
+) -> UserResponse:
+    check_not_modified(
+        request,
+        response,
+        await user_repository.get_user_validators(user_id, [subscribe_repository.is_subscribed_by(current_user.id)]),
+    )
+
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
 
-    return user
+    subscribe = await subscribe_repository.get_by_author_and_subscriber(user_id, current_user.id)
+    return UserResponse.from_orm(user, is_subscribed=subscribe is not None)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: int, args: UserUpdateRequest, user_repository: UserRepositoryDepends, current_user: CurrentUserDepends
 ) -> User:
-    request_user = user_repository.get_user_by_id(user_id)
+    request_user = await user_repository.get_user_by_id(user_id)
 
     if not request_user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
@@ -70,21 +178,21 @@ async def update_user(
     if current_user.id != user_id and current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Недостаточно прав на редактирование пользователя")
 
-    user = user_repository.get_user_by_email(args.email)
+    user = await user_repository.get_user_by_email(args.email)
     if user and user.id != user_id:
         raise HTTPException(status.HTTP_409_CONFLICT, f"Пользователь с email {args.email} уже существует")
 
-    user = user_repository.get_user_by_login(args.login)
+    user = await user_repository.get_user_by_login(args.login)
     if user and user.id != user_id:
         raise HTTPException(status.HTTP_409_CONFLICT, f"Пользователь с логином {args.login} уже существует")
 
-    user_repository.update_user(request_user, args)
+    await user_repository.update_user(request_user, args)
     return request_user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: int, user_repository: UserRepositoryDepends, current_user: CurrentUserDepends) -> None:
-    user = user_repository.get_user_by_id(user_id)
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
@@ -92,97 +200,145 @@ async def delete_user(user_id: int, user_repository: UserRepositoryDepends, curr
     if current_user.id != user_id and current_user.role != UserRole.admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN, "Недостаточно прав на удаление пользователя")
 
-    user_repository.delete_user(user)
+    await user_repository.delete_user(user)
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{user_id}/subscriptions")
+@rendered
+@cached(CacheScope.users, CacheScope.subscribes)
 async def get_user_subscriptions(
     user_id: int,
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
     user_repository: UserRepositoryDepends,
     subscribe_repository: SubscribeRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> SubscribePaginationResponse:
-    user = user_repository.get_user_by_id(user_id)
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
 
-    subscriptions, count = subscribe_repository.get_subscriptions(user_id, search_params)
+    check_not_modified(
+        request, response, await subscribe_repository.get_subscriptions_validators(user_id, search_params)
+    )
+
+    page = await subscribe_repository.get_subscriptions(user_id, search_params)
 
     return SubscribePaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=count),
-        subscribes=[SubscribeResponse.from_orm(subscription) for subscription in subscriptions],
+        pagination=PaginationResponse.from_page(search_params, page),
+        subscribes=[SubscribeResponse.from_orm(subscription) for subscription in page.items],
     )
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{user_id}/followers")
+@rendered
+@cached(CacheScope.users, CacheScope.subscribes)
 async def get_user_followers(
     user_id: int,
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
     user_repository: UserRepositoryDepends,
     subscribe_repository: SubscribeRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> SubscribePaginationResponse:
-    user = user_repository.get_user_by_id(user_id)
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
 
-    followers, count = subscribe_repository.get_followers(user_id, search_params)
+    check_not_modified(request, response, await subscribe_repository.get_followers_validators(user_id, search_params))
+
+    page = await subscribe_repository.get_followers(user_id, search_params)
 
     return SubscribePaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=count),
-        subscribes=[SubscribeResponse.from_orm(follower) for follower in followers],
+        pagination=PaginationResponse.from_page(search_params, page),
+        subscribes=[SubscribeResponse.from_orm(follower) for follower in page.items],
     )
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{user_id}/saved-posts", response_model=PostsPaginationResponse)
+@rendered
+@cached(CacheScope.users, CacheScope.saved_posts, CacheScope.posts, CacheScope.categories, CacheScope.comments)
 async def get_user_saved_posts(
+    request: Request,
+    response: Response,
     user_id: int,
     search_params: PaginationSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
     user_repository: UserRepositoryDepends,
     saved_posts_repository: SavedPostRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> PostsPaginationResponse:
-    user = user_repository.get_user_by_id(user_id)
+    fieldset = fieldset_params.select(PostResponse, PostSummaryResponse)
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
 
-    posts, count = saved_posts_repository.get_by_user(user_id, search_params)
+    check_not_modified(
+        request,
+        response,
+        await saved_posts_repository.get_by_user_validators(
+            user_id, search_params, [saved_posts_repository.is_saved_by(current_user.id)]
+        ),
+    )
+
+    page = await saved_posts_repository.get_by_user(
+        user_id, search_params, saved_posts_repository.post_cards.narrow(fieldset, "post")
+    )
+
+    saved: set[int] = set()
+    if "isSaved" in fieldset:
+        post_ids = [item.postId for item in page.items]
+        saved = set(await saved_posts_repository.get_saved_post_ids(current_user.id, post_ids))
 
     return PostsPaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=count),
-        posts=[PostResponse.from_orm(post.post) for post in posts],
+        pagination=PaginationResponse.from_page(search_params, page),
+        posts=[
+            fieldset.model.from_orm(item.post, fields=fieldset.fields, is_saved=item.postId in saved)
+            for item in page.items
+        ],
     )
 
 
-@lru_cache(maxsize=settings.lru_cache_size)
 @router.get("/{user_id}/posts", response_model=PostsPaginationResponse)
+@rendered
+@cached(CacheScope.users, CacheScope.posts, CacheScope.categories, CacheScope.comments, CacheScope.saved_posts)
 async def get_user_posts(
     user_id: int,
+    request: Request,
+    response: Response,
     search_params: PaginationSearchParamsDepends,
+    fieldset_params: FieldsetParamsDepends,
     user_repository: UserRepositoryDepends,
+    post_repository: PostRepositoryDepends,
+    saved_posts_repository: SavedPostRepositoryDepends,
     current_user: CurrentUserDepends,
 ) -> PostsPaginationResponse:
-    user = user_repository.get_user_by_id(user_id)
+    fieldset = fieldset_params.select(PostResponse, PostSummaryResponse)
+    user = await user_repository.get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(status.HTTP_404_NOT_FOUND, f"Пользователь с id {user_id} не найден")
 
-    if search_params.q:
-        posts = [post for post in user.posts if (search_params.q in post.title or search_params.q in post.content)]
-    else:
-        posts = user.posts
+    check_not_modified(
+        request,
+        response,
+        await post_repository.get_posts_validators(
+            search_params, user_id, [saved_posts_repository.is_saved_by(current_user.id)]
+        ),
+    )
+
+    page = await post_repository.get_posts_page(search_params, post_repository.cards.narrow(fieldset), user_id)
+
+    saved: set[int] = set()
+    if "isSaved" in fieldset:
+        saved = set(await saved_posts_repository.get_saved_post_ids(current_user.id, [post.id for post in page.items]))
 
     return PostsPaginationResponse(
-        pagination=PaginationResponse.from_search_params(search_params, total_items=len(posts)),
-        posts=[
-            PostResponse.from_orm(post)
-            for post in posts[search_params.offset : search_params.limit + search_params.offset]
-        ],
+        pagination=PaginationResponse.from_page(search_params, page),
+        posts=[fieldset.model.from_orm(post, fields=fieldset.fields, is_saved=post.id in saved) for post in page.items],
     )
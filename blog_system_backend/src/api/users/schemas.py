@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Self
 
-from pydantic import BaseModel, EmailStr, PositiveInt, constr
+from pydantic import BaseModel, EmailStr, NonNegativeInt, PositiveInt, constr
 
 from blog_system_backend.src.api.users.enums import UserRole
 from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.fieldsets import SparseModel
 from blog_system_backend.src.pagination import PaginationResponse
 
 
@@ -19,26 +20,45 @@ class UserUpdateRequest(BaseModel):
     login: Annotated[str, constr(min_length=4, max_length=128)]
 
 
-class UserResponse(BaseModel):
+class UserResponse(SparseModel):
     id: PositiveInt
     email: EmailStr
     login: Annotated[str, constr(min_length=4, max_length=128)]
     role: UserRole
+    followersCount: NonNegativeInt
+    subscriptionsCount: NonNegativeInt
+    postsCount: NonNegativeInt
     createdAt: datetime
     updatedAt: datetime
+    isSubscribed: bool = False
 
     @classmethod
-    def from_orm(cls, user: User) -> "UserResponse":
-        return cls(
-            id=user.id,
-            email=user.email,
-            login=user.login,
-            role=user.role,
-            createdAt=user.createdAt,
-            updatedAt=user.updatedAt,
-        )
+    def from_orm(cls, user: User, fields: frozenset[str] | None = None, is_subscribed: bool = False) -> Self:
+        return cls.from_attributes(user, fields, isSubscribed=is_subscribed)
+
+
+class UserSummaryResponse(SparseModel):
+    id: PositiveInt
+    login: Annotated[str, constr(min_length=4, max_length=128)]
+    isSubscribed: bool = False
+
+    @classmethod
+    def from_orm(cls, user: User, fields: frozenset[str] | None = None, is_subscribed: bool = False) -> Self:
+        return cls.from_attributes(user, fields, isSubscribed=is_subscribed)
 
 
 class UsersPaginationResponse(BaseModel):
     pagination: PaginationResponse
-    users: list[UserResponse]
+    users: list[UserResponse | UserSummaryResponse]
+
+
+class UsersBatchResponse(BaseModel):
+    users: list[UserResponse | UserSummaryResponse]
+    missingIds: list[PositiveInt]
+
+
+class ViewerStateResponse(BaseModel):
+    """Сохраненные посты и авторы в подписках текущего пользователя — для отметок в интерфейсе."""
+
+    savedPostIds: list[PositiveInt]
+    subscribedAuthorIds: list[PositiveInt]
@@ -1,6 +1,7 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from blog_system_backend.src.db.counters import Counter
 from blog_system_backend.src.db.models import Base
 
 
@@ -17,3 +18,12 @@ class Subscribe(Base):
 
     author = relationship("User", foreign_keys=[authorId])
     subscriber = relationship("User", foreign_keys=[subscriberId])
+
+
+# Одиночный индекс по authorId остается: в нем подписчики автора идут по id, как в списке подписчиков.
+Index("uq_subscribes_authorId_subscriberId", Subscribe.authorId, Subscribe.subscriberId, unique=True)
+
+USER_FOLLOWERS = Counter("users", "followersCount", "subscribes", "authorId")
+USER_FOLLOWERS.attach(Subscribe.__table__)
+USER_SUBSCRIPTIONS = Counter("users", "subscriptionsCount", "subscribes", "subscriberId")
+USER_SUBSCRIPTIONS.attach(Subscribe.__table__)
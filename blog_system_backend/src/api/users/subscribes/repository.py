@@ -1,61 +1,154 @@
-from typing import Annotated
+from collections.abc import Collection, Sequence
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import ColumnElement, Select, exists, insert, select
+from sqlalchemy.exc import IntegrityError
 
-from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.feed.fanout import backfill, retract_author
+from blog_system_backend.src.api.users.models import LOGIN_TRIGRAM, User
 from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.batch import BatchItemResult, link_results
+from blog_system_backend.src.cache import RESPONSE_CACHE, CacheScope, Validators
 from blog_system_backend.src.db.deps import SessionDepends
-from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.pagination import Keyset, Page, PaginationSearchParams
+from blog_system_backend.src.settings import settings
 
 
 class SubscribeRepository:
+    keyset = Keyset(Subscribe.id)
+
     def __init__(self, session: SessionDepends) -> None:
         self.session = session
 
-    def get(self, id: int) -> Subscribe | None:
-        return self.session.get(Subscribe, id)
+    async def get(self, id: int) -> Subscribe | None:
+        return await self.session.get(Subscribe, id)
 
-    def get_by_author_and_subscriber(self, author_id: int, subscriber_id: int) -> Subscribe | None:
+    async def get_by_author_and_subscriber(self, author_id: int, subscriber_id: int) -> Subscribe | None:
         return (
-            self.session.query(Subscribe)
-            .filter(Subscribe.authorId == author_id, Subscribe.subscriberId == subscriber_id)
-            .first()
-        )
+            await self.session.scalars(
+                select(Subscribe)
+                .filter(Subscribe.authorId == author_id, Subscribe.subscriberId == subscriber_id)
+                .limit(1)
+            )
+        ).first()
+
+    @staticmethod
+    def is_subscribed_by(subscriber_id: int) -> ColumnElement[bool]:
+        """Флаг «пользователь подписан на автора» для выборки по `users`, аналог `SavedPostRepository.is_saved_by`."""
+
+        return exists().where(Subscribe.authorId == User.id, Subscribe.subscriberId == subscriber_id)
+
+    async def get_author_ids(self, subscriber_id: int, author_ids: Collection[int] | None = None) -> list[int]:
+        """Отсортированные id авторов, на которых подписан пользователь; с `author_ids` — только среди них."""
+
+        query = select(Subscribe.authorId).filter(Subscribe.subscriberId == subscriber_id).order_by(Subscribe.authorId)
+        if author_ids is not None:
+            if not author_ids:
+                return []
+            query = query.filter(Subscribe.authorId.in_(author_ids))
+
+        return list(await self.session.scalars(query))
+
+    async def create(self, author_id: int, subscriber_id: int) -> Subscribe:
+        """Создает подписку и добавляет в ленту последние посты автора; если параллельный запрос успел раньше,
+        возвращает его запись."""
 
-    def create(self, author_id: int, subscriber_id: int) -> Subscribe:
         s = Subscribe(authorId=author_id, subscriberId=subscriber_id)
         self.session.add(s)
-        self.session.commit()
-        self.session.refresh(s)
+        try:
+            await self.session.flush()
+            await self.session.execute(backfill(subscriber_id, author_id, settings.feed_backfill_size))
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            existing = await self.get_by_author_and_subscriber(author_id, subscriber_id)
+            if existing is None:
+                raise
+            return existing
+        await RESPONSE_CACHE.bump(CacheScope.subscribes)
+        await self.session.refresh(s)
         return s
 
-    def delete(self, s: Subscribe) -> None:
-        self.session.delete(s)
-        self.session.commit()
+    async def create_many(self, author_ids: Sequence[int], subscriber_id: int) -> list[BatchItemResult]:
+        """Создает подписки одной вставкой и одной транзакцией, по каждой новой подписке дополняет ленту."""
 
-    def get_followers(
+        authors = set(
+            await self.session.scalars(select(User.id).filter(User.id.in_(set(author_ids)), User.id != subscriber_id))
+        )
+        created: dict[int, int] = {}
+        if authors:
+            statement = insert(Subscribe).prefix_with("OR IGNORE").returning(Subscribe.authorId, Subscribe.id)
+            rows = [dict(authorId=author_id, subscriberId=subscriber_id) for author_id in authors]
+            created = {author_id: id for author_id, id in await self.session.execute(statement, rows)}
+
+        for author_id in created:
+            await self.session.execute(backfill(subscriber_id, author_id, settings.feed_backfill_size))
+
+        existing: dict[int, int] = {}
+        if rest := authors - created.keys():
+            query = select(Subscribe.authorId, Subscribe.id).filter(
+                Subscribe.subscriberId == subscriber_id, Subscribe.authorId.in_(rest)
+            )
+            existing = {author_id: id for author_id, id in await self.session.execute(query)}
+
+        await self.session.commit()
+        if created:
+            await RESPONSE_CACHE.bump(CacheScope.subscribes)
+
+        invalid = {subscriber_id: "Нельзя подписаться на самого себя"}
+        return link_results(author_ids, created, existing, "Автор не найден", invalid)
+
+    async def delete(self, s: Subscribe) -> None:
+        await self.session.execute(retract_author(s.subscriberId, s.authorId))
+        await self.session.delete(s)
+        await self.session.commit()
+        await RESPONSE_CACHE.bump(CacheScope.subscribes)
+
+    async def get_followers(
         self, author_id: int, search_params: PaginationSearchParams | None = None
-    ) -> tuple[list[Subscribe], int]:
+    ) -> Page[Subscribe]:
         search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Subscribe).filter(Subscribe.authorId == author_id)
+        query = await self._followers_query(author_id, search_params)
 
-        entity_query = (
-            query.filter(Subscribe.subscriber.has(User.login.icontains(search_params.q))) if search_params.q else query
-        )
+        return await self.keyset.fetch(self.session, query, search_params)
 
-        return entity_query.offset(search_params.offset).limit(search_params.limit).all(), query.count()
+    async def get_followers_validators(self, author_id: int, search_params: PaginationSearchParams) -> Validators:
+        query = await self._followers_query(author_id, search_params)
 
-    def get_subscriptions(
+        return await self.keyset.validators(self.session, query, search_params, Subscribe.updatedAt)
+
+    async def get_subscriptions(
         self, user_id: int, search_params: PaginationSearchParams | None = None
-    ) -> tuple[list[Subscribe], int]:
+    ) -> Page[Subscribe]:
         search_params = search_params or PaginationSearchParams.model_construct()
-        query = self.session.query(Subscribe).filter(Subscribe.subscriberId == user_id)
+        query = await self._subscriptions_query(user_id, search_params)
 
-        entity_query = (
-            query.filter(Subscribe.author.has(User.login.icontains(search_params.q))) if search_params.q else query
-        )
+        return await self.keyset.fetch(self.session, query, search_params)
+
+    async def get_subscriptions_validators(self, user_id: int, search_params: PaginationSearchParams) -> Validators:
+        query = await self._subscriptions_query(user_id, search_params)
+
+        return await self.keyset.validators(self.session, query, search_params, Subscribe.updatedAt)
+
+    async def _followers_query(self, author_id: int, search_params: PaginationSearchParams) -> Select[Any]:
+        query = select(Subscribe).filter(Subscribe.authorId == author_id)
+
+        if search_params.q:
+            query = query.filter(Subscribe.subscriber.has(await self._search_login(search_params.q)))
+
+        return query
+
+    async def _subscriptions_query(self, user_id: int, search_params: PaginationSearchParams) -> Select[Any]:
+        query = select(Subscribe).filter(Subscribe.subscriberId == user_id)
+
+        if search_params.q:
+            query = query.filter(Subscribe.author.has(await self._search_login(search_params.q)))
+
+        return query
 
-        return entity_query.offset(search_params.offset).limit(search_params.limit).all(), query.count()
+    async def _search_login(self, q: str) -> ColumnElement[bool]:
+        return await LOGIN_TRIGRAM.search(self.session, User.login, User.id, q)
 
 
 SubscribeRepositoryDepends = Annotated[SubscribeRepository, Depends()]
@@ -19,15 +19,15 @@ async def subscribe(
     if author_id == current_user.id:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Нельзя подписаться на самого себя")
 
-    author = user_repository.get_user_by_id(author_id)
+    author = await user_repository.get_user_by_id(author_id)
     if not author:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Автор не найден")
 
-    existing = subscribe_repository.get_by_author_and_subscriber(author_id, current_user.id)
+    existing = await subscribe_repository.get_by_author_and_subscriber(author_id, current_user.id)
     if existing:
         return existing
 
-    sub = subscribe_repository.create(author_id, current_user.id)
+    sub = await subscribe_repository.create(author_id, current_user.id)
     return sub
 
 
@@ -35,6 +35,6 @@ async def subscribe(
 async def unsubscribe(
     author_id: int, subscribe_repository: SubscribeRepositoryDepends, current_user: CurrentUserDepends
 ) -> None:
-    existing = subscribe_repository.get_by_author_and_subscriber(author_id, current_user.id)
+    existing = await subscribe_repository.get_by_author_and_subscriber(author_id, current_user.id)
     if existing:
-        subscribe_repository.delete(existing)
+        await subscribe_repository.delete(existing)
@@ -3,9 +3,14 @@ from datetime import datetime
 from pydantic import BaseModel, PositiveInt
 
 from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.batch import BatchItems
 from blog_system_backend.src.pagination import PaginationResponse
 
 
+class SubscribeBatchCreateRequest(BaseModel):
+    authorIds: BatchItems[PositiveInt]
+
+
 class SubscribeResponse(BaseModel):
     id: PositiveInt
     authorId: PositiveInt
@@ -1,25 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Response, status
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from blog_system_backend.src.api import router
-from blog_system_backend.src.db import ENGINE
+from blog_system_backend.src.cache import CHANNEL, RESPONSE_CACHE, listen
+from blog_system_backend.src.db import READ_ENGINE, WRITE_ENGINE
+from blog_system_backend.src.db.fts import load_tables
+from blog_system_backend.src.db.instrumentation import SQLInstrumentationMiddleware
 from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.settings import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with WRITE_ENGINE.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    await load_tables(WRITE_ENGINE)
+    await load_tables(READ_ENGINE)
+    await RESPONSE_CACHE.load()
+    invalidation = asyncio.create_task(listen(CHANNEL))
+
+    yield
+
+    invalidation.cancel()
+    await READ_ENGINE.dispose()
+    await WRITE_ENGINE.dispose()
+
 
 app = FastAPI(
     title="Blog API",
     version="0.0.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+if settings.sql_instrumentation:
+    app.add_middleware(SQLInstrumentationMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_headers=["*"],
     allow_methods=["*"],
     allow_origins=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-Base.metadata.create_all(ENGINE)
-
 app.include_router(router)
 
 
@@ -0,0 +1,91 @@
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from typing import Annotated, Any, TypeVar
+
+from fastapi import Query
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from blog_system_backend.src.settings import settings
+
+T = TypeVar("T")
+
+# Весь пакет проверяется до записи: ошибка в любом элементе — 422 с его индексом в `loc`, ничего не записано.
+BatchItems = Annotated[list[T], Field(min_length=1, max_length=settings.batch_max_size)]
+
+# Пакетное чтение: `?ids=3&ids=1`, не больше `BATCH_MAX_SIZE` id.
+BatchIds = Annotated[list[PositiveInt], Query(min_length=1, max_length=settings.batch_max_size)]
+
+
+class BatchItemStatus(StrEnum):
+    created = "created"
+    exists = "exists"
+    not_found = "not_found"
+    invalid = "invalid"
+
+
+class BatchItemResult(BaseModel):
+    index: NonNegativeInt
+    status: BatchItemStatus
+    id: PositiveInt | None = None
+    detail: str | None = None
+
+
+class BatchResponse(BaseModel):
+    """Результаты пакетной записи в порядке элементов запроса."""
+
+    results: list[BatchItemResult]
+
+
+async def insert_rows(
+    session: AsyncSession, id: InstrumentedAttribute[int], rows: Sequence[dict[str, Any]]
+) -> list[int]:
+    """Вставляет строки многострочными INSERT ... RETURNING и возвращает id в порядке строк.
+
+    С `sort_by_parameter_order` SQLAlchemy на SQLite вставляет по строке. Порядок RETURNING SQLite не обещает,
+    но автоинкрементные id внутри одной транзакции растут в порядке VALUES, поэтому достаточно их отсортировать.
+    """
+
+    return sorted(await session.scalars(insert(id.class_).returning(id), rows))
+
+
+def link_results(
+    ids: Sequence[int],
+    created: Mapping[int, int],
+    existing: Mapping[int, int],
+    not_found: str,
+    invalid: Mapping[int, str] | None = None,
+) -> list[BatchItemResult]:
+    """Результаты пакета связей по id цели (сохранения, подписки).
+
+    `created` и `existing` отображают id цели в id записи. Повтор цели в запросе получает `exists` с той же записью.
+    """
+
+    invalid = invalid or {}
+    results = []
+    seen: set[int] = set()
+
+    for index, target in enumerate(ids):
+        if target in invalid:
+            result = BatchItemResult(index=index, status=BatchItemStatus.invalid, detail=invalid[target])
+        elif target in created and target not in seen:
+            result = BatchItemResult(index=index, status=BatchItemStatus.created, id=created[target])
+        elif target in created or target in existing:
+            record = created.get(target) or existing[target]
+            result = BatchItemResult(index=index, status=BatchItemStatus.exists, id=record)
+        else:
+            result = BatchItemResult(index=index, status=BatchItemStatus.not_found, detail=not_found)
+
+        seen.add(target)
+        results.append(result)
+
+    return results
+
+
+def pick(ids: Sequence[int], found: Mapping[int, T]) -> tuple[list[T], list[int]]:
+    """Найденные записи в порядке запроса (повторы id схлопываются) и id, которых нет."""
+
+    requested = list(dict.fromkeys(ids))
+    return [found[id] for id in requested if id in found], [id for id in requested if id not in found]
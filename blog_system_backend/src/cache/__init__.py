@@ -0,0 +1,31 @@
+__all__ = [
+    "BACKEND",
+    "CHANNEL",
+    "CacheBackend",
+    "CacheScope",
+    "DataVersionChannel",
+    "InvalidationChannel",
+    "MISSING",
+    "MemoryBackend",
+    "RedisBackend",
+    "RedisChannel",
+    "Entry",
+    "FLIGHTS",
+    "SingleFlight",
+    "Validators",
+    "RESPONSE_CACHE",
+    "ResponseCache",
+    "TTLCache",
+    "cached",
+    "check_not_modified",
+    "listen",
+]
+
+from blog_system_backend.src.cache.backend import CacheBackend, MemoryBackend, RedisBackend
+from blog_system_backend.src.cache.conditional import Validators, check_not_modified
+from blog_system_backend.src.cache.invalidation import DataVersionChannel, InvalidationChannel, RedisChannel, listen
+from blog_system_backend.src.cache.response import RESPONSE_CACHE, Entry, ResponseCache, cached
+from blog_system_backend.src.cache.scopes import CacheScope
+from blog_system_backend.src.cache.shared import BACKEND, CHANNEL
+from blog_system_backend.src.cache.singleflight import FLIGHTS, SingleFlight
+from blog_system_backend.src.cache.ttl import MISSING, TTLCache
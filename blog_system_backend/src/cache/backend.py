@@ -0,0 +1,88 @@
+import pickle
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, cast
+
+from blog_system_backend.src.cache.ttl import MISSING, TTLCache
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class CacheBackend(ABC):
+    """Хранилище записей кэша и счетчиков версий, общих для всех воркеров, которые к нему подключены."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Возвращает значение или `MISSING`."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, *, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Увеличивает счетчик и возвращает новое значение."""
+
+    @abstractmethod
+    async def counters(self, *keys: str) -> list[int]: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryBackend(CacheBackend):
+    """Кэш в памяти процесса: LRU с ограничением по размеру и TTL. Каждый воркер хранит свою копию."""
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: float) -> None:
+        self.entries.set(key, value, ttl=ttl)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def counters(self, *keys: str) -> list[int]:
+        return [self._counters.get(key, 0) for key in keys]
+
+    async def clear(self) -> None:
+        self.entries.reset()
+        self._counters.clear()
+
+
+class RedisBackend(CacheBackend):
+    """Кэш в Redis (или совместимом по протоколу сервере), общий для всех воркеров.
+
+    Значения сериализуются через pickle, время жизни задается `PX`. Все ключи получают префикс `prefix`.
+    """
+
+    def __init__(self, client: "Redis", *, prefix: str = "blog:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(self.prefix + key)
+        return MISSING if raw is None else pickle.loads(cast(bytes, raw))
+
+    async def set(self, key: str, value: Any, *, ttl: float) -> None:
+        await self.client.set(self.prefix + key, pickle.dumps(value), px=max(int(ttl * 1000), 1))
+
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(self.prefix + key))
+
+    async def counters(self, *keys: str) -> list[int]:
+        if not keys:
+            return []
+
+        values = await self.client.mget([self.prefix + key for key in keys])
+        return [int(value or 0) for value in values]
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+
+        if keys:
+            await self.client.delete(*keys)
@@ -0,0 +1,69 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Self
+
+from fastapi import HTTPException, Request, Response, status
+from starlette.datastructures import Headers
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """Валидаторы условного GET: слабый ETag и Last-Modified, посчитанные без загрузки и сериализации ответа."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def from_parts(cls, *parts: Any, last_modified: datetime | None = None) -> Self:
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+        return cls(etag=f'W/"{digest}"', last_modified=last_modified)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+
+        if self.last_modified is not None:
+            # updatedAt хранится в UTC без часового пояса (CURRENT_TIMESTAMP).
+            headers["Last-Modified"] = format_datetime(self.last_modified.replace(tzinfo=UTC), usegmt=True)
+
+        return headers
+
+
+def is_not_modified(headers: Headers, validators: Validators) -> bool:
+    if_none_match = headers.get("if-none-match")
+
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or validators.etag.removeprefix("W/") in tags
+
+    if_modified_since = headers.get("if-modified-since")
+
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    # Для "-0000" и дат без зоны parsedate_to_datetime возвращает наивное время; по RFC 9110 это UTC.
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+
+    try:
+        return validators.last_modified.replace(tzinfo=UTC, microsecond=0) <= since
+    except TypeError:
+        return False
+
+
+def check_not_modified(request: Request, response: Response, validators: Validators | None) -> None:
+    """Выставляет валидаторы на ответ и прерывает запрос с 304, если у клиента актуальная версия."""
+    if validators is None:
+        return
+
+    response.headers.update(validators.headers)
+
+    if is_not_modified(request.headers, validators):
+        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=validators.headers)
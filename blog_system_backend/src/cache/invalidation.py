@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger("blog_system_backend.cache")
+
+PRAGMA_DATA_VERSION = text("PRAGMA data_version")
+
+# Обработчик получает сообщение другого воркера или None, если известно только, что данные изменились.
+Handler = Callable[[str | None], Awaitable[None]]
+
+
+class InvalidationChannel(ABC):
+    """Канал, по которому воркеры сообщают друг другу об изменениях данных.
+
+    `publish` рассылает сообщение остальным воркерам, `run` слушает канал и передает сообщения подписчикам.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: list[Handler] = []
+
+    def subscribe(self, handler: Handler) -> None:
+        self._handlers.append(handler)
+
+    async def dispatch(self, message: str | None) -> None:
+        for handler in self._handlers:
+            await handler(message)
+
+    @abstractmethod
+    async def publish(self, message: str) -> None: ...
+
+    @abstractmethod
+    async def run(self) -> None:
+        """Слушает канал до отмены задачи."""
+
+
+class DataVersionChannel(InvalidationChannel):
+    """Канал для кэша в памяти: опрашивает `PRAGMA data_version` SQLite.
+
+    Значение меняется после коммита из любого другого соединения, поэтому воркер узнает о записи соседа,
+    но не о том, что именно изменилось. Подписчики получают `None` и сбрасывают все.
+
+    Опрос идет через соединение писателя: все локальные записи проходят через него же и не меняют его
+    `data_version`, так что сброс вызывают только коммиты других процессов. Соединение берется из пула
+    лишь на время одного запроса и не мешает записям.
+    """
+
+    def __init__(self, engine: AsyncEngine, *, interval: float) -> None:
+        super().__init__()
+        self.engine = engine
+        self.interval = interval
+
+    async def publish(self, message: str) -> None:
+        # Сообщением служит сам коммит в базу.
+        pass
+
+    async def poll(self) -> tuple[object, int]:
+        async with self.engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            # Счетчик у каждого соединения свой: после переподключения пула сравнивать не с чем.
+            return raw.dbapi_connection, await connection.scalar(PRAGMA_DATA_VERSION)
+
+    async def run(self) -> None:
+        source, version = await self.poll()
+
+        while True:
+            await asyncio.sleep(self.interval)
+            current_source, current = await self.poll()
+
+            if current_source is not source or current != version:
+                await self.dispatch(None)
+
+            source, version = current_source, current
+
+
+class RedisChannel(InvalidationChannel):
+    """Канал через Redis pub/sub: каждое сообщение доходит до всех воркеров, включая отправителя."""
+
+    def __init__(self, client: "Redis", *, channel: str = "blog:invalidate") -> None:
+        super().__init__()
+        self.client = client
+        self.channel = channel
+
+    async def publish(self, message: str) -> None:
+        await self.client.publish(self.channel, message)
+
+    async def run(self) -> None:
+        async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+
+            async for message in pubsub.listen():
+                data = message["data"]
+                await self.dispatch(data.decode() if isinstance(data, bytes) else str(data))
+
+
+async def listen(channel: InvalidationChannel) -> None:
+    """Слушает канал, переподключаясь после ошибок."""
+
+    while True:
+        try:
+            await channel.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Канал инвалидации кэша упал, переподключение")
+            # Пока канал не работал, сообщения могли потеряться.
+            await channel.dispatch(None)
+            await asyncio.sleep(1)
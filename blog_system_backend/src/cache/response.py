@@ -0,0 +1,217 @@
+import functools
+import hashlib
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+from fastapi import HTTPException, Request, Response, status
+
+from blog_system_backend.src.cache.backend import CacheBackend
+from blog_system_backend.src.cache.conditional import Validators, is_not_modified
+from blog_system_backend.src.cache.invalidation import InvalidationChannel
+from blog_system_backend.src.cache.scopes import CacheScope
+from blog_system_backend.src.cache.shared import BACKEND, CHANNEL
+from blog_system_backend.src.cache.singleflight import FLIGHTS
+from blog_system_backend.src.cache.ttl import MISSING
+from blog_system_backend.src.settings import settings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    value: Any
+    headers: dict[str, str]
+    versions: tuple[int, ...]
+    stored_at: float
+
+
+class ResponseCache:
+    """Кэш результатов GET-эндпоинтов поверх `CacheBackend`.
+
+    Вместе с записью хранятся версии сущностей, от которых зависит ответ. Запись в репозитории увеличивает версию
+    сущности в бэкенде и рассылает ее по каналу инвалидации, поэтому во всех воркерах запись становится устаревшей.
+    Версии хранятся локально, чтобы проверка свежести не ходила в бэкенд.
+
+    Устаревшую запись можно отдать еще `stale_ttl` секунд после истечения `ttl`, пока ее пересчитывает
+    другой запрос (stale-while-revalidate).
+    """
+
+    def __init__(
+        self, backend: CacheBackend, channel: InvalidationChannel, *, ttl: float, stale_ttl: float = 0
+    ) -> None:
+        self.backend = backend
+        self.channel = channel
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._versions: dict[CacheScope, int] = {}
+
+        channel.subscribe(self._on_message)
+
+    def version(self, scope: CacheScope) -> int:
+        return self._versions.get(scope, 0)
+
+    def versions(self, scopes: tuple[CacheScope, ...]) -> tuple[int, ...]:
+        return tuple(self.version(scope) for scope in scopes)
+
+    async def load(self) -> None:
+        """Подтягивает версии из бэкенда при старте воркера."""
+
+        counters = await self.backend.counters(*(_version_key(scope) for scope in CacheScope))
+        self._versions = dict(zip(CacheScope, counters))
+
+    async def bump(self, *scopes: CacheScope) -> None:
+        for scope in scopes:
+            version = await self.backend.incr(_version_key(scope))
+            self._versions[scope] = max(self.version(scope) + 1, version)
+            await self.channel.publish(f"scope:{scope}:{version}")
+
+    async def get(self, key: str, versions: tuple[int, ...], *, allow_stale: bool = False) -> Entry | None:
+        """Возвращает свежую запись или, если `allow_stale`, устаревшую не дольше `stale_ttl`."""
+
+        entry = await self.backend.get(key)
+
+        if entry is not MISSING:
+            age = time.time() - entry.stored_at
+
+            if entry.versions == versions and age <= self.ttl:
+                self.hits += 1
+                return entry  # type: ignore[no-any-return]
+
+            if allow_stale and age <= self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                return entry  # type: ignore[no-any-return]
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, entry: Entry) -> None:
+        await self.backend.set(key, entry, ttl=self.ttl + self.stale_ttl)
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self._versions.clear()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def _on_message(self, message: str | None) -> None:
+        if message is None:
+            for scope in CacheScope:
+                self._versions[scope] = max(self.version(scope) + 1, await self.backend.incr(_version_key(scope)))
+            return
+
+        kind, _, rest = message.partition(":")
+        if kind != "scope":
+            return
+
+        name, _, version = rest.partition(":")
+        scope = CacheScope(name)
+        self._versions[scope] = max(self.version(scope), int(version))
+
+
+RESPONSE_CACHE = ResponseCache(
+    BACKEND, CHANNEL, ttl=settings.response_cache_ttl, stale_ttl=settings.stale_while_revalidate
+)
+
+
+def cached(*scopes: CacheScope) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Кэширует результат эндпоинта. Ставится под декоратором роутера.
+
+    Ключ строится из шаблона маршрута, параметров пути и запроса и пользователя (`current_user`), ответ свежий,
+    пока не изменились версии перечисленных сущностей. Заголовки, выставленные эндпоинтом на `response`,
+    сохраняются вместе с ответом. Одновременные одинаковые запросы при промахе вычисляются один раз (`FLIGHTS`).
+    """
+
+    def decorator(endpoint: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(endpoint)
+        parameters = list(signature.parameters.values())
+
+        # FastAPI передает Request только в один параметр, поэтому используем параметр эндпоинта, если он есть.
+        request_name = next((p.name for p in parameters if p.annotation is Request), None)
+        if request_name is None:
+            parameters.append(inspect.Parameter("cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if request_name is None:
+                request: Request = kwargs.pop("cache_request")  # type: ignore[assignment]
+            else:
+                request = kwargs[request_name]  # type: ignore[assignment]
+
+            if not settings.response_cache and not settings.single_flight:
+                return await endpoint(*args, **kwargs)
+
+            key = _key(request, kwargs.get("current_user"))
+            flight = _flight_key(key, request)
+            versions = RESPONSE_CACHE.versions(scopes)
+            response = kwargs.get("response")
+
+            if settings.response_cache:
+                entry = await RESPONSE_CACHE.get(key, versions, allow_stale=FLIGHTS.in_flight(flight))
+
+                if entry is not None:
+                    if "etag" in entry.headers and is_not_modified(
+                        request.headers, Validators(etag=entry.headers["etag"])
+                    ):
+                        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=entry.headers)
+
+                    if isinstance(response, Response):
+                        response.headers.update(entry.headers)
+
+                    return entry.value  # type: ignore[no-any-return]
+
+            async def compute() -> tuple[R, dict[str, str]]:
+                value = await endpoint(*args, **kwargs)
+                headers = dict(response.headers) if isinstance(response, Response) else {}
+                headers.pop("content-length", None)
+
+                if settings.response_cache:
+                    # Версии взяты до вычисления: запись, случившаяся во время него, оставит ответ устаревшим.
+                    await RESPONSE_CACHE.set(key, Entry(value, headers, versions, time.time()))
+
+                return value, headers
+
+            if settings.single_flight:
+                value, headers = await FLIGHTS.do(flight, compute, timeout=settings.single_flight_timeout)
+            else:
+                value, headers = await compute()
+
+            if isinstance(response, Response):
+                response.headers.update(headers)
+
+            return value
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+
+        return wrapper
+
+    return decorator
+
+
+def _key(request: Request, viewer: Any) -> str:
+    route = request.scope.get("route")
+
+    parts = (
+        getattr(route, "path", request.url.path),
+        tuple(sorted(request.path_params.items())),
+        tuple(sorted(request.query_params.multi_items())),
+        getattr(viewer, "id", None),
+    )
+
+    return "response:" + hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _flight_key(key: str, request: Request) -> str:
+    # Ответ 304 зависит от условных заголовков, поэтому запросы с разными заголовками не объединяются.
+    return f"{key}:{request.headers.get('if-none-match')}:{request.headers.get('if-modified-since')}"
+
+
+def _version_key(scope: CacheScope) -> str:
+    return f"version:{scope}"
@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class CacheScope(StrEnum):
+    users = "users"
+    posts = "posts"
+    comments = "comments"
+    categories = "categories"
+    saved_posts = "saved_posts"
+    subscribes = "subscribes"
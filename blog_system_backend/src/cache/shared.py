@@ -0,0 +1,21 @@
+from blog_system_backend.src.cache.backend import CacheBackend, MemoryBackend, RedisBackend
+from blog_system_backend.src.cache.invalidation import DataVersionChannel, InvalidationChannel, RedisChannel
+from blog_system_backend.src.db import WRITE_ENGINE
+from blog_system_backend.src.settings import CacheBackendType, settings
+
+
+def create_cache() -> tuple[CacheBackend, InvalidationChannel]:
+    if settings.cache_backend == CacheBackendType.redis:
+        from redis.asyncio import Redis
+
+        client = Redis.from_url(settings.redis_url)
+
+        return RedisBackend(client), RedisChannel(client)
+
+    return (
+        MemoryBackend(maxsize=settings.lru_cache_size, ttl=settings.response_cache_ttl),
+        DataVersionChannel(WRITE_ENGINE, interval=settings.cache_poll_interval),
+    )
+
+
+BACKEND, CHANNEL = create_cache()
@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Объединяет одновременные одинаковые вычисления в одно.
+
+    Первый запрос с ключом выполняет вычисление, остальные ждут его результат (или исключение) не дольше
+    `timeout` секунд и после этого считают сами. Если первый запрос отменен, ожидающие тоже считают сами.
+    Работает в пределах одного воркера.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self.timeouts = 0
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._flights
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]], *, timeout: float) -> T:
+        future = self._flights.get(key)
+
+        if future is not None:
+            self.shared += 1
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except TimeoutError:
+                self.timeouts += 1
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+            return await fn()
+
+        future = asyncio.get_running_loop().create_future()
+        # Исключение могут не забрать, если ожидающих не было.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._flights[key] = future
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+
+
+FLIGHTS = SingleFlight()
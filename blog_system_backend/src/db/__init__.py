@@ -1,3 +1,23 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-ENGINE = create_engine("sqlite:///./data/database.db", echo=True)
+from blog_system_backend.src.db.fts import register_functions
+from blog_system_backend.src.db.instrumentation import instrument
+from blog_system_backend.src.db.pragmas import apply_pragmas, resolve_pragmas
+from blog_system_backend.src.settings import settings
+
+# SQLite допускает только одного писателя: все записи идут через одно соединение,
+# а чтения в WAL выполняются параллельно через отдельный пул соединений только для чтения.
+WRITE_ENGINE = create_async_engine(settings.database_url, pool_size=1, max_overflow=0)
+READ_ENGINE = create_async_engine(settings.database_url, pool_size=settings.database_read_pool_size, max_overflow=0)
+
+apply_pragmas(WRITE_ENGINE, resolve_pragmas(settings.sqlite))
+apply_pragmas(READ_ENGINE, resolve_pragmas(settings.sqlite), query_only=True)
+register_functions(WRITE_ENGINE)
+register_functions(READ_ENGINE)
+
+if settings.sql_instrumentation:
+    instrument(WRITE_ENGINE)
+    instrument(READ_ENGINE)
+
+WRITE_SESSION_FACTORY = async_sessionmaker(WRITE_ENGINE, expire_on_commit=False)
+READ_SESSION_FACTORY = async_sessionmaker(READ_ENGINE, expire_on_commit=False)
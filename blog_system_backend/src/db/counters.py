@@ -0,0 +1,72 @@
+__all__ = [
+    "Counter",
+    "rebuild_counters",
+]
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Connection, FromClause, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class Counter:
+    """Денормализованное количество строк `source` на запись `target`, которое поддерживают триггеры SQLite.
+
+    Триггеры срабатывают в той же транзакции, что и запись в `source`, поэтому счетчик не расходится с данными
+    ни при записи через репозитории, ни при массовых запросах. `updatedAt` цели они не трогают: валидаторы
+    и кэш ответов учитывают счетчики отдельно.
+    """
+
+    def __init__(self, target: str, column: str, source: str, foreign_key: str) -> None:
+        self.target = target
+        self.column = column
+        self.source = source
+        self.foreign_key = foreign_key
+        self.name = f"{target}_{column}"
+
+    @property
+    def create_statements(self) -> tuple[str, ...]:
+        name, target, col, source, fk = self.name, self.target, self.column, self.source, self.foreign_key
+        increment = f'UPDATE {target} SET "{col}" = "{col}" + 1 WHERE id = new."{fk}";'
+        decrement = f'UPDATE {target} SET "{col}" = "{col}" - 1 WHERE id = old."{fk}";'
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {source} BEGIN {increment} END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {source} BEGIN {decrement} END",
+            f'CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF "{fk}" ON {source} '
+            f'WHEN old."{fk}" IS NOT new."{fk}" BEGIN {decrement} {increment} END',
+        )
+
+    @property
+    def drop_statements(self) -> tuple[str, ...]:
+        return (
+            f"DROP TRIGGER IF EXISTS {self.name}_update",
+            f"DROP TRIGGER IF EXISTS {self.name}_delete",
+            f"DROP TRIGGER IF EXISTS {self.name}_insert",
+        )
+
+    @property
+    def rebuild_statement(self) -> str:
+        return (
+            f'UPDATE {self.target} SET "{self.column}" = '
+            f'(SELECT count(*) FROM {self.source} WHERE {self.source}."{self.foreign_key}" = {self.target}.id)'
+        )
+
+    def attach(self, source: FromClause) -> None:
+        event.listen(source, "after_create", self._create)
+
+    def _create(self, target: Any, connection: Connection, **kw: Any) -> None:
+        if connection.dialect.name != "sqlite":
+            return
+
+        for statement in self.create_statements:
+            connection.exec_driver_sql(statement)
+
+
+async def rebuild_counters(session: AsyncSession, counters: Iterable[Counter]) -> None:
+    """Пересчитывает счетчики по данным одной транзакцией."""
+
+    for counter in counters:
+        await session.execute(text(counter.rebuild_statement))
+
+    await session.commit()
@@ -1,21 +1,35 @@
-from typing import Annotated, Iterator
+from typing import Annotated, AsyncIterator
 
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from blog_system_backend.src.db import ENGINE
+from blog_system_backend.src.db import READ_SESSION_FACTORY, WRITE_SESSION_FACTORY
 
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-def get_session() -> Iterator[Session]:
-    session = Session(ENGINE)
+
+async def _get_session(factory: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncSession]:
+    session = factory()
 
     try:
         yield session
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
+
+
+async def get_write_session() -> AsyncIterator[AsyncSession]:
+    async for session in _get_session(WRITE_SESSION_FACTORY):
+        yield session
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
+    factory = READ_SESSION_FACTORY if request.method in READ_METHODS else WRITE_SESSION_FACTORY
+
+    async for session in _get_session(factory):
+        yield session
 
 
-SessionDepends = Annotated[Session, Depends(get_session)]
+SessionDepends = Annotated[AsyncSession, Depends(get_session)]
@@ -0,0 +1,33 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from blog_system_backend.src.db.mixins import audit_timestamp
+from blog_system_backend.src.settings import settings
+
+
+async def stream_rows(
+    session: AsyncSession,
+    query: Select[Any],
+    updated_at: InstrumentedAttribute[datetime],
+    id: InstrumentedAttribute[int],
+    since: datetime | None = None,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Читает результат серверным курсором пачками по `export_chunk_size` строк в порядке (updatedAt, id).
+
+    Запрос должен выбирать колонки, а не ORM-сущности: строки не попадают в identity map сессии,
+    поэтому память не растет вместе с таблицей.
+    """
+
+    if since is not None:
+        query = query.filter(updated_at >= audit_timestamp(since))
+
+    query = query.order_by(updated_at, id).execution_options(yield_per=settings.export_chunk_size)
+    result = await session.stream(query)
+
+    async for rows in result.partitions():
+        yield rows
@@ -0,0 +1,156 @@
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Engine,
+    FromClause,
+    column,
+    event,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+TRIGRAM_SIMILARITY_THRESHOLD = 0.3
+
+_tables: WeakKeyDictionary[Engine, frozenset[str]] = WeakKeyDictionary()
+
+
+def fts5_supported(connection: Connection) -> bool:
+    if connection.dialect.name != "sqlite":
+        return False
+
+    return bool(connection.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+async def load_tables(engine: AsyncEngine) -> None:
+    """Запоминает таблицы базы для has_table(): вызывается при старте, поиск не ходит за этим в sqlite_master."""
+    names: frozenset[str] = frozenset()
+
+    if engine.dialect.name == "sqlite":
+        async with engine.connect() as connection:
+            names = frozenset(await connection.scalars(text("SELECT name FROM sqlite_master WHERE type = 'table'")))
+
+    _tables[engine.sync_engine] = names
+
+
+def has_table(session: AsyncSession, name: str) -> bool:
+    """Есть ли в базе таблица полнотекстового индекса. Для движка без load_tables() — нет, поиск идет через LIKE."""
+    bind = session.get_bind()
+    engine = bind.engine if isinstance(bind, Connection) else bind
+
+    return name in _tables.get(engine, frozenset())
+
+
+def trigrams(value: str) -> set[str]:
+    value = value.lower()
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+def trigram_similarity(left: str | None, right: str | None) -> float:
+    """Похожесть строк по общим триграммам (как similarity() в pg_trgm): слова дополняются пробелами по краям."""
+    if not left or not right:
+        return 0.0
+
+    a = set().union(*(trigrams(f"  {word} ") for word in left.split()))
+    b = set().union(*(trigrams(f"  {word} ") for word in right.split()))
+
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def _phrase(value: str) -> str:
+    return '"{}"'.format(value.replace('"', '""'))
+
+
+def register_functions(engine: Engine | AsyncEngine) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "connect")
+    def create_functions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.create_function("trigram_similarity", 2, trigram_similarity, deterministic=True)
+
+
+class TrigramIndex:
+    """Таблица FTS5 с токенизатором trigram над одной текстовой колонкой, синхронизируемая триггерами.
+
+    Запросы от трех символов ищутся по подстроке через триграммы; в более коротких триграмм нет, и они ищутся
+    через LIKE '%q%'. Если подстрока не нашлась нигде, ищутся похожие значения: кандидаты с общими триграммами
+    отбираются индексом и проверяются trigram_similarity().
+    """
+
+    def __init__(self, table_name: str, column_name: str) -> None:
+        self.table_name = table_name
+        self.column_name = column_name
+        self.name = f"{table_name}_{column_name}_trgm"
+        self.table = table(self.name, column("rowid"), column(column_name))
+
+    @property
+    def create_statements(self) -> tuple[str, ...]:
+        name, source, col = self.name, self.table_name, self.column_name
+        return (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5("
+            f"{col}, content='{source}', content_rowid='id', tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {name}(rowid, {col}) VALUES (new.id, new.{col}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {name}({name}, rowid, {col}) VALUES ('delete', old.id, old.{col}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF {col} ON {source} BEGIN "
+            f"INSERT INTO {name}({name}, rowid, {col}) VALUES ('delete', old.id, old.{col}); "
+            f"INSERT INTO {name}(rowid, {col}) VALUES (new.id, new.{col}); END",
+        )
+
+    @property
+    def drop_statements(self) -> tuple[str, ...]:
+        return (
+            f"DROP TRIGGER IF EXISTS {self.name}_update",
+            f"DROP TRIGGER IF EXISTS {self.name}_delete",
+            f"DROP TRIGGER IF EXISTS {self.name}_insert",
+            f"DROP TABLE IF EXISTS {self.name}",
+        )
+
+    @property
+    def rebuild_statement(self) -> str:
+        return f"INSERT INTO {self.name}({self.name}) VALUES ('rebuild')"
+
+    def attach(self, target: FromClause) -> None:
+        event.listen(target, "after_create", self._create)
+        event.listen(target, "before_drop", self._drop)
+
+    async def search(
+        self, session: AsyncSession, attribute: InstrumentedAttribute[str], id: InstrumentedAttribute[int], q: str
+    ) -> ColumnElement[bool]:
+        if len(q) < 3 or not has_table(session, self.name):
+            return attribute.icontains(q)
+
+        match = literal_column(self.name).op("MATCH")
+        substring = select(self.table.c.rowid).filter(match(_phrase(q)))
+
+        if await session.scalar(select(substring.exists())):
+            return id.in_(substring)
+
+        similar = select(self.table.c.rowid).filter(
+            match(" OR ".join(_phrase(gram) for gram in sorted(trigrams(q)))),
+            func.trigram_similarity(self.table.c[self.column_name], q) >= TRIGRAM_SIMILARITY_THRESHOLD,
+        )
+
+        return id.in_(similar)
+
+    def _create(self, target: Any, connection: Connection, **kw: Any) -> None:
+        if not fts5_supported(connection):
+            return
+
+        for statement in self.create_statements:
+            connection.exec_driver_sql(statement)
+
+    def _drop(self, target: Any, connection: Connection, **kw: Any) -> None:
+        if connection.dialect.name != "sqlite":
+            return
+
+        for statement in self.drop_statements:
+            connection.exec_driver_sql(statement)
@@ -0,0 +1,144 @@
+__all__ = [
+    "QueryStats",
+    "SQLInstrumentationMiddleware",
+    "capture_queries",
+    "fingerprint",
+    "instrument",
+]
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from blog_system_backend.src.settings import settings
+
+logger = logging.getLogger("blog_system_backend.sql")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Нормализует SQL: литералы и списки параметров заменяются на `?`, пробелы схлопываются."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("?+", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStats:
+    scope: Scope | None = None
+    query_count: int = 0
+    total_time: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def route(self) -> str | None:
+        if self.scope is None:
+            return None
+
+        # FastAPI кладёт найденный маршрут в scope после роутинга, до вызова обработчика.
+        route = self.scope.get("route")
+        return f"{self.scope['method']} {getattr(route, 'path', self.scope['path'])}"
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.query_count += 1
+        self.total_time += elapsed
+        self.fingerprints[fingerprint(statement)] += 1
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def capture_queries(scope: Scope | None = None) -> Iterator[QueryStats]:
+    stats = QueryStats(scope=scope)
+    token = _query_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = _query_stats.get()
+
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if settings.slow_query_log and elapsed * 1000 >= settings.slow_query_threshold_ms:
+        route = stats.route if stats else None
+        logger.warning(
+            "Slow query %.1f ms [%s]: %s",
+            elapsed * 1000,
+            route or "-",
+            fingerprint(statement),
+            extra={"route": route, "duration_ms": elapsed * 1000, "statement": fingerprint(statement)},
+        )
+
+
+def instrument(engine: Engine | AsyncEngine) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLInstrumentationMiddleware:
+    """Собирает количество запросов, суммарное время в БД и отпечатки запросов для каждого HTTP-запроса.
+
+    Итог пишется в лог на уровне DEBUG и отдаётся клиенту заголовком `Server-Timing`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture_queries(scope) as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing", f'db;dur={stats.total_time * 1000:.1f};desc="{stats.query_count} queries"'
+                    )
+
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        logger.debug(
+            "%s: %d queries, %.1f ms",
+            stats.route,
+            stats.query_count,
+            stats.total_time * 1000,
+            extra={
+                "route": stats.route,
+                "query_count": stats.query_count,
+                "duration_ms": stats.total_time * 1000,
+                "fingerprints": dict(stats.fingerprints),
+            },
+        )
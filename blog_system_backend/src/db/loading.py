@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Self
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, load_only, raiseload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+from blog_system_backend.src.fieldsets import Fieldset
+
+
+@dataclass(frozen=True, slots=True)
+class LoadingProfile:
+    """Что эндпоинт читает у сущности: связи (в том числе вложенные профили) и, если задано, только часть колонок.
+
+    Коллекции загружаются selectinload (один запрос на страницу), ссылки на одну запись — joinedload (в том же
+    запросе). Остальные связи помечены raiseload: незапланированная ленивая загрузка падает сразу, а не
+    превращается в запрос на каждую строку. Профиль только для чтения: не используйте его перед изменением
+    или удалением сущности.
+    """
+
+    entity: type[Any]
+    relationships: tuple[str, ...] = ()
+    nested: dict[str, "LoadingProfile"] = field(default_factory=dict)
+    columns: frozenset[str] | None = None
+
+    def narrow(self, fieldset: Fieldset[Any] | None, path: str | None = None) -> Self:
+        """Оставляет колонки и связи, выбранные в `fieldset`. `path` — связь, к сущности которой относится ответ."""
+
+        if fieldset is None:
+            return self
+
+        if path is not None:
+            return replace(self, nested={**self.nested, path: self.nested[path].narrow(fieldset)})
+
+        return replace(
+            self,
+            relationships=tuple(name for name in self.relationships if name in fieldset),
+            nested={name: profile for name, profile in self.nested.items() if name in fieldset},
+            columns=fieldset.names,
+        )
+
+    def options(self, *required: InstrumentedAttribute[Any]) -> list[_AbstractLoad]:
+        """Опции загрузки; `required` — колонки, нужные самому запросу (например, ключи курсора)."""
+
+        mapper = inspect(self.entity)
+        options: list[_AbstractLoad] = []
+
+        if self.columns is not None:
+            columns = [getattr(self.entity, name) for name in self.columns if name in mapper.column_attrs]
+            options.append(load_only(*required, *columns, raiseload=True))
+
+        for name in (*self.relationships, *self.nested):
+            attribute = getattr(self.entity, name)
+            loader = selectinload(attribute) if mapper.relationships[name].uselist else joinedload(attribute)
+
+            if name in self.nested:
+                loader = loader.options(*self.nested[name].options())
+
+            options.append(loader)
+
+        options.append(raiseload("*"))
+
+        return options
@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, String, func, literal
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -14,3 +14,17 @@ class AttributeUpdaterMixin:
 class AuditMixin:
     createdAt: Mapped[datetime] = mapped_column(server_default=func.now())
     updatedAt: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
+
+
+def audit_timestamp(moment: datetime) -> ColumnElement[str]:
+    """Литерал для сравнения с `createdAt`/`updatedAt`.
+
+    SQLite хранит даты строками в UTC, а func.now() пишет их без микросекунд. Сравниваем с той же строкой,
+    которую хранит база, иначе порядок в фильтре разойдется с ORDER BY.
+    """
+
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC).replace(tzinfo=None)
+
+    timespec = "microseconds" if moment.microsecond else "seconds"
+    return literal(moment.isoformat(sep=" ", timespec=timespec), String)
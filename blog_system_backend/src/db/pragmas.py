@@ -0,0 +1,84 @@
+__all__ = [
+    "SQLITE_PROFILES",
+    "SQLitePragmas",
+    "apply_pragmas",
+    "resolve_pragmas",
+]
+
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from blog_system_backend.src.settings import SQLiteProfile, SQLiteSettings
+
+
+class SQLitePragmas(BaseModel):
+    journal_mode: str
+    synchronous: str
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    busy_timeout: int
+
+
+SQLITE_PROFILES: dict[SQLiteProfile, SQLitePragmas] = {
+    # Значения SQLite по умолчанию: rollback journal, synchronous=FULL, кэш ~2 МБ, без mmap.
+    SQLiteProfile.default: SQLitePragmas(
+        journal_mode="delete",
+        synchronous="full",
+        cache_size=-2000,
+        mmap_size=0,
+        temp_store="default",
+        busy_timeout=0,
+    ),
+    # WAL: читатели не блокируют писателя. synchronous=NORMAL в WAL не теряет целостность,
+    # только последние транзакции при отключении питания.
+    SQLiteProfile.production: SQLitePragmas(
+        journal_mode="wal",
+        synchronous="normal",
+        cache_size=-64000,
+        mmap_size=268435456,
+        temp_store="memory",
+        busy_timeout=5000,
+    ),
+    SQLiteProfile.durable: SQLitePragmas(
+        journal_mode="wal",
+        synchronous="full",
+        cache_size=-64000,
+        mmap_size=268435456,
+        temp_store="memory",
+        busy_timeout=5000,
+    ),
+    # База пересоздаётся на каждый тест, поэтому надёжность записи не нужна.
+    SQLiteProfile.test: SQLitePragmas(
+        journal_mode="memory",
+        synchronous="off",
+        cache_size=-16000,
+        mmap_size=0,
+        temp_store="memory",
+        busy_timeout=5000,
+    ),
+}
+
+
+def resolve_pragmas(sqlite: SQLiteSettings) -> SQLitePragmas:
+    overrides = sqlite.model_dump(exclude={"profile"}, exclude_none=True)
+    return SQLITE_PROFILES[sqlite.profile].model_copy(update=overrides)
+
+
+def apply_pragmas(engine: Engine | AsyncEngine, pragmas: SQLitePragmas, *, query_only: bool = False) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+
+        for name, value in pragmas.model_dump().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
+
+        cursor.close()
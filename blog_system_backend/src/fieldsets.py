@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Annotated, Any, Generic, Self, TypeVar
+
+from fastapi import Depends, HTTPException, status
+from pydantic import BaseModel, PrivateAttr, SerializationInfo, SerializerFunctionWrapHandler, model_serializer
+from pydantic_core import to_jsonable_python
+
+
+class View(StrEnum):
+    full = "full"
+    summary = "summary"
+
+
+class SparseModel(BaseModel):
+    """Модель ответа, из которой клиент может запросить только часть полей (`fields=`).
+
+    Неполный экземпляр собирается без валидации и при сериализации отдает только выбранные поля.
+    """
+
+    _fields: frozenset[str] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_attributes(cls, obj: Any, fields: frozenset[str] | None = None, **values: Any) -> Self:
+        """Читает поля модели из атрибутов `obj`, `values` переопределяют вычисляемые поля.
+
+        С `fields` читаются только выбранные атрибуты: остальные могут быть не загружены из БД.
+        """
+
+        names = cls.model_fields.keys() if fields is None else fields
+        data = {name: values[name] if name in values else getattr(obj, name) for name in names}
+
+        if fields is None:
+            return cls(**data)
+
+        instance = cls.model_construct(**data)
+        instance._fields = fields
+        return instance
+
+    # Без аннотации возврата pydantic строит JSON-схему по полям модели.
+    @model_serializer(mode="wrap")
+    def _serialize_fields(  # type: ignore[no-untyped-def]
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        if self._fields is None:
+            return handler(self)
+
+        # Порядок ключей — порядок полей модели, а не итерации по множеству.
+        data = {name: getattr(self, name) for name in type(self).model_fields if name in self._fields}
+        return to_jsonable_python(data) if info.mode_is_json() else data
+
+
+M = TypeVar("M", bound=SparseModel)
+S = TypeVar("S", bound=SparseModel)
+
+
+@dataclass(frozen=True, slots=True)
+class Fieldset(Generic[M]):
+    """Модель ответа списка и выбранные в ней поля (`None` — все)."""
+
+    model: type[M]
+    fields: frozenset[str] | None = None
+
+    @property
+    def names(self) -> frozenset[str]:
+        return frozenset(self.model.model_fields) if self.fields is None else self.fields
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+
+class FieldsetParams(BaseModel):
+    view: View = View.full
+    fields: str | None = None
+
+    def select(self, full: type[M], summary: type[S]) -> Fieldset[M] | Fieldset[S]:
+        if self.view == View.summary:
+            return self._narrow(summary)
+
+        return self._narrow(full)
+
+    def _narrow(self, model: type[M]) -> Fieldset[M]:
+        if self.fields is None:
+            return Fieldset(model)
+
+        fields = frozenset(name.strip() for name in self.fields.split(",") if name.strip())
+        unknown = fields - model.model_fields.keys()
+
+        if unknown:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Неизвестные поля: {', '.join(sorted(unknown))}")
+
+        return Fieldset(model, fields | {"id"})
+
+
+FieldsetParamsDepends = Annotated[FieldsetParams, Depends(FieldsetParams)]
@@ -1,16 +1,26 @@
 __all__ = [
+    "Keyset",
+    "Page",
     "PaginationResponse",
     "PaginationSearchParams",
+    "PaginationSearchParamsCursor",
     "PaginationSearchParamsDepends",
+    "PaginationSearchParamsIncludeTotal",
     "PaginationSearchParamsLimit",
     "PaginationSearchParamsOffset",
     "PaginationSearchParamsQ",
+    "decode_cursor",
+    "encode_cursor",
 ]
 
 from blog_system_backend.src.pagination.deps import PaginationSearchParamsDepends
 from blog_system_backend.src.pagination.fields import (
+    PaginationSearchParamsCursor,
+    PaginationSearchParamsIncludeTotal,
     PaginationSearchParamsLimit,
     PaginationSearchParamsOffset,
     PaginationSearchParamsQ,
 )
+from blog_system_backend.src.pagination.keyset import Keyset, decode_cursor, encode_cursor
+from blog_system_backend.src.pagination.page import Page
 from blog_system_backend.src.pagination.schemas import PaginationResponse, PaginationSearchParams
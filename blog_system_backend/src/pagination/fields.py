@@ -25,3 +25,17 @@ PaginationSearchParamsOffset = Annotated[
         default=0,
     ),
 ]
+
+PaginationSearchParamsCursor = Annotated[
+    str | None,
+    Field(
+        default=None,
+    ),
+]
+
+PaginationSearchParamsIncludeTotal = Annotated[
+    bool,
+    Field(
+        default=True,
+    ),
+]
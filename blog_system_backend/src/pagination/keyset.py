@@ -0,0 +1,152 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, ScalarSelect, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from blog_system_backend.src.cache.conditional import Validators
+from blog_system_backend.src.db.mixins import audit_timestamp
+from blog_system_backend.src.pagination.page import Page
+from blog_system_backend.src.pagination.schemas import PaginationSearchParams
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Некорректный курсор пагинации") from None
+
+    if not isinstance(values, list):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Некорректный курсор пагинации")
+
+    return values
+
+
+class Keyset:
+    """Стабильный порядок сортировки списка для курсорной пагинации.
+
+    Последним ключом всегда должен идти `id`, чтобы порядок был однозначным при совпадающих значениях.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute[Any], descending: bool = False) -> None:
+        self.columns = columns
+        self.descending = descending
+
+    def paginate(self, query: Select[Any], search_params: PaginationSearchParams) -> Select[Any]:
+        query = query.order_by(*(column.desc() if self.descending else column for column in self.columns))
+
+        if search_params.cursor is None:
+            return query.offset(search_params.offset).limit(search_params.limit)
+
+        keys = tuple_(*self.columns)
+        bound = tuple_(*self._bind_values(decode_cursor(search_params.cursor)))
+
+        return query.filter(keys < bound if self.descending else keys > bound).limit(search_params.limit)
+
+    async def fetch(
+        self, session: AsyncSession, query: Select[Any], search_params: PaginationSearchParams
+    ) -> Page[Any]:
+        """Страница и общее количество одним запросом: количество — некоррелированный подзапрос COUNT(*).
+
+        COUNT(*) OVER() здесь не подходит: окно материализует и сортирует весь список еще до LIMIT, то есть каждая
+        страница стоит полного прохода с сортировкой. С подзапросом страница читается по индексу сортировки с LIMIT,
+        а количество SQLite вычисляет один раз, обычно по покрывающему индексу. Цена — второй проход по списку внутри
+        того же запроса, с поиском без FTS это повтор LIKE; кому количество не нужно, передают include_total=false.
+
+        Подзапрос не видит фильтра курсора, поэтому и в курсорном режиме количество — по всему списку. Лишняя
+        (limit + 1) строка показывает, есть ли следующая страница.
+        """
+        paginated = self.paginate(query, search_params).limit(search_params.limit + 1)
+
+        if search_params.include_total:
+            paginated = paginated.add_columns(self._total(query))
+
+        rows = (await session.execute(paginated)).all()
+        items = [row[0] for row in rows]
+        has_next_page = len(items) > search_params.limit
+        items = items[: search_params.limit]
+        total_items = None
+
+        if search_params.include_total:
+            if rows:
+                total_items = rows[0][1]
+            elif search_params.offset or search_params.cursor is not None:
+                # Страница за концом списка: подзапросу не к чему было приложиться.
+                total_items = await self._count(session, query)
+            else:
+                total_items = 0
+
+        return Page(
+            items=items,
+            total_items=total_items,
+            has_next_page=has_next_page,
+            next_cursor=self._cursor(items[-1]) if has_next_page else None,
+        )
+
+    async def validators(
+        self,
+        session: AsyncSession,
+        query: Select[Any],
+        search_params: PaginationSearchParams,
+        updated_at: InstrumentedAttribute[datetime],
+        *columns: ColumnElement[Any] | InstrumentedAttribute[Any],
+    ) -> Validators:
+        """Валидаторы страницы по id и updatedAt ее строк (и общему количеству) без загрузки самих сущностей.
+
+        `query` не должен содержать опций загрузки: из него выбираются только нужные колонки.
+        """
+        light = query.with_only_columns(self.columns[-1], updated_at, *columns)
+        paginated = self.paginate(light, search_params)
+
+        if search_params.include_total:
+            paginated = paginated.add_columns(self._total(light))
+
+        rows = [tuple(row) for row in await session.execute(paginated)]
+        last_modified = max((row[1] for row in rows), default=None)
+
+        return Validators.from_parts(*rows, last_modified=last_modified)
+
+    def _cursor(self, item: Any) -> str:
+        return encode_cursor([getattr(item, column.key) for column in self.columns])
+
+    def _count_query(self, query: Select[Any]) -> Select[tuple[int]]:
+        # Только id: подзапросу не нужны колонки сущности, и SQLite может считать по покрывающему индексу.
+        return select(func.count()).select_from(query.with_only_columns(self.columns[-1]).order_by(None).subquery())
+
+    def _total(self, query: Select[Any]) -> ScalarSelect[int]:
+        return self._count_query(query).scalar_subquery()
+
+    async def _count(self, session: AsyncSession, query: Select[Any]) -> int:
+        return await session.scalar(self._count_query(query)) or 0
+
+    def _bind_values(self, values: list[Any]) -> list[ColumnElement[Any]]:
+        if len(values) != len(self.columns):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Некорректный курсор пагинации")
+
+        try:
+            return [self._bind(column, value) for column, value in zip(self.columns, values)]
+        except (TypeError, ValueError):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Некорректный курсор пагинации") from None
+
+    @staticmethod
+    def _bind(column: InstrumentedAttribute[Any], value: Any) -> ColumnElement[Any]:
+        python_type = column.type.python_type
+
+        if python_type is datetime:
+            return audit_timestamp(datetime.fromisoformat(value))
+
+        if not isinstance(value, python_type) or isinstance(value, bool):
+            raise TypeError(value)
+
+        return literal(value, column.type)
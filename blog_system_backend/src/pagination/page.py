@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    total_items: int | None
+    has_next_page: bool
+    next_cursor: str | None = None
@@ -1,36 +1,57 @@
 import math
-from typing import Self
+from typing import Any, Self
 
 from pydantic import BaseModel
 
 from blog_system_backend.src.pagination.fields import (
+    PaginationSearchParamsCursor,
+    PaginationSearchParamsIncludeTotal,
     PaginationSearchParamsLimit,
     PaginationSearchParamsOffset,
     PaginationSearchParamsQ,
 )
+from blog_system_backend.src.pagination.page import Page
 
 
 class PaginationSearchParams(BaseModel):
     q: PaginationSearchParamsQ
     offset: PaginationSearchParamsOffset
     limit: PaginationSearchParamsLimit
+    cursor: PaginationSearchParamsCursor
+    include_total: PaginationSearchParamsIncludeTotal
 
 
 class PaginationResponse(BaseModel):
-    total_items: int
-    total_pages: int
+    total_items: int | None
+    total_pages: int | None
     current_page: int
     per_page: int
     has_next_page: bool
     has_prev_page: bool
     next_page: int | None
     prev_page: int | None
+    next_cursor: str | None = None
 
     @classmethod
-    def from_search_params(cls, search_params: PaginationSearchParams, *, total_items: int) -> Self:
+    def from_search_params(
+        cls, search_params: PaginationSearchParams, *, total_items: int, next_cursor: str | None = None
+    ) -> Self:
         per_page = search_params.limit
         offset = search_params.offset
 
+        if search_params.cursor is not None:
+            return cls(
+                total_items=total_items,
+                total_pages=math.ceil(total_items / per_page) if total_items > 0 and per_page != 0 else 0,
+                current_page=0,
+                per_page=per_page,
+                has_next_page=next_cursor is not None,
+                has_prev_page=True,
+                next_page=None,
+                prev_page=None,
+                next_cursor=next_cursor,
+            )
+
         current_page = offset // per_page + 1 if total_items > 0 and per_page != 0 else 0
         total_pages = math.ceil(total_items / per_page) if total_items > 0 and per_page != 0 else 0
 
@@ -49,4 +70,41 @@ class PaginationResponse(BaseModel):
             has_prev_page=has_prev_page,
             next_page=next_page,
             prev_page=prev_page,
+            next_cursor=next_cursor if has_next_page else None,
+        )
+
+    @classmethod
+    def from_page(cls, search_params: PaginationSearchParams, page: Page[Any]) -> Self:
+        if page.total_items is not None and search_params.cursor is None:
+            return cls.from_search_params(search_params, total_items=page.total_items, next_cursor=page.next_cursor)
+
+        per_page = search_params.limit
+        total_pages = math.ceil(page.total_items / per_page) if page.total_items is not None and per_page != 0 else None
+
+        if search_params.cursor is not None:
+            return cls(
+                total_items=page.total_items,
+                total_pages=total_pages,
+                current_page=0,
+                per_page=per_page,
+                has_next_page=page.has_next_page,
+                has_prev_page=True,
+                next_page=None,
+                prev_page=None,
+                next_cursor=page.next_cursor,
+            )
+
+        current_page = search_params.offset // per_page + 1 if per_page != 0 else 0
+        has_prev_page = search_params.offset > 0
+
+        return cls(
+            total_items=None,
+            total_pages=None,
+            current_page=current_page,
+            per_page=per_page,
+            has_next_page=page.has_next_page,
+            has_prev_page=has_prev_page,
+            next_page=current_page + 1 if page.has_next_page else None,
+            prev_page=current_page - 1 if has_prev_page else None,
+            next_cursor=page.next_cursor,
         )
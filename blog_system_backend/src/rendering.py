@@ -0,0 +1,74 @@
+import functools
+import inspect
+import types
+import typing
+from collections.abc import Awaitable, Callable
+from typing import Any, ParamSpec
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+P = ParamSpec("P")
+
+
+def rendered(endpoint: Callable[P, Awaitable[Any]]) -> Callable[P, Awaitable[Any]]:
+    """Сериализует ответ эндпоинта сразу в JSON, минуя повторную валидацию `response_model`.
+
+    Ставится под декоратором роутера (над `cached`). Если эндпоинт вернул ровно тот тип, что указан
+    в аннотации возврата (модель, объединение моделей или их список), он переводится в словарь заранее
+    скомпилированным `TypeAdapter`, кодируется orjson и отдается готовым `Response` с заголовками и статусом
+    из параметра `response`.
+    Любое другое значение (например, ORM-объект) уходит в FastAPI как обычно.
+    """
+
+    signature = inspect.signature(endpoint)
+    annotation = signature.return_annotation
+    adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+    is_list = typing.get_origin(annotation) is list
+    item = typing.get_args(annotation)[0] if is_list else annotation
+    models = typing.get_args(item) if isinstance(item, types.UnionType) else (item,)
+
+    if not all(inspect.isclass(model) and issubclass(model, BaseModel) for model in models):
+        raise TypeError(f"{endpoint.__name__}: аннотация возврата должна быть моделью или списком моделей")
+
+    parameters = list(signature.parameters.values())
+
+    # FastAPI передает Response только в один параметр, поэтому используем параметр эндпоинта, если он есть.
+    response_name = next((p.name for p in parameters if p.annotation is Response), None)
+    if response_name is None:
+        parameters.append(inspect.Parameter("render_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response))
+
+    def is_exact(value: Any) -> bool:
+        if is_list:
+            return type(value) is list and all(type(item) in models for item in value)
+
+        return type(value) in models
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        if response_name is None:
+            response: Response = kwargs.pop("render_response")  # type: ignore[assignment]
+        else:
+            response = kwargs[response_name]  # type: ignore[assignment]
+
+        value = await endpoint(*args, **kwargs)
+
+        if not is_exact(value):
+            return value
+
+        rendered_response = Response(
+            orjson.dumps(
+                adapter.dump_python(value, by_alias=True), default=to_jsonable_python, option=orjson.OPT_UTC_Z
+            ),
+            status_code=response.status_code or 200,
+            media_type="application/json",
+        )
+        rendered_response.headers.raw.extend(response.headers.raw)
+
+        return rendered_response
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+
+    return wrapper
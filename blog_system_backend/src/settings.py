@@ -1,6 +1,32 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class SQLiteProfile(StrEnum):
+    default = "default"
+    production = "production"
+    durable = "durable"
+    test = "test"
+
+
+class CacheBackendType(StrEnum):
+    memory = "memory"
+    redis = "redis"
+
+
+class SQLiteSettings(BaseModel):
+    profile: SQLiteProfile = SQLiteProfile.production
+
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None
+    mmap_size: int | None = None
+    temp_store: str | None = None
+    busy_timeout: int | None = None
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_nested_delimiter="_",
@@ -11,12 +37,36 @@ class Settings(BaseSettings):
 
     token_url: str = "api/auth/login"
     lru_cache_size: int = 128
+    response_cache: bool = True
+    response_cache_ttl: float = 30
+    stale_while_revalidate: float = 0
+    single_flight: bool = True
+    single_flight_timeout: float = 5
+    principal_cache_size: int = 1024
+    principal_cache_ttl: float = 60
+    cache_backend: CacheBackendType = CacheBackendType.memory
+    cache_poll_interval: float = 1
+    redis_url: str = "redis://localhost:6379/0"
 
     jwt_algorithm: str
     jwt_expire_minutes: int
     jwt_secret: str
 
     pagination_search_params_max_limit: int = 100
+    export_chunk_size: int = 500
+    batch_max_size: int = 500
+    post_excerpt_length: int = 280
+    feed_fanout_max_followers: int = 10_000
+    feed_backfill_size: int = 100
+    feed_merge_max_subscriptions: int = 0
+
+    database_url: str = "sqlite+aiosqlite:///./data/database.db"
+    database_read_pool_size: int = 8
+    sqlite: SQLiteSettings = SQLiteSettings()
+
+    sql_instrumentation: bool = True
+    slow_query_log: bool = True
+    slow_query_threshold_ms: float = 100
 
 
 settings = Settings()  # type: ignore
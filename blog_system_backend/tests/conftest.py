@@ -12,22 +12,34 @@ __all__ = [
     "AuthLoginDict",
     "AuthRegisterDict",
     "token",
+    "generate_post",
+    "post_client",
+    "post_repository",
+    "post",
+    "PostClient",
 ]
 
-from typing import AsyncIterator, Iterator
+from typing import AsyncIterator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from blog_system_backend.src.api.users.principal import PRINCIPAL_CACHE
 from blog_system_backend.src.app import app
+from blog_system_backend.src.cache import RESPONSE_CACHE
 from blog_system_backend.src.db.deps import get_session
+from blog_system_backend.src.db.fts import load_tables, register_functions
+from blog_system_backend.src.db.instrumentation import instrument
 from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.db.pragmas import SQLITE_PROFILES, apply_pragmas
+from blog_system_backend.src.settings import SQLiteProfile
 from blog_system_backend.tests.utils.auth.args import AuthLoginDict, AuthRegisterDict
 from blog_system_backend.tests.utils.auth.client import AuthClient
 from blog_system_backend.tests.utils.auth.fixtures import auth_client, token
+from blog_system_backend.tests.utils.posts.client import PostClient
+from blog_system_backend.tests.utils.posts.fixtures import post, post_client, post_repository
+from blog_system_backend.tests.utils.posts.generator import generate_post
 from blog_system_backend.tests.utils.users.client import UserClient
 from blog_system_backend.tests.utils.users.fixtures import user, user_client, user_repository
 from blog_system_backend.tests.utils.users.generator import (
@@ -37,38 +49,52 @@ from blog_system_backend.tests.utils.users.generator import (
     generate_user,
 )
 
-ENGINE = create_engine("sqlite:///./data/test_database.db")
+ENGINE = create_async_engine("sqlite+aiosqlite:///./data/test_database.db")
+apply_pragmas(ENGINE, SQLITE_PROFILES[SQLiteProfile.test])
+register_functions(ENGINE)
+instrument(ENGINE)
 
+SESSION_FACTORY = async_sessionmaker(ENGINE, expire_on_commit=False)
 
-def get_overwrite_session() -> Iterator[Session]:
-    session = Session(ENGINE)
+
+async def get_overwrite_session() -> AsyncIterator[AsyncSession]:
+    session = SESSION_FACTORY()
 
     try:
         yield session
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
 @pytest.fixture(scope="function")
-def session() -> Iterator[Session]:
-    session = Session(ENGINE)
+async def session() -> AsyncIterator[AsyncSession]:
+    session = SESSION_FACTORY()
 
     try:
         yield session
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
 @pytest.fixture(scope="function", autouse=True)
-def setup_database() -> None:
-    Base.metadata.drop_all(bind=ENGINE)
-    Base.metadata.create_all(bind=ENGINE)
+async def setup_database() -> AsyncIterator[None]:
+    async with ENGINE.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    await load_tables(ENGINE)
+    await RESPONSE_CACHE.clear()
+    PRINCIPAL_CACHE.clear()
+
+    yield
+
+    await ENGINE.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,84 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.posts.schemas import PostsPaginationResponse
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.tests.utils.posts import PostClient, generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+
+@pytest.mark.anyio
+class TestPosts:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, post_client: PostClient, token: str) -> None:
+        self.post_client = post_client
+
+    async def test_get_posts_params_q_highlight_ok(self, post_repository: PostRepository, user: User) -> None:
+        post = await post_repository.create_post(generate_post(content="tuning the sqlite cache"), user.id)
+        await post_repository.create_post(generate_post(content="postgres"), user.id)
+
+        response = await self.post_client.get_posts(params=dict(q="sqlite", highlight="true"))
+        assert response.status_code == status.HTTP_200_OK
+
+        posts = PostsPaginationResponse(**response.json()).posts
+        assert [item.id for item in posts] == [post.id]
+        assert posts[0].snippet is not None
+        assert "<mark>sqlite</mark>" in posts[0].snippet
+
+    async def test_get_user_posts_params_q_ok(self, post_repository: PostRepository, user: User) -> None:
+        post = await post_repository.create_post(generate_post(title="SQLite notes"), user.id)
+        await post_repository.create_post(generate_post(title="other"), user.id)
+
+        response = await self.post_client.get_user_posts(user.id, params=dict(q="sqlite"))
+        assert response.status_code == status.HTTP_200_OK
+
+        result = PostsPaginationResponse(**response.json())
+        assert [item.id for item in result.posts] == [post.id]
+        assert result.pagination.total_items == 1
+
+    async def test_get_user_posts_pagination_ok(
+        self, post_repository: PostRepository, user_repository: UserRepository, user: User
+    ) -> None:
+        posts = [await post_repository.create_post(generate_post(), user.id) for _ in range(5)]
+        other = await user_repository.create_user(generate_user())
+        await post_repository.create_post(generate_post(), other.id)
+        expected = [post.id for post in reversed(posts)]
+
+        first = PostsPaginationResponse(**(await self.post_client.get_user_posts(user.id, params=dict(limit=2))).json())
+        second = PostsPaginationResponse(
+            **(await self.post_client.get_user_posts(user.id, params=dict(limit=2, offset=2))).json()
+        )
+        by_cursor = PostsPaginationResponse(
+            **(
+                await self.post_client.get_user_posts(
+                    user.id, params=dict(limit=3, cursor=first.pagination.next_cursor)
+                )
+            ).json()
+        )
+
+        assert [item.id for item in first.posts] == expected[:2]
+        assert [item.id for item in second.posts] == expected[2:4]
+        assert [item.id for item in by_cursor.posts] == expected[2:]
+        assert first.pagination.total_items == 5
+        assert first.pagination.total_pages == 3
+        assert not by_cursor.pagination.has_next_page
+
+    async def test_get_comments_cursor_ok(
+        self, client: AsyncClient, post_repository: PostRepository, user: User
+    ) -> None:
+        post = await post_repository.create_post(generate_post(), user.id)
+        for i in range(4):
+            await client.post(f"/api/posts/{post.id}/comments", json=dict(content=f"comment {i}"))
+
+        first = await client.get(f"/api/posts/{post.id}/comments", params=dict(limit=2), headers={"Origin": "http://x"})
+        last = await client.get(
+            f"/api/posts/{post.id}/comments", params=dict(limit=2, cursor=first.headers["X-Next-Cursor"])
+        )
+
+        assert "X-Next-Cursor" in first.headers["Access-Control-Expose-Headers"]
+        assert [item["content"] for item in last.json()] == ["comment 1", "comment 0"]
+        # Последняя страница заполнена ровно до limit, но следующей нет.
+        assert "X-Next-Cursor" not in last.headers
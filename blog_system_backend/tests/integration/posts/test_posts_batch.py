@@ -0,0 +1,126 @@
+import re
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.categories.repository import CategoryRepository
+from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.subscribes.repository import SubscribeRepository
+from blog_system_backend.src.settings import settings
+
+
+def query_count(response: Response) -> int:
+    match = re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"])
+    assert match is not None
+    return int(match[1])
+
+
+@pytest.mark.anyio
+class TestPostsBatch:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, client: AsyncClient, session: AsyncSession, token: str) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+        self.session = session
+        self.me = (await client.get("/api/users/me")).json()
+        self.categories = [
+            (await CategoryRepository(session).create(CategoryCreateRequest(title=f"c{i}"))).id for i in range(2)
+        ]
+
+    async def batch(self, url: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        response = await self.client.post(url, json=dict(items=items))
+
+        assert response.status_code == status.HTTP_200_OK
+        results: list[dict[str, Any]] = response.json()["results"]
+        return results
+
+    async def count(self, model: type[Post]) -> int:
+        return await self.session.scalar(select(func.count()).select_from(model)) or 0
+
+    async def test_create_posts(self) -> None:
+        first, second = self.categories
+        items: list[dict[str, Any]] = [
+            dict(title="first", content="content", categoryIds=[first, first]),
+            dict(title="second", content="content", categoryIds=[first, second]),
+            dict(title="third", content="content"),
+        ]
+
+        results = await self.batch("/api/posts:batch", items)
+
+        assert [(result["index"], result["status"]) for result in results] == [(i, "created") for i in range(3)]
+        posts = [(await self.client.get(f"/api/posts/{result['id']}")).json() for result in results]
+        assert [(post["title"], post["categories"]) for post in posts] == [
+            ("first", ["c0"]),
+            ("second", ["c0", "c1"]),
+            ("third", []),
+        ]
+        assert all(post["authorId"] == self.me["id"] for post in posts)
+
+        self.session.expunge_all()
+        me = (await self.client.get(f"/api/users/{self.me['id']}")).json()
+        assert me["postsCount"] == 3
+
+    async def test_fan_out(self, user: User) -> None:
+        await SubscribeRepository(self.session).create(self.me["id"], user.id)
+
+        results = await self.batch("/api/posts:batch", [dict(title=f"t{i}", content="c") for i in range(3)])
+        entries = await self.session.scalars(select(FeedEntry.postId).filter(FeedEntry.userId == user.id))
+
+        assert sorted(entries) == [result["id"] for result in results]
+
+    async def test_unknown_category(self) -> None:
+        items = [
+            dict(title="ok", content="content", categoryIds=self.categories),
+            dict(title="missing", content="content", categoryIds=[self.categories[0], 999, 998]),
+        ]
+
+        results = await self.batch("/api/posts:batch", items)
+
+        assert results[0]["status"] == "created"
+        assert results[1] == dict(index=1, status="not_found", id=None, detail="Категории с id 998, 999 не найдены")
+        assert await self.count(Post) == 1
+
+    async def test_invalid_item_writes_nothing(self) -> None:
+        items = [dict(title="ok", content="content"), dict(title="no content")]
+
+        response = await self.client.post("/api/posts:batch", json=dict(items=items))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert response.json()["detail"][0]["loc"] == ["body", "items", 1, "content"]
+        assert await self.count(Post) == 0
+
+    @pytest.mark.parametrize("size", (0, settings.batch_max_size + 1))
+    async def test_size_limit(self, size: int) -> None:
+        response = await self.client.post("/api/posts:batch", json=dict(items=[dict(title="t", content="c")] * size))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_fixed_query_count(self) -> None:
+        items = [dict(title=f"t{i}", content="c", categoryIds=self.categories) for i in range(50)]
+
+        response = await self.client.post("/api/posts:batch", json=dict(items=items))
+
+        # Пользователь, категории, счетчик подписчиков, посты, связи с категориями, раскладка по лентам.
+        assert response.status_code == status.HTTP_200_OK
+        assert query_count(response) <= 6
+
+    async def test_create_comments(self) -> None:
+        post = (await self.client.post("/api/posts", json=dict(title="title", content="content"))).json()
+
+        results = await self.batch(f"/api/posts/{post['id']}/comments:batch", [dict(content=f"c{i}") for i in range(3)])
+        comments = (await self.client.get(f"/api/posts/{post['id']}/comments")).json()
+
+        assert [result["status"] for result in results] == ["created"] * 3
+        assert [comment["id"] for comment in comments] == [result["id"] for result in results][::-1]
+
+    async def test_create_comments_post_not_found(self) -> None:
+        response = await self.client.post("/api/posts/999/comments:batch", json=dict(items=[dict(content="c")]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
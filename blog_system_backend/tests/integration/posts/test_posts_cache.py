@@ -0,0 +1,57 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.cache import RESPONSE_CACHE
+from blog_system_backend.tests.utils.posts import PostClient, generate_post
+
+
+@pytest.mark.anyio
+class TestPostsCache:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, post_client: PostClient, token: str) -> None:
+        self.post_client = post_client
+
+    async def test_get_post_cached(self, client: AsyncClient, post_repository: PostRepository, user: User) -> None:
+        post = await post_repository.create_post(generate_post(), user.id)
+
+        first = await self.post_client.get_post(post.id)
+
+        second = await self.post_client.get_post(post.id)
+
+        assert second.json() == first.json()
+        assert RESPONSE_CACHE.hits == 1
+        # Пользователь из токена тоже берется из кэша.
+        assert 'desc="0 queries"' in second.headers["Server-Timing"]
+
+    async def test_write_invalidates(self, client: AsyncClient) -> None:
+        response = await client.post("/api/posts", json=dict(title="before", content="content"))
+        post_id = response.json()["id"]
+
+        await self.post_client.get_posts()
+        await self.post_client.get_post(post_id)
+
+        response = await client.put(f"/api/posts/{post_id}", json=dict(title="after", content="content"))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await self.post_client.get_posts()
+        assert [item["title"] for item in response.json()["posts"]] == ["after"]
+
+        response = await self.post_client.get_post(post_id)
+        assert response.json()["title"] == "after"
+        assert RESPONSE_CACHE.hits == 0
+
+    async def test_comments_cursor_header_replayed(
+        self, client: AsyncClient, post_repository: PostRepository, user: User
+    ) -> None:
+        post = await post_repository.create_post(generate_post(), user.id)
+        for i in range(3):
+            await client.post(f"/api/posts/{post.id}/comments", json=dict(content=f"comment {i}"))
+
+        first = await client.get(f"/api/posts/{post.id}/comments", params=dict(limit=2))
+        second = await client.get(f"/api/posts/{post.id}/comments", params=dict(limit=2))
+
+        assert RESPONSE_CACHE.hits == 1
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
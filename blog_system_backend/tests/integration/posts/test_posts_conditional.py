@@ -0,0 +1,88 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.posts import PostClient
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("response_cache", (True, False))
+class TestPostsConditional:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(
+        self, post_client: PostClient, token: str, response_cache: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self.post_client = post_client
+        monkeypatch.setattr(settings, "response_cache", response_cache)
+
+    async def test_get_post_not_modified(self, client: AsyncClient) -> None:
+        response = await client.post("/api/posts", json=dict(title="title", content="content"))
+        post_id = response.json()["id"]
+
+        first = await self.post_client.get_post(post_id)
+        etag = first.headers["ETag"]
+        assert "Last-Modified" in first.headers
+
+        second = await client.get(f"/api/posts/{post_id}", headers={"If-None-Match": etag})
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+        await client.put(f"/api/posts/{post_id}", json=dict(title="title", content="content", categoryIds=[]))
+        response = await client.post("/api/categories", json=dict(title="category"))
+        await client.put(
+            f"/api/posts/{post_id}", json=dict(title="title", content="content", categoryIds=[response.json()["id"]])
+        )
+
+        third = await client.get(f"/api/posts/{post_id}", headers={"If-None-Match": etag})
+        assert third.status_code == status.HTTP_200_OK
+        assert third.json()["categories"] == ["category"]
+        assert third.headers["ETag"] != etag
+
+    async def test_get_post_if_modified_since_without_zone(self, client: AsyncClient) -> None:
+        response = await client.post("/api/posts", json=dict(title="title", content="content"))
+
+        response = await client.get(
+            f"/api/posts/{response.json()['id']}", headers={"If-Modified-Since": "Mon, 20 Nov 2095 19:12:08 -0000"}
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    async def test_get_saved_posts_not_modified(self, client: AsyncClient) -> None:
+        me = (await client.get("/api/users/me")).json()
+        post = (await client.post("/api/posts", json=dict(title="first", content="content"))).json()
+        await client.post(f"/api/posts/{post['id']}/save")
+
+        first = await client.get(f"/api/users/{me['id']}/saved-posts")
+        etag = first.headers["ETag"]
+        assert "Last-Modified" in first.headers
+
+        second = await client.get(f"/api/users/{me['id']}/saved-posts", headers={"If-None-Match": etag})
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await client.post(f"/api/posts/{post['id']}/comments", json=dict(content="comment"))
+
+        third = await client.get(f"/api/users/{me['id']}/saved-posts", headers={"If-None-Match": etag})
+        assert third.status_code == status.HTTP_200_OK
+        assert third.json()["posts"][0]["commentsCount"] == 1
+
+    async def test_get_posts_not_modified(self, client: AsyncClient) -> None:
+        await client.post("/api/posts", json=dict(title="first", content="content"))
+
+        first = await self.post_client.get_posts()
+        etag = first.headers["ETag"]
+
+        second = await client.get("/api/posts", headers={"If-None-Match": etag})
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await client.post("/api/posts", json=dict(title="second", content="content"))
+
+        third = await client.get("/api/posts", headers={"If-None-Match": etag})
+        assert third.status_code == status.HTTP_200_OK
+        assert len(third.json()["posts"]) == 2
+
+    async def test_get_post_not_found(self) -> None:
+        response = await self.post_client.get_post(1)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "ETag" not in response.headers
@@ -0,0 +1,100 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.posts.excerpt import make_excerpt
+from blog_system_backend.tests.utils.posts import PostClient
+
+
+@pytest.fixture(scope="function")
+def statements(session: AsyncSession) -> Iterator[list[str]]:
+    engine = session.bind.sync_engine
+    captured: list[str] = []
+
+    def capture(conn: object, cursor: object, statement: str, *args: object) -> None:
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.anyio
+class TestPostsFieldsets:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, post_client: PostClient, token: str) -> None:
+        self.post_client = post_client
+
+    async def test_summary_view(self, client: AsyncClient, statements: list[str]) -> None:
+        content = "Длинный текст поста. " * 200
+        category = (await client.post("/api/categories", json=dict(title="python"))).json()
+        await client.post("/api/posts", json=dict(title="title", content=content, categoryIds=[category["id"]]))
+        statements.clear()
+
+        response = await self.post_client.get_posts(params=dict(view="summary"))
+
+        assert response.status_code == status.HTTP_200_OK
+        post = response.json()["posts"][0]
+        assert post.keys() == {
+            "id",
+            "authorId",
+            "title",
+            "excerpt",
+            "categories",
+            "commentsCount",
+            "savesCount",
+            "createdAt",
+            "updatedAt",
+            "snippet",
+            "isSaved",
+        }
+        assert post["excerpt"] == make_excerpt(content)
+        assert post["categories"] == ["python"]
+
+        selects = [statement for statement in statements if statement.startswith("SELECT posts.")]
+        assert selects
+        assert all("posts.content" not in statement for statement in selects)
+
+    async def test_fields(self, client: AsyncClient, statements: list[str]) -> None:
+        await client.post("/api/posts", json=dict(title="title", content="content"))
+        statements.clear()
+
+        response = await self.post_client.get_posts(params=dict(fields="updatedAt,title,createdAt,savesCount"))
+
+        assert list(response.json()["posts"][0]) == ["id", "title", "savesCount", "createdAt", "updatedAt"]
+        assert not any("categories.title" in statement for statement in statements)
+        assert all("posts.content" not in statement for statement in statements)
+
+    async def test_user_lists(self, client: AsyncClient) -> None:
+        me = (await client.get("/api/users/me")).json()
+        post = (await client.post("/api/posts", json=dict(title="title", content="content"))).json()
+        await client.post(f"/api/posts/{post['id']}/save")
+        await client.post(f"/api/posts/{post['id']}/comments", json=dict(content="comment"))
+
+        users = (await client.get("/api/users", params=dict(view="summary"))).json()["users"]
+        user_posts = (await self.post_client.get_user_posts(me["id"], params=dict(view="summary"))).json()["posts"]
+        saved = (await client.get(f"/api/users/{me['id']}/saved-posts", params=dict(fields="title"))).json()["posts"]
+        comments = (await client.get(f"/api/posts/{post['id']}/comments", params=dict(view="summary"))).json()
+
+        assert users == [dict(id=me["id"], login=me["login"], isSubscribed=False)]
+        assert user_posts[0]["excerpt"] == "content"
+        assert "content" not in user_posts[0]
+        assert saved == [dict(id=post["id"], title="title")]
+        assert comments[0].keys() == {"id", "authorId", "postId", "createdAt"}
+
+    async def test_unknown_field(self) -> None:
+        response = await self.post_client.get_posts(params=dict(view="summary", fields="title,content"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_excerpt_follows_updates(self, client: AsyncClient) -> None:
+        post = (await client.post("/api/posts", json=dict(title="title", content="first"))).json()
+        await client.put(f"/api/posts/{post['id']}", json=dict(title="title", content="second  version"))
+
+        response = await self.post_client.get_posts(params=dict(view="summary"))
+
+        assert response.json()["posts"][0]["excerpt"] == "second version"
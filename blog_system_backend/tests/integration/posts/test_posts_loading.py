@@ -0,0 +1,95 @@
+import re
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.categories.repository import CategoryRepository
+from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.posts.saved_posts.repository import SavedPostRepository
+from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.posts import generate_post
+
+
+def query_count(response: Response) -> int:
+    match = re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"])
+    assert match is not None
+    return int(match[1])
+
+
+@pytest.mark.anyio
+class TestPostsLoading:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        post_repository: PostRepository,
+        token: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, "response_cache", False)
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        self.me = (await client.get("/api/users/me")).json()
+        categories = [await CategoryRepository(session).create(CategoryCreateRequest(title=f"c{i}")) for i in range(3)]
+        saved_posts = SavedPostRepository(session)
+
+        for i in range(12):
+            args = generate_post().model_copy(
+                update={"categoryIds": [categories[i % 3].id, categories[(i + 1) % 3].id]}
+            )
+            post = await post_repository.create_post(args, self.me["id"])
+            await saved_posts.create(self.me["id"], post.id)
+
+        # Каждый запрос в приложении идет в своей сессии: ничего не берем из identity map тестовой.
+        session.expunge_all()
+
+    # Флаг isSaved для всей страницы — один дополнительный IN-запрос.
+    @pytest.mark.parametrize(
+        ("url", "queries"),
+        (
+            ("/api/posts", 4),
+            ("/api/users/{id}/posts", 5),
+            ("/api/users/{id}/saved-posts", 5),
+        ),
+    )
+    async def test_fixed_query_count(self, client: AsyncClient, session: AsyncSession, url: str, queries: int) -> None:
+        counts = []
+
+        for limit in (2, 10):
+            response = await client.get(url.format(id=self.me["id"]), params=dict(limit=limit))
+            session.expunge_all()
+
+            assert len(response.json()["posts"]) == limit
+            assert all(len(post["categories"]) == 2 for post in response.json()["posts"])
+            counts.append(query_count(response))
+
+        assert counts == [queries, queries]
+
+    async def test_summary_query_count(self, client: AsyncClient) -> None:
+        response = await client.get("/api/posts", params=dict(view="summary", limit=10))
+
+        assert query_count(response) == 4
+
+    async def test_unplanned_lazy_load_raises(self, post_repository: PostRepository) -> None:
+        page = await post_repository.get_posts_page(PaginationSearchParams.model_construct(limit=1))
+
+        with pytest.raises(InvalidRequestError):
+            _ = page.items[0].author
+
+    async def test_comments_and_users(self, client: AsyncClient, session: AsyncSession) -> None:
+        post_id = (await client.get("/api/posts", params=dict(limit=1))).json()["posts"][0]["id"]
+        for i in range(5):
+            await client.post(f"/api/posts/{post_id}/comments", json=dict(content=f"comment {i}"))
+        session.expunge_all()
+
+        comments = await client.get(f"/api/posts/{post_id}/comments")
+        users = await client.get("/api/users")
+
+        assert len(comments.json()) == 5
+        assert query_count(comments) == 2
+        assert query_count(users) == 3
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.cache import FLIGHTS
+from blog_system_backend.tests.utils.posts import PostClient, generate_post
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+class TestPostsSingleFlight:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, post_client: PostClient, token: str) -> None:
+        self.post_client = post_client
+
+    async def test_concurrent_reads_coalesced(
+        self, client: AsyncClient, post_repository: PostRepository, user: User
+    ) -> None:
+        post = await post_repository.create_post(generate_post(), user.id)
+        await self.post_client.get_posts()
+        shared = FLIGHTS.shared
+
+        responses = await asyncio.gather(*(self.post_client.get_post(post.id) for _ in range(5)))
+
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert len({response.headers["ETag"] for response in responses}) == 1
+        assert FLIGHTS.shared - shared == 4
+        # Запросы в базу делал только первый из одновременных запросов.
+        queries = [response.headers["Server-Timing"] for response in responses]
+        assert sum('desc="0 queries"' not in timing for timing in queries) == 1
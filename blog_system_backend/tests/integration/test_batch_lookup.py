@@ -0,0 +1,98 @@
+import re
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.categories.repository import CategoryRepository
+from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.posts import generate_post
+
+
+def query_count(response: Response) -> int:
+    match = re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"])
+    assert match is not None
+    return int(match[1])
+
+
+@pytest.mark.anyio
+class TestBatchLookup:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(
+        self, client: AsyncClient, session: AsyncSession, token: str, post_repository: PostRepository
+    ) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+        self.me = (await client.get("/api/users/me")).json()
+
+        categories = CategoryRepository(session)
+        self.categories = [(await categories.create(CategoryCreateRequest(title=f"c{i}"))).id for i in range(3)]
+        self.posts = [
+            (
+                await post_repository.create_post(
+                    generate_post().model_copy(update={"categoryIds": self.categories[: i % 3]}), self.me["id"]
+                )
+            ).id
+            for i in range(6)
+        ]
+
+    async def get(self, url: str, ids: list[int], **params: Any) -> dict[str, Any]:
+        response = await self.client.get(url, params=dict(ids=ids, **params))
+
+        assert response.status_code == status.HTTP_200_OK
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def test_posts(self) -> None:
+        ids = [self.posts[4], 999, self.posts[1], self.posts[4], self.posts[0]]
+        await self.client.post(f"/api/posts/{self.posts[1]}/save")
+
+        result = await self.get("/api/posts:batch", ids)
+
+        assert [post["id"] for post in result["posts"]] == [self.posts[4], self.posts[1], self.posts[0]]
+        assert [post["categories"] for post in result["posts"]] == [["c0"], ["c0"], []]
+        assert [post["isSaved"] for post in result["posts"]] == [False, True, False]
+        assert result["missingIds"] == [999]
+
+    async def test_posts_fieldset(self) -> None:
+        result = await self.get("/api/posts:batch", self.posts[:2], fields="title")
+
+        assert [set(post) for post in result["posts"]] == [{"id", "title"}] * 2
+
+    async def test_posts_fixed_query_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "response_cache", False)
+
+        one = await self.client.get("/api/posts:batch", params=dict(ids=self.posts[:1]))
+        many = await self.client.get("/api/posts:batch", params=dict(ids=self.posts))
+
+        assert query_count(one) == query_count(many)
+
+    async def test_users(self, user: User) -> None:
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+
+        result = await self.get("/api/users:batch", [user.id, 999, self.me["id"]])
+
+        assert [(item["id"], item["isSubscribed"]) for item in result["users"]] == [
+            (user.id, True),
+            (self.me["id"], False),
+        ]
+        assert result["missingIds"] == [999]
+
+    async def test_categories(self) -> None:
+        first, second, third = self.categories
+
+        result = await self.get("/api/categories:batch", [third, first, 999, 998])
+
+        assert [category["title"] for category in result["categories"]] == ["c2", "c0"]
+        assert result["missingIds"] == [999, 998]
+
+    @pytest.mark.parametrize("ids", ([], [1] * (settings.batch_max_size + 1), ["x"]))
+    async def test_invalid_ids(self, ids: list[Any]) -> None:
+        response = await self.client.get("/api/posts:batch", params=dict(ids=ids))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -16,3 +16,19 @@ async def test_get_docs_openapi_json(client: AsyncClient) -> None:
 
     assert response.headers["Content-Type"] == "application/json"
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_server_timing_header(client: AsyncClient) -> None:
+    response = await client.get("/api/users")
+
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+
+
+@pytest.mark.anyio
+async def test_comments_list_params(client: AsyncClient) -> None:
+    response = await client.get("/openapi.json")
+
+    parameters = response.json()["paths"]["/api/posts/{post_id}/comments"]["get"]["parameters"]
+
+    assert {parameter["name"] for parameter in parameters} == {"post_id", "offset", "limit", "cursor", "view", "fields"}
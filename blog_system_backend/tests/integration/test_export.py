@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Any
+
+import orjson
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.auth.schemas import AccessTokenResponse
+from blog_system_backend.src.api.categories.repository import CategoryRepository
+from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest
+from blog_system_backend.src.api.posts.comments.repository import CommentRepository
+from blog_system_backend.src.api.posts.comments.schemas import CommentCreateRequest
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.auth import AuthClient
+from blog_system_backend.tests.utils.posts import generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+
+def parse(body: bytes) -> list[dict[str, Any]]:
+    assert body.endswith(b"\n")
+    return [orjson.loads(line) for line in body.splitlines()]
+
+
+@pytest.mark.anyio
+class TestExport:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, token: str, client: AsyncClient) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+
+    async def test_posts(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        post_repository: PostRepository,
+        user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, "export_chunk_size", 2)
+        category = await CategoryRepository(session).create(CategoryCreateRequest(title="python"))
+        posts = [await post_repository.create_post(generate_post(), user.id) for _ in range(4)]
+        await post_repository.create_post(generate_post().model_copy(update={"categoryIds": [category.id]}), user.id)
+
+        response = await client.get("/api/export/posts")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = parse(response.content)
+
+        assert [line["id"] for line in lines] == [post.id for post in posts] + [posts[-1].id + 1]
+        assert lines[0].keys() == {
+            "id",
+            "authorId",
+            "title",
+            "content",
+            "categories",
+            "commentsCount",
+            "savesCount",
+            "createdAt",
+            "updatedAt",
+        }
+        assert lines[0]["categories"] == []
+        assert lines[-1]["categories"] == ["python"]
+
+    async def test_since(
+        self, client: AsyncClient, session: AsyncSession, post_repository: PostRepository, user: User
+    ) -> None:
+        old, new = [await post_repository.create_post(generate_post(), user.id) for _ in range(2)]
+        await session.execute(update(Post).filter(Post.id == old.id).values(updatedAt=datetime(2020, 1, 1)))
+        await session.commit()
+
+        response = await client.get("/api/export/posts", params={"since": "2021-01-01T00:00:00Z"})
+
+        assert [line["id"] for line in parse(response.content)] == [new.id]
+
+    async def test_users_and_comments(
+        self, client: AsyncClient, session: AsyncSession, post_repository: PostRepository, user: User
+    ) -> None:
+        post = await post_repository.create_post(generate_post(), user.id)
+        comments = CommentRepository(session)
+        for i in range(3):
+            await comments.create(user.id, post.id, CommentCreateRequest(content=f"комментарий {i}"))
+
+        users = parse((await client.get("/api/export/users")).content)
+        lines = parse((await client.get("/api/export/comments")).content)
+
+        assert {line["login"] for line in users} == {"admin", user.login}
+        assert "password" not in users[0]
+        assert [line["content"] for line in lines] == [f"комментарий {i}" for i in range(3)]
+
+    async def test_forbidden_for_users(
+        self, client: AsyncClient, auth_client: AuthClient, user_repository: UserRepository
+    ) -> None:
+        plain_user = generate_user()
+        await user_repository.create_user(plain_user)
+        response = await auth_client.login(username=plain_user.login, password=plain_user.password)
+        client.headers["Authorization"] = f"Bearer {AccessTokenResponse(**response.json()).access_token}"
+
+        for entity in ("posts", "users", "comments"):
+            response = await client.get(f"/api/export/{entity}")
+
+            assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,132 @@
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.posts import generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+
+@pytest.mark.anyio
+class TestFeed:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        token: str,
+        user_repository: UserRepository,
+        post_repository: PostRepository,
+    ) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+        self.session = session
+        self.post_repository = post_repository
+        self.authors = [await user_repository.create_user(generate_user()) for _ in range(2)]
+
+    @pytest.fixture(scope="function", autouse=True, params=(-1, 100), ids=("entries", "merge"))
+    def engine(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "feed_merge_max_subscriptions", request.param)
+
+    async def publish(self, author: User, count: int = 1) -> list[int]:
+        return [(await self.post_repository.create_post(generate_post(), author.id)).id for _ in range(count)]
+
+    async def feed(self, **params: Any) -> dict[str, Any]:
+        response = await self.client.get("/api/feed", params=params)
+
+        assert response.status_code == status.HTTP_200_OK
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def feed_ids(self) -> list[int]:
+        return [post["id"] for post in (await self.feed())["posts"]]
+
+    async def entries(self) -> int:
+        return await self.session.scalar(select(func.count()).select_from(FeedEntry)) or 0
+
+    async def test_fan_out_on_write(self) -> None:
+        followed, other = self.authors
+        await self.client.post(f"/api/users/{followed.id}/subscribe")
+
+        posts = await self.publish(followed, 3)
+        await self.publish(other, 2)
+
+        assert await self.feed_ids() == posts[::-1]
+        assert await self.entries() == 3
+
+    async def test_cold_feed(self) -> None:
+        author, _ = self.authors
+        await self.client.post(f"/api/users/{author.id}/subscribe")
+        posts = await self.publish(author, 2)
+
+        await self.session.execute(delete(FeedEntry))
+        await self.session.commit()
+
+        assert await self.feed_ids() == posts[::-1]
+
+    async def test_backfill_and_retract(self) -> None:
+        author, _ = self.authors
+        first, second = await self.publish(author, 2)
+
+        await self.client.post(f"/api/users/{author.id}/subscribe")
+
+        assert await self.feed_ids() == [second, first]
+
+        await self.client.delete(f"/api/posts/{second}")
+
+        assert await self.feed_ids() == [first]
+
+        await self.client.delete(f"/api/users/{author.id}/subscribe")
+
+        assert await self.feed_ids() == []
+        assert await self.entries() == 0
+
+    async def test_cursor_pagination(self) -> None:
+        for author in self.authors:
+            await self.client.post(f"/api/users/{author.id}/subscribe")
+        posts = [post for _ in range(3) for author in self.authors for post in await self.publish(author)]
+
+        seen: list[int] = []
+        page = await self.feed(limit=2)
+        while True:
+            seen += [post["id"] for post in page["posts"]]
+            if page["pagination"]["next_cursor"] is None:
+                break
+            page = await self.feed(limit=2, cursor=page["pagination"]["next_cursor"])
+
+        assert seen == posts[::-1]
+        assert page["pagination"]["total_items"] is None
+
+    async def test_popular_author_is_pulled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        popular, regular = self.authors
+        for author in self.authors:
+            await self.client.post(f"/api/users/{author.id}/subscribe")
+        monkeypatch.setattr(settings, "feed_fanout_max_followers", 0)
+        pulled = await self.publish(popular, 2)
+        monkeypatch.setattr(settings, "feed_fanout_max_followers", 10)
+        fanned = await self.publish(regular, 2)
+
+        fanned_out = await self.session.scalars(select(Post.fannedOut).filter(Post.id.in_(pulled)))
+
+        assert not any(fanned_out)
+        assert await self.entries() == 2
+        assert await self.feed_ids() == (pulled + fanned)[::-1]
+
+        first = await self.feed(limit=3)
+        rest = await self.feed(limit=3, cursor=first["pagination"]["next_cursor"])
+
+        assert [post["id"] for post in first["posts"] + rest["posts"]] == (pulled + fanned)[::-1]
+
+    async def test_invalid_limit(self) -> None:
+        response = await self.client.get("/api/feed", params=dict(limit=0))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -0,0 +1,77 @@
+from typing import AsyncIterator
+
+import pytest
+from fastapi import Request, status
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from blog_system_backend.src.app import app
+from blog_system_backend.src.db import deps
+from blog_system_backend.src.db.deps import get_session
+from blog_system_backend.src.db.fts import register_functions
+from blog_system_backend.src.db.pragmas import SQLITE_PROFILES, apply_pragmas
+from blog_system_backend.src.settings import SQLiteProfile
+from blog_system_backend.tests.conftest import ENGINE
+from blog_system_backend.tests.utils.users import generate_user
+
+
+@pytest.mark.anyio
+class TestReadWriteSplit:
+    """Запросы идут через настоящий get_session: чтения — через пул только для чтения, записи — через писателя."""
+
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+        write_engine = create_async_engine(ENGINE.url, pool_size=1, max_overflow=0)
+        read_engine = create_async_engine(ENGINE.url)
+
+        apply_pragmas(write_engine, SQLITE_PROFILES[SQLiteProfile.test])
+        apply_pragmas(read_engine, SQLITE_PROFILES[SQLiteProfile.test], query_only=True)
+        register_functions(write_engine)
+        register_functions(read_engine)
+
+        monkeypatch.setattr(deps, "WRITE_SESSION_FACTORY", async_sessionmaker(write_engine, expire_on_commit=False))
+        monkeypatch.setattr(deps, "READ_SESSION_FACTORY", async_sessionmaker(read_engine, expire_on_commit=False))
+
+        overrides = dict(app.dependency_overrides)
+        app.dependency_overrides.pop(get_session, None)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            self.client = client
+            yield
+
+        app.dependency_overrides.update(overrides)
+        await write_engine.dispose()
+        await read_engine.dispose()
+
+    async def test_write_then_read(self) -> None:
+        user = generate_user()
+
+        response = await self.client.post("/api/auth/register", json=user.model_dump())
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await self.client.post("/api/auth/login", data=dict(username=user.login, password=user.password))
+        assert response.status_code == status.HTTP_200_OK
+
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        response = await self.client.get("/api/users/me", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["login"] == user.login
+
+    @pytest.mark.parametrize("method", ("GET", "HEAD"))
+    async def test_read_session_cannot_write(self, method: str) -> None:
+        request = Request({"type": "http", "method": method, "headers": []})
+
+        async for session in get_session(request):
+            with pytest.raises(OperationalError, match="readonly"):
+                await session.execute(text("INSERT INTO categories (title) VALUES ('blocked')"))
+
+    async def test_reader_sees_writer_commit(self) -> None:
+        async for session in get_session(Request({"type": "http", "method": "POST", "headers": []})):
+            await session.execute(text("INSERT INTO categories (title) VALUES ('allowed')"))
+            await session.commit()
+
+        async for session in get_session(Request({"type": "http", "method": "GET", "headers": []})):
+            assert await session.scalar(text("SELECT title FROM categories")) == "allowed"
@@ -111,3 +111,45 @@ class TestUsers:
         expected_users = filtered_users[:limit]
         expected_usernames = {user.login for user in expected_users}
         assert response_usernames.issubset(expected_usernames)
+
+    async def test_get_users_params_cursor_ok(self) -> None:
+        users = [generate_user(login=f"user{i}") for i in range(5)]
+
+        for user in users:
+            await self.auth_client.register(login=user.login, password=user.password, email=user.email)
+
+        logins: list[str] = []
+        params: dict[str, Any] = dict(limit=2)
+
+        while True:
+            response = await self.user_client.get_users(params=params)
+            assert response.status_code == status.HTTP_200_OK
+
+            page = UsersPaginationResponse(**response.json())
+            logins.extend(user.login for user in page.users)
+
+            if page.pagination.next_cursor is None:
+                break
+
+            params = dict(limit=2, cursor=page.pagination.next_cursor)
+
+        assert logins == sorted(logins)
+        assert {user.login for user in users}.issubset(logins)
+
+    async def test_get_users_params_cursor_invalid(self) -> None:
+        response = await self.user_client.get_users(params=dict(cursor="not a cursor"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_get_users_params_include_total_false_ok(self) -> None:
+        for user in [generate_user() for _ in range(3)]:
+            await self.auth_client.register(login=user.login, password=user.password, email=user.email)
+
+        response = await self.user_client.get_users(params=dict(limit=2, include_total="false"))
+        assert response.status_code == status.HTTP_200_OK
+
+        pagination = UsersPaginationResponse(**response.json()).pagination
+        assert pagination.total_items is None
+        assert pagination.total_pages is None
+        assert pagination.has_next_page
+        assert pagination.next_page == 2
+        assert pagination.next_cursor is not None
@@ -0,0 +1,75 @@
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.feed.models import FeedEntry
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.tests.utils.posts import generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+
+@pytest.mark.anyio
+class TestUsersBatch:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, client: AsyncClient, session: AsyncSession, token: str) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+        self.session = session
+        self.me = (await client.get("/api/users/me")).json()
+
+    async def batch(self, url: str, **body: list[int]) -> list[tuple[str, int | None]]:
+        response = await self.client.post(url, json=body)
+
+        assert response.status_code == status.HTTP_200_OK
+        results: list[dict[str, Any]] = response.json()["results"]
+        assert [result["index"] for result in results] == list(range(len(results)))
+        return [(result["status"], result["id"]) for result in results]
+
+    async def test_save_posts(self) -> None:
+        posts = [
+            (await self.client.post("/api/posts", json=dict(title="t", content="c"))).json()["id"] for _ in range(3)
+        ]
+        first, second, third = posts
+        saved = (await self.client.post(f"/api/posts/{first}/save")).json()["id"]
+
+        results = await self.batch("/api/users/me/saved-posts:batch", postIds=[first, second, 999, second, third])
+
+        assert results[0] == ("exists", saved)
+        assert results[1][0] == "created"
+        assert results[2] == ("not_found", None)
+        assert results[3] == ("exists", results[1][1])
+        assert results[4][0] == "created"
+        assert (await self.client.get("/api/users/me/state")).json()["savedPostIds"] == posts
+
+    async def test_subscribe(self, user_repository: UserRepository, post_repository: PostRepository) -> None:
+        authors = [await user_repository.create_user(generate_user()) for _ in range(2)]
+        for author in authors:
+            await post_repository.create_post(generate_post(), author.id)
+        first, second = (author.id for author in authors)
+        existing = (await self.client.post(f"/api/users/{first}/subscribe")).json()["id"]
+
+        results = await self.batch("/api/users/me/subscriptions:batch", authorIds=[self.me["id"], first, second, 999])
+
+        assert results[0] == ("invalid", None)
+        assert results[1] == ("exists", existing)
+        assert results[2][0] == "created"
+        assert results[3] == ("not_found", None)
+
+        state = (await self.client.get("/api/users/me/state")).json()
+        entries = await self.session.scalar(select(func.count()).select_from(FeedEntry))
+        self.session.expunge_all()
+        me = (await self.client.get(f"/api/users/{self.me['id']}")).json()
+
+        assert state["subscribedAuthorIds"] == [first, second]
+        assert entries == 2
+        assert me["subscriptionsCount"] == 2
+
+    async def test_size_limit(self) -> None:
+        response = await self.client.post("/api/users/me/subscriptions:batch", json=dict(authorIds=[]))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
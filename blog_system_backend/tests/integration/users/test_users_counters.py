@@ -0,0 +1,97 @@
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.posts.comments.models import POST_COMMENTS
+from blog_system_backend.src.api.posts.models import USER_POSTS, Post
+from blog_system_backend.src.api.posts.saved_posts.models import POST_SAVES
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.subscribes.models import USER_FOLLOWERS, USER_SUBSCRIPTIONS
+from blog_system_backend.src.db.counters import rebuild_counters
+
+
+@pytest.mark.anyio
+class TestUsersCounters:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, client: AsyncClient, session: AsyncSession, token: str) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+        self.session = session
+        self.me = (await client.get("/api/users/me")).json()
+
+    async def get(self, url: str) -> dict[str, Any]:
+        # В приложении у каждого запроса своя сессия; здесь она общая, и счетчики из триггеров нужно перечитать.
+        self.session.expunge_all()
+        response = await self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def test_user_counters(self, user: User) -> None:
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+        for _ in range(2):
+            await self.client.post("/api/posts", json=dict(title="title", content="content"))
+
+        me = await self.get(f"/api/users/{self.me['id']}")
+        author = await self.get(f"/api/users/{user.id}")
+
+        assert (me["followersCount"], me["subscriptionsCount"], me["postsCount"]) == (0, 1, 2)
+        assert (author["followersCount"], author["subscriptionsCount"], author["postsCount"]) == (1, 0, 0)
+
+        await self.client.delete(f"/api/users/{user.id}/subscribe")
+
+        assert (await self.get(f"/api/users/{user.id}"))["followersCount"] == 0
+        assert (await self.get(f"/api/users/{self.me['id']}"))["subscriptionsCount"] == 0
+
+    async def test_post_counters(self) -> None:
+        post = (await self.client.post("/api/posts", json=dict(title="title", content="content"))).json()
+        comments = [
+            (await self.client.post(f"/api/posts/{post['id']}/comments", json=dict(content=f"comment {i}"))).json()
+            for i in range(3)
+        ]
+        await self.client.post(f"/api/posts/{post['id']}/save")
+        await self.client.delete(f"/api/posts/{post['id']}/comments/{comments[0]['id']}")
+
+        card = (await self.get("/api/posts?view=summary"))["posts"][0]
+
+        assert (card["commentsCount"], card["savesCount"]) == (2, 1)
+
+        await self.client.delete(f"/api/posts/{post['id']}/save")
+
+        assert (await self.get(f"/api/posts/{post['id']}"))["savesCount"] == 0
+
+    async def test_counters_change_etag(self) -> None:
+        post = (await self.client.post("/api/posts", json=dict(title="title", content="content"))).json()
+        self.session.expunge_all()
+        etag = (await self.client.get(f"/api/posts/{post['id']}")).headers["ETag"]
+
+        await self.client.post(f"/api/posts/{post['id']}/comments", json=dict(content="comment"))
+        self.session.expunge_all()
+        response = await self.client.get(f"/api/posts/{post['id']}", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["commentsCount"] == 1
+
+    async def test_rebuild(self, user: User) -> None:
+        post = (await self.client.post("/api/posts", json=dict(title="title", content="content"))).json()
+        await self.client.post(f"/api/posts/{post['id']}/comments", json=dict(content="comment"))
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+        await self.session.execute(update(Post).values(commentsCount=10, savesCount=10))
+        await self.session.execute(update(User).values(followersCount=10, subscriptionsCount=10, postsCount=10))
+        await self.session.commit()
+
+        await rebuild_counters(
+            self.session, (USER_FOLLOWERS, USER_SUBSCRIPTIONS, USER_POSTS, POST_COMMENTS, POST_SAVES)
+        )
+
+        me = await self.get(f"/api/users/{self.me['id']}")
+        post = await self.get(f"/api/posts/{post['id']}")
+
+        assert (me["followersCount"], me["subscriptionsCount"], me["postsCount"]) == (0, 1, 1)
+        assert (post["commentsCount"], post["savesCount"]) == (1, 0)
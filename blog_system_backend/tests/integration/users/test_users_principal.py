@@ -0,0 +1,43 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.api.users.principal import PRINCIPAL_CACHE
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.tests.utils.users import UserClient, generate_user
+
+
+@pytest.mark.anyio
+class TestUsersPrincipal:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, user_client: UserClient, token: str) -> None:
+        self.user_client = user_client
+
+    async def test_cached_between_requests(self, client: AsyncClient) -> None:
+        await client.get("/api/categories")
+        hits = PRINCIPAL_CACHE.hits
+
+        response = await client.get("/api/categories")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert PRINCIPAL_CACHE.hits == hits + 2
+        assert 'desc="0 queries"' in response.headers["Server-Timing"]
+
+    async def test_update_invalidates(self, client: AsyncClient) -> None:
+        me = (await client.get("/api/users/me")).json()
+
+        await client.put(f"/api/users/{me['id']}", json=dict(email=me["email"], login="renamed"))
+
+        assert PRINCIPAL_CACHE.get_principal(me["id"]) is None
+        assert (await client.get("/api/users/me")).json()["login"] == "renamed"
+
+    async def test_delete_invalidates(self, client: AsyncClient, user_repository: UserRepository) -> None:
+        me = (await client.get("/api/users/me")).json()
+        other = await user_repository.create_user(generate_user())
+
+        await client.delete(f"/api/users/{other.id}")
+        await client.delete(f"/api/users/{me['id']}")
+
+        response = await client.get("/api/users/me")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,80 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from blog_system_backend.src.api.users.models import User
+
+
+@pytest.mark.anyio
+class TestUsersViewerState:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, client: AsyncClient, token: str) -> None:
+        client.headers["Authorization"] = f"Bearer {token}"
+        self.client = client
+
+    async def create_posts(self, count: int) -> list[int]:
+        return [
+            (await self.client.post("/api/posts", json=dict(title=f"title {i}", content="content"))).json()["id"]
+            for i in range(count)
+        ]
+
+    async def test_is_saved(self) -> None:
+        first, second, third = await self.create_posts(3)
+        await self.client.post(f"/api/posts/{third}/save")
+        await self.client.post(f"/api/posts/{first}/save")
+
+        posts = (await self.client.get("/api/posts")).json()["posts"]
+        summary = (await self.client.get("/api/posts", params=dict(view="summary"))).json()["posts"]
+
+        assert {post["id"]: post["isSaved"] for post in posts} == {first: True, second: False, third: True}
+        assert {post["id"]: post["isSaved"] for post in summary} == {first: True, second: False, third: True}
+        assert (await self.client.get(f"/api/posts/{first}")).json()["isSaved"] is True
+        assert (await self.client.get(f"/api/posts/{second}")).json()["isSaved"] is False
+
+    async def test_is_saved_not_requested(self) -> None:
+        (post,) = await self.create_posts(1)
+        await self.client.post(f"/api/posts/{post}/save")
+
+        response = await self.client.get("/api/posts", params=dict(fields="title"))
+
+        assert response.json()["posts"] == [dict(id=post, title="title 0")]
+
+    async def test_is_subscribed(self, user: User) -> None:
+        me = (await self.client.get("/api/users/me")).json()
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+
+        users = (await self.client.get("/api/users")).json()["users"]
+
+        assert {item["id"]: item["isSubscribed"] for item in users} == {me["id"]: False, user.id: True}
+        assert (await self.client.get(f"/api/users/{user.id}")).json()["isSubscribed"] is True
+
+    async def test_flag_changes_etag(self) -> None:
+        (post,) = await self.create_posts(1)
+        etag = (await self.client.get("/api/posts")).headers["ETag"]
+
+        await self.client.post(f"/api/posts/{post}/save")
+        response = await self.client.get("/api/posts", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["posts"][0]["isSaved"] is True
+
+    async def test_state(self, user: User) -> None:
+        first, second, third = await self.create_posts(3)
+        for post in (third, first):
+            await self.client.post(f"/api/posts/{post}/save")
+        await self.client.post(f"/api/users/{user.id}/subscribe")
+
+        response = await self.client.get("/api/users/me/state")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == dict(savedPostIds=[first, third], subscribedAuthorIds=[user.id])
+
+        not_modified = await self.client.get("/api/users/me/state", headers={"If-None-Match": response.headers["ETag"]})
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await self.client.delete(f"/api/posts/{first}/save")
+        changed = await self.client.get("/api/users/me/state", headers={"If-None-Match": response.headers["ETag"]})
+
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.json()["savedPostIds"] == [third]
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.api.users.principal import Principal, PrincipalCache
+from blog_system_backend.src.cache import (
+    MISSING,
+    CacheScope,
+    DataVersionChannel,
+    Entry,
+    RedisBackend,
+    RedisChannel,
+    ResponseCache,
+)
+
+
+class Worker:
+    def __init__(self, server: FakeServer) -> None:
+        client = FakeRedis(server=server)
+        self.channel = RedisChannel(client)
+        self.cache = ResponseCache(RedisBackend(client), self.channel, ttl=60)
+        self.principals = PrincipalCache(maxsize=2, ttl=60, channel=self.channel)
+
+
+async def wait_for(predicate: Callable[[], bool]) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+    raise AssertionError("Сообщение не дошло")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # redis.asyncio и опрос SQLite работают только на asyncio.
+    return "asyncio"
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+async def workers(server: FakeServer) -> AsyncIterator[tuple[Worker, Worker]]:
+    first, second = Worker(server), Worker(server)
+    tasks = [asyncio.create_task(worker.channel.run()) for worker in (first, second)]
+    await asyncio.sleep(0.05)
+
+    yield first, second
+
+    for task in tasks:
+        task.cancel()
+
+
+@pytest.mark.anyio
+class TestRedisBackend:
+    async def test_get_set(self) -> None:
+        backend = RedisBackend(FakeRedis(server=FakeServer()))
+
+        assert await backend.get("key") is MISSING
+
+        await backend.set("key", {"value": [1, 2]}, ttl=60)
+
+        assert await backend.get("key") == {"value": [1, 2]}
+        assert await backend.incr("counter") == 1
+        assert await backend.counters("counter", "missing") == [1, 0]
+
+        await backend.clear()
+
+        assert await backend.get("key") is MISSING
+
+    async def test_shared_between_workers(self, workers: tuple[Worker, Worker]) -> None:
+        first, second = workers
+
+        await first.cache.set("key", Entry("value", {}, (0,), time.time()))
+
+        assert (await second.cache.get("key", (0,)) or Entry(None, {}, (), 0)).value == "value"
+
+    async def test_bump_reaches_other_workers(self, workers: tuple[Worker, Worker]) -> None:
+        first, second = workers
+
+        await first.cache.bump(CacheScope.posts)
+
+        await wait_for(lambda: second.cache.version(CacheScope.posts) == 1)
+
+    async def test_principal_invalidation(self, workers: tuple[Worker, Worker]) -> None:
+        first, second = workers
+        second.principals.set_principal(Principal(id=1, role=UserRole.user, login="login"))
+
+        await first.principals.invalidate(1)
+
+        await wait_for(lambda: second.principals.get_principal(1) is None)
+
+    async def test_load(self, server: FakeServer, workers: tuple[Worker, Worker]) -> None:
+        first, _ = workers
+        await first.cache.bump(CacheScope.users)
+
+        late = Worker(server)
+        await late.cache.load()
+
+        assert late.cache.version(CacheScope.users) == 1
+
+
+@pytest.mark.anyio
+class TestDataVersionChannel:
+    async def test_dispatches_only_on_foreign_commit(self, tmp_path: Path) -> None:
+        url = f"sqlite+aiosqlite:///{tmp_path}/cache.db"
+        writer = create_async_engine(url, pool_size=1, max_overflow=0)
+        foreign = create_async_engine(url)
+        channel = DataVersionChannel(writer, interval=0.01)
+        messages: list[str | None] = []
+
+        async def handler(message: str | None) -> None:
+            messages.append(message)
+
+        channel.subscribe(handler)
+
+        async with writer.begin() as connection:
+            await connection.execute(text("CREATE TABLE t (id INTEGER)"))
+
+        task = asyncio.create_task(channel.run())
+        await asyncio.sleep(0.05)
+
+        async with writer.begin() as connection:
+            await connection.execute(text("INSERT INTO t VALUES (1)"))
+
+        await asyncio.sleep(0.05)
+        assert messages == []
+
+        async with foreign.begin() as connection:
+            await connection.execute(text("INSERT INTO t VALUES (2)"))
+
+        await wait_for(lambda: messages == [None])
+
+        task.cancel()
+        await writer.dispose()
+        await foreign.dispose()
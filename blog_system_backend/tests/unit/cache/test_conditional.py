@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pytest
+from starlette.datastructures import Headers
+
+from blog_system_backend.src.cache import Validators
+from blog_system_backend.src.cache.conditional import is_not_modified
+
+VALIDATORS = Validators.from_parts(1, "2024-01-01", last_modified=datetime(2024, 1, 1, 12, 0, 0))
+
+
+@pytest.mark.anyio
+class TestConditional:
+    async def test_from_parts_stable(self) -> None:
+        assert Validators.from_parts(1, "a").etag == Validators.from_parts(1, "a").etag
+        assert Validators.from_parts(1, "a").etag != Validators.from_parts(1, "b").etag
+        assert VALIDATORS.etag.startswith('W/"')
+
+    async def test_headers(self) -> None:
+        assert VALIDATORS.headers["Last-Modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+        assert VALIDATORS.headers["ETag"] == VALIDATORS.etag
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        (
+            ({}, False),
+            ({"If-None-Match": VALIDATORS.etag}, True),
+            ({"If-None-Match": VALIDATORS.etag.removeprefix("W/")}, True),
+            ({"If-None-Match": f'"other", {VALIDATORS.etag}'}, True),
+            ({"If-None-Match": "*"}, True),
+            ({"If-None-Match": '"other"'}, False),
+            ({"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"}, True),
+            ({"If-Modified-Since": "Mon, 01 Jan 2024 11:59:59 GMT"}, False),
+            ({"If-Modified-Since": "not a date"}, False),
+            ({"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 -0000"}, True),
+            ({"If-Modified-Since": "Mon, 01 Jan 2024 11:59:59 -0000"}, False),
+            ({"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00"}, True),
+            ({"If-None-Match": '"other"', "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"}, False),
+        ),
+    )
+    async def test_is_not_modified(self, headers: dict[str, str], expected: bool) -> None:
+        assert is_not_modified(Headers(headers), VALIDATORS) is expected
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from blog_system_backend.src.cache import CacheScope, Entry, MemoryBackend, ResponseCache
+from blog_system_backend.src.cache.invalidation import InvalidationChannel
+from blog_system_backend.src.cache.ttl import MISSING
+
+
+def entry(value: str = "", *versions: int, stored_at: float | None = None) -> Entry:
+    return Entry(value, {}, versions, time.time() if stored_at is None else stored_at)
+
+
+class LocalChannel(InvalidationChannel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.published: list[str] = []
+
+    async def publish(self, message: str) -> None:
+        self.published.append(message)
+
+    async def run(self) -> None:
+        pass
+
+
+@pytest.mark.anyio
+class TestResponseCache:
+    async def test_get_set(self) -> None:
+        cache = ResponseCache(MemoryBackend(maxsize=2, ttl=60), LocalChannel(), ttl=60)
+
+        assert await cache.get("key", (0,)) is None
+
+        await cache.set("key", entry("value", 0))
+
+        assert (await cache.get("key", (0,)) or entry()).value == "value"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_stale_while_revalidate(self) -> None:
+        cache = ResponseCache(MemoryBackend(maxsize=2, ttl=60), LocalChannel(), ttl=60, stale_ttl=10)
+
+        await cache.set("key", entry("value", 0))
+
+        assert await cache.get("key", (1,)) is None
+        assert await cache.get("key", (1,), allow_stale=True) is not None
+        assert (cache.hits, cache.stale_hits, cache.misses) == (0, 1, 1)
+
+        await cache.set("key", entry("value", 0, stored_at=time.time() - 80))
+
+        assert await cache.get("key", (0,), allow_stale=True) is None
+
+    async def test_evicts_least_recently_used(self) -> None:
+        backend = MemoryBackend(maxsize=2, ttl=60)
+
+        await backend.set("a", 1, ttl=60)
+        await backend.set("b", 2, ttl=60)
+        await backend.get("a")
+        await backend.set("c", 3, ttl=60)
+
+        assert await backend.get("b") is MISSING
+        assert await backend.get("a") == 1
+        assert await backend.get("c") == 3
+        assert len(backend.entries) == 2
+
+    async def test_expires_by_ttl(self) -> None:
+        cache = ResponseCache(MemoryBackend(maxsize=2, ttl=60), LocalChannel(), ttl=-1)
+
+        await cache.set("key", entry("value", 0))
+
+        assert await cache.get("key", (0,)) is None
+
+    async def test_bump(self) -> None:
+        channel = LocalChannel()
+        cache = ResponseCache(MemoryBackend(maxsize=2, ttl=60), channel, ttl=60)
+
+        await cache.bump(CacheScope.posts, CacheScope.comments)
+        await cache.bump(CacheScope.posts)
+
+        assert cache.version(CacheScope.posts) == 2
+        assert cache.version(CacheScope.comments) == 1
+        assert cache.version(CacheScope.users) == 0
+        assert channel.published == ["scope:posts:1", "scope:comments:1", "scope:posts:2"]
+
+    async def test_messages(self) -> None:
+        channel = LocalChannel()
+        cache = ResponseCache(MemoryBackend(maxsize=2, ttl=60), channel, ttl=60)
+
+        await channel.dispatch("scope:posts:5")
+        await channel.dispatch("scope:posts:3")
+        await channel.dispatch("principal:1")
+
+        assert cache.version(CacheScope.posts) == 5
+
+        await channel.dispatch(None)
+
+        assert cache.version(CacheScope.posts) == 6
+        assert cache.version(CacheScope.users) == 1
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from blog_system_backend.src.cache import SingleFlight
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+class TestSingleFlight:
+    async def test_coalesces_concurrent_calls(self) -> None:
+        flights = SingleFlight()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.do("key", compute, timeout=1) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert (calls, flights.shared) == (1, 4)
+        assert not flights.in_flight("key")
+
+    async def test_shares_exception(self) -> None:
+        flights = SingleFlight()
+
+        async def compute() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        results = await asyncio.gather(
+            *(flights.do("key", compute, timeout=1) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_follower_timeout(self) -> None:
+        flights = SingleFlight()
+
+        async def slow() -> str:
+            await asyncio.sleep(0.2)
+            return "slow"
+
+        async def fast() -> str:
+            return "fast"
+
+        leader = asyncio.create_task(flights.do("key", slow, timeout=1))
+        await asyncio.sleep(0)
+
+        assert await flights.do("key", fast, timeout=0.01) == "fast"
+        assert flights.timeouts == 1
+        assert await leader == "slow"
+
+    async def test_leader_cancelled(self) -> None:
+        flights = SingleFlight()
+
+        async def slow() -> str:
+            await asyncio.sleep(1)
+            return "slow"
+
+        async def fast() -> str:
+            return "fast"
+
+        leader = asyncio.create_task(flights.do("key", slow, timeout=1))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("key", fast, timeout=1))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "fast"
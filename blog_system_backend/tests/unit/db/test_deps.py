@@ -0,0 +1,23 @@
+import pytest
+from fastapi import Request
+
+from blog_system_backend.src.db import READ_ENGINE, WRITE_ENGINE
+from blog_system_backend.src.db.deps import get_session
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("method", "engine"),
+    (
+        ("GET", READ_ENGINE),
+        ("HEAD", READ_ENGINE),
+        ("POST", WRITE_ENGINE),
+        ("PUT", WRITE_ENGINE),
+        ("DELETE", WRITE_ENGINE),
+    ),
+)
+async def test_get_session_routes_by_method(method: str, engine: object) -> None:
+    request = Request({"type": "http", "method": method, "headers": []})
+
+    async for session in get_session(request):
+        assert session.bind is engine
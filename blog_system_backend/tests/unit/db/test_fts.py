@@ -0,0 +1,88 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import blog_system_backend
+from blog_system_backend.src.api.categories.models import TITLE_TRIGRAM, Category
+from blog_system_backend.src.api.users.models import LOGIN_TRIGRAM
+from blog_system_backend.src.db.fts import has_table, load_tables, trigram_similarity
+from blog_system_backend.src.db.models import Base
+
+
+@pytest.mark.anyio
+class TestTrigramIndex:
+    @pytest.mark.parametrize(
+        ("left", "right", "expected"),
+        (
+            ("maria", "maria", 1.0),
+            ("maria", "bob", 0.0),
+            ("", "maria", 0.0),
+        ),
+    )
+    async def test_trigram_similarity(self, left: str, right: str, expected: float) -> None:
+        assert trigram_similarity(left, right) == expected
+
+    async def test_trigram_similarity_typo(self) -> None:
+        assert trigram_similarity("administrator", "adminstrator") > 0.5
+
+    async def test_tables_created(self, session: AsyncSession) -> None:
+        assert has_table(session, LOGIN_TRIGRAM.name)
+        assert has_table(session, TITLE_TRIGRAM.name)
+
+    async def test_tables_loaded_at_startup_only(self, tmp_path: Path) -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/fresh.db")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            assert not has_table(session, TITLE_TRIGRAM.name)
+
+            await load_tables(engine)
+            assert has_table(session, TITLE_TRIGRAM.name)
+
+        await engine.dispose()
+
+    @pytest.mark.parametrize("q", ("ab", "AB", "b"))
+    async def test_short_query_matches_substring(self, session: AsyncSession, q: str) -> None:
+        session.add_all([Category(title="xabx"), Category(title="Abc"), Category(title="cd")])
+        await session.commit()
+
+        condition = await TITLE_TRIGRAM.search(session, Category.title, Category.id, q)
+        titles = set(await session.scalars(select(Category.title).filter(condition)))
+
+        assert titles == {"xabx", "Abc"}
+
+    async def test_search_category_title(self, session: AsyncSession) -> None:
+        session.add_all([Category(title="Databases"), Category(title="Frontend")])
+        await session.commit()
+
+        condition = await TITLE_TRIGRAM.search(session, Category.title, Category.id, "ABASE")
+        titles = list(await session.scalars(select(Category.title).filter(condition)))
+
+        assert titles == ["Databases"]
+
+    async def test_migrations_keep_trigram_tables_in_sync(self, tmp_path: Path) -> None:
+        config = Config()
+        config.set_main_option("script_location", str(Path(blog_system_backend.__file__).parent / "migrations"))
+        config.set_main_option("sqlalchemy.url", f"sqlite:///{tmp_path}/migrated.db")
+        command.upgrade(config, "head")
+
+        connection = sqlite3.connect(tmp_path / "migrated.db")
+
+        connection.execute(
+            "INSERT INTO users (id, email, login, password, role) VALUES (1, 'a@b.c', 'administrator', '', 'user')"
+        )
+        connection.execute("INSERT INTO categories (id, title) VALUES (1, 'Databases')")
+        connection.execute("UPDATE categories SET title = 'Frontend' WHERE id = 1")
+
+        def match(name: str, q: str) -> list[tuple[int]]:
+            return connection.execute(f"SELECT rowid FROM {name} WHERE {name} MATCH ?", (q,)).fetchall()
+
+        assert match("users_login_trgm", "nistr") == [(1,)]
+        assert match("categories_title_trgm", "base") == []
+        assert match("categories_title_trgm", "tend") == [(1,)]
@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.db.instrumentation import capture_queries, fingerprint
+from blog_system_backend.src.settings import settings
+
+
+@pytest.mark.anyio
+class TestInstrumentation:
+    @pytest.mark.parametrize(
+        ("statement", "expected"),
+        (
+            ("SELECT * FROM users WHERE id = 5", "SELECT * FROM users WHERE id = ?"),
+            ("SELECT * FROM users WHERE login = 'admin'", "SELECT * FROM users WHERE login = ?"),
+            ("SELECT *\n  FROM posts WHERE id IN (?, ?, ?)", "SELECT * FROM posts WHERE id IN (?+)"),
+        ),
+    )
+    async def test_fingerprint(self, statement: str, expected: str) -> None:
+        assert fingerprint(statement) == expected
+
+    async def test_capture_queries(self, session: AsyncSession) -> None:
+        with capture_queries() as stats:
+            await session.scalars(select(User))
+            await session.scalars(select(User).filter(User.id == 1))
+
+        assert stats.query_count == 2
+        assert stats.total_time > 0
+        assert sum(stats.fingerprints.values()) == 2
+
+    async def test_slow_query_log(
+        self, session: AsyncSession, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+
+        with caplog.at_level(logging.WARNING, logger="blog_system_backend.sql"):
+            await session.scalars(select(User))
+
+        assert any("Slow query" in record.message for record in caplog.records)
+
+        monkeypatch.setattr(settings, "slow_query_log", False)
+        caplog.clear()
+
+        with caplog.at_level(logging.WARNING, logger="blog_system_backend.sql"):
+            await session.scalars(select(User))
+
+        assert not caplog.records
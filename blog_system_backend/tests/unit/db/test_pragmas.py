@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from blog_system_backend.src.db.pragmas import SQLITE_PROFILES, apply_pragmas, resolve_pragmas
+from blog_system_backend.src.settings import SQLiteProfile, SQLiteSettings
+
+
+@pytest.mark.anyio
+class TestResolvePragmas:
+    async def test_profile_defaults(self) -> None:
+        pragmas = resolve_pragmas(SQLiteSettings(profile=SQLiteProfile.production))
+
+        assert pragmas == SQLITE_PROFILES[SQLiteProfile.production]
+
+    async def test_overrides(self) -> None:
+        pragmas = resolve_pragmas(SQLiteSettings(profile=SQLiteProfile.production, synchronous="full"))
+
+        assert pragmas.synchronous == "full"
+        assert pragmas.journal_mode == SQLITE_PROFILES[SQLiteProfile.production].journal_mode
+
+
+@pytest.mark.anyio
+async def test_apply_pragmas_on_connect(tmp_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pragmas.db'}")
+    apply_pragmas(engine, SQLITE_PROFILES[SQLiteProfile.production])
+
+    async with engine.connect() as connection:
+        assert await connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await connection.scalar(text("PRAGMA synchronous")) == 1
+        assert await connection.scalar(text("PRAGMA cache_size")) == -64000
+        assert await connection.scalar(text("PRAGMA temp_store")) == 2
+        assert await connection.scalar(text("PRAGMA busy_timeout")) == 5000
+
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_apply_pragmas_query_only(tmp_path: Path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'query_only.db'}"
+    writer = create_async_engine(url)
+    reader = create_async_engine(url)
+    apply_pragmas(reader, SQLITE_PROFILES[SQLiteProfile.production], query_only=True)
+
+    async with writer.begin() as connection:
+        await connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        await connection.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+    async with reader.connect() as connection:
+        assert await connection.scalar(text("SELECT count(*) FROM items")) == 1
+
+        with pytest.raises(OperationalError):
+            await connection.execute(text("INSERT INTO items (id) VALUES (2)"))
+
+    await reader.dispose()
+    await writer.dispose()
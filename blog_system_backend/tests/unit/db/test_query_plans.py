@@ -0,0 +1,172 @@
+import re
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.categories.repository import CategoryRepository
+from blog_system_backend.src.api.categories.schemas import CategoryCreateRequest, CategoryUpdateRequest
+from blog_system_backend.src.api.feed.merge import merge_feed
+from blog_system_backend.src.api.feed.repository import FeedRepository
+from blog_system_backend.src.api.posts.comments.repository import CommentRepository
+from blog_system_backend.src.api.posts.comments.schemas import CommentCreateRequest, CommentUpdateRequest
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.posts.saved_posts.repository import SavedPostRepository
+from blog_system_backend.src.api.posts.schemas import PostUpdateRequest
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.src.api.users.schemas import UserUpdateRequest
+from blog_system_backend.src.api.users.subscribes.repository import SubscribeRepository
+from blog_system_backend.src.cache import Validators
+from blog_system_backend.src.db.models import Base
+from blog_system_backend.src.pagination import Page, PaginationSearchParams, encode_cursor
+from blog_system_backend.src.settings import settings
+from blog_system_backend.tests.utils.posts import generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+Statement = tuple[str, Any]
+
+# Полный проход по таблице — строка плана «SCAN <таблица>» без индекса.
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+DML = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+@pytest.fixture(scope="function")
+def statements(session: AsyncSession) -> Iterator[list[Statement]]:
+    engine = session.bind.sync_engine
+    captured: list[Statement] = []
+
+    def capture(conn: object, cursor: object, statement: str, parameters: Any, *args: object) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def params(**values: Any) -> PaginationSearchParams:
+    return PaginationSearchParams.model_construct(
+        **{"q": None, "offset": 0, "limit": 1, "cursor": None, "include_total": True, **values}
+    )
+
+
+async def exercise(session: AsyncSession, user: User) -> None:
+    """Вызывает каждый метод репозиториев: без поиска, с поиском, первую и следующую страницу."""
+
+    users = UserRepository(session)
+    posts = PostRepository(session)
+    categories = CategoryRepository(session)
+    comments = CommentRepository(session)
+    saved_posts = SavedPostRepository(session)
+    subscribes = SubscribeRepository(session)
+    feed = FeedRepository(session)
+
+    other = await users.create_user(generate_user())
+    category = await categories.create(CategoryCreateRequest(title="python"))
+    post = await posts.create_post(generate_post().model_copy(update={"categoryIds": [category.id]}), user.id)
+    await posts.create_post(generate_post(), other.id)
+    comment = await comments.create(other.id, post.id, CommentCreateRequest(content="комментарий"))
+    await comments.create(user.id, post.id, CommentCreateRequest(content="еще комментарий"))
+    saved = await saved_posts.create(user.id, post.id)
+    await saved_posts.create(user.id, post.id + 1)
+    subscribe = await subscribes.create(other.id, user.id)
+    await subscribes.create(user.id, other.id)
+    fanned = await posts.create_post(generate_post(), other.id)
+
+    paged: list[Callable[[PaginationSearchParams], Awaitable[Page[Any]]]] = [
+        posts.get_posts_page,
+        lambda search_params: posts.get_posts_page(search_params, author_id=user.id),
+        users.get_users_page,
+        categories.list_page,
+        lambda search_params: saved_posts.get_by_user(user.id, search_params),
+        lambda search_params: comments.get_by_post(post.id, search_params),
+        lambda search_params: subscribes.get_followers(user.id, search_params),
+        lambda search_params: subscribes.get_subscriptions(user.id, search_params),
+    ]
+    validators: list[Callable[[PaginationSearchParams], Awaitable[Validators]]] = [
+        posts.get_posts_validators,
+        lambda search_params: posts.get_posts_validators(search_params, author_id=user.id),
+        lambda search_params: posts.get_posts_validators(
+            search_params, viewer_flags=[saved_posts.is_saved_by(user.id)]
+        ),
+        users.get_users_validators,
+        lambda search_params: users.get_users_validators(search_params, [subscribes.is_subscribed_by(user.id)]),
+        lambda search_params: comments.get_by_post_validators(post.id, search_params),
+        categories.list_validators,
+        lambda search_params: saved_posts.get_by_user_validators(
+            user.id, search_params, [saved_posts.is_saved_by(user.id)]
+        ),
+        lambda search_params: subscribes.get_followers_validators(user.id, search_params),
+        lambda search_params: subscribes.get_subscriptions_validators(user.id, search_params),
+    ]
+
+    for search_params in (params(), params(q="title"), params(q="admin")):
+        for fetch in paged:
+            page = await fetch(search_params)
+            if page.next_cursor is not None:
+                await fetch(params(q=search_params.q, cursor=page.next_cursor))
+                await fetch(params(q=search_params.q, cursor=page.next_cursor, include_total=False))
+
+        for fetch_validators in validators:
+            await fetch_validators(search_params)
+
+    page = await feed.get_page(user.id, params(include_total=False))
+    await feed.get_page(user.id, params(cursor=page.next_cursor, include_total=False))
+    keys = await merge_feed(session, user.id, params(include_total=False), 2)
+    await merge_feed(session, user.id, params(cursor=encode_cursor(keys[0]), include_total=False), 2)
+
+    for export in (posts.export(), users.export(), comments.export(since=datetime(2020, 1, 1))):
+        async for _ in export:
+            pass
+
+    await posts.get_snippets([post.id], "title")
+    await posts.get_post_validators(post.id, [saved_posts.is_saved_by(user.id)])
+    await users.get_user_validators(user.id, [subscribes.is_subscribed_by(user.id)])
+    await users.get_user_by_login(user.login)
+    await users.get_user_by_email(user.email)
+    await categories.get_validators(category.id)
+    await categories.get_by_title(category.title)
+    await saved_posts.get_by_user_and_post(user.id, post.id)
+    await subscribes.get_by_author_and_subscriber(other.id, user.id)
+    await saved_posts.get_saved_post_ids(user.id)
+    await saved_posts.get_saved_post_ids(user.id, [post.id, post.id + 1])
+    await subscribes.get_author_ids(user.id)
+    await subscribes.get_author_ids(user.id, [other.id])
+
+    await posts.update_post(post, PostUpdateRequest(title="новый", content="текст", categoryIds=[]))
+    await users.update_user(other, UserUpdateRequest(email=other.email, login="other-login"))
+    await categories.update(category, CategoryUpdateRequest(title="sqlite"))
+    await comments.update(comment, CommentUpdateRequest(content="исправлено"))
+    await comments.delete(comment)
+    await saved_posts.delete(saved)
+    await subscribes.delete(subscribe)
+    await posts.delete_post(fanned)
+    await categories.delete(category)
+
+
+@pytest.mark.anyio
+class TestQueryPlans:
+    async def test_no_full_table_scans(
+        self, session: AsyncSession, user: User, statements: list[Statement], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Лента через feed_entries; слияние при чтении exercise вызывает напрямую.
+        monkeypatch.setattr(settings, "feed_merge_max_subscriptions", -1)
+        await exercise(session, user)
+        executed = [(statement, parameters) for statement, parameters in statements if statement.startswith(DML)]
+        tables = set(Base.metadata.tables)
+        connection = await session.connection()
+        scans: dict[str, list[str]] = {}
+
+        for statement, parameters in executed:
+            plan = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row.detail for row in plan]
+            full = [detail for detail in details if (match := FULL_SCAN.match(detail)) and match[1] in tables]
+
+            if full:
+                scans[statement] = details
+
+        assert len(executed) > 100
+        assert scans == {}
@@ -0,0 +1,87 @@
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.feed.merge import FeedKey, merge_feed
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.subscribes.models import Subscribe
+from blog_system_backend.src.pagination import PaginationSearchParams, encode_cursor
+
+
+@pytest.fixture(scope="function")
+def statements(session: AsyncSession) -> Iterator[list[str]]:
+    engine = session.bind.sync_engine
+    captured: list[str] = []
+
+    def capture(conn: object, cursor: object, statement: str, *args: object) -> None:
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def params(limit: int, cursor: str | None = None) -> PaginationSearchParams:
+    return PaginationSearchParams.model_construct(q=None, offset=0, limit=limit, cursor=cursor, include_total=False)
+
+
+@pytest.mark.anyio
+class TestFeedMerge:
+    @pytest.fixture(scope="function", autouse=True)
+    async def setup(self, session: AsyncSession, user: User) -> None:
+        random.seed(7)
+        authors = [User(email=f"author{i}@example.com", login=f"author{i}", password="password") for i in range(30)]
+        outsider = User(email="outsider@example.com", login="outsider", password="password")
+        session.add_all([*authors, outsider])
+        await session.flush()
+
+        # Явные даты SQLAlchemy пишет с микросекундами, а курсор сравнивает ту же строку (см. audit_timestamp).
+        start = datetime(2024, 1, 1, microsecond=1)
+        posts = [
+            # Часть постов с одинаковым createdAt: порядок между ними задает id.
+            Post(
+                authorId=author.id,
+                title="title",
+                content="content",
+                createdAt=start + timedelta(hours=random.randint(0, 40)),
+            )
+            for author in [*authors, outsider]
+            for _ in range(random.randint(0, 6))
+        ]
+        session.add_all(posts)
+        session.add_all(Subscribe(authorId=author.id, subscriberId=user.id) for author in authors)
+        await session.commit()
+
+        self.session = session
+        self.user = user
+        self.expected = sorted(
+            ((post.createdAt, post.id) for post in posts if post.authorId != outsider.id), reverse=True
+        )
+
+    async def walk(self, limit: int) -> list[FeedKey]:
+        keys: list[FeedKey] = []
+        cursor = None
+
+        while True:
+            page = await merge_feed(self.session, self.user.id, params(limit, cursor), limit)
+            keys += page
+            if len(page) < limit:
+                return keys
+            cursor = encode_cursor(page[-1])
+
+    @pytest.mark.parametrize("limit", (1, 7, 100))
+    async def test_matches_sorted_posts(self, limit: int) -> None:
+        assert await self.walk(limit) == self.expected
+
+    async def test_reads_only_page_authors(self, statements: list[str]) -> None:
+        page = await merge_feed(self.session, self.user.id, params(5), 5)
+
+        # Запрос голов и одно дочитывание авторов страницы; списка авторов в запросах нет.
+        assert page == self.expected[:5]
+        assert len(statements) == 2
+        assert all(" IN (" not in statement for statement in statements)
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.db.instrumentation import capture_queries
+from blog_system_backend.src.pagination import PaginationSearchParams, decode_cursor, encode_cursor
+
+
+@pytest.mark.anyio
+class TestKeyset:
+    async def test_cursor_roundtrip(self) -> None:
+        moment = datetime(2024, 1, 1, 12, 30)
+
+        assert decode_cursor(encode_cursor([moment, 5])) == [moment.isoformat(), 5]
+
+    @pytest.mark.parametrize("cursor", ("not a cursor", encode_cursor([]), "e30"))
+    async def test_invalid_cursor(self, session: AsyncSession, user: User, cursor: str) -> None:
+        with pytest.raises(HTTPException):
+            await PostRepository(session).get_posts_page(PaginationSearchParams.model_construct(limit=2, cursor=cursor))
+
+    async def test_walk_pages_with_equal_sort_keys(self, session: AsyncSession, user: User) -> None:
+        # Одинаковый createdAt у всех постов: порядок внутри страницы задает только id.
+        session.add_all(Post(authorId=user.id, title=f"post{i}", content="content") for i in range(5))
+        await session.commit()
+
+        repository = PostRepository(session)
+        expected = [
+            post.id for post in (await repository.get_posts_page(PaginationSearchParams.model_construct())).items
+        ]
+
+        collected: list[int] = []
+        search_params = PaginationSearchParams.model_construct(limit=2)
+
+        while True:
+            page = await repository.get_posts_page(search_params)
+            collected.extend(post.id for post in page.items)
+
+            if page.next_cursor is None:
+                break
+
+            search_params = PaginationSearchParams.model_construct(limit=2, cursor=page.next_cursor)
+
+        assert collected == expected
+        assert collected == sorted(collected, reverse=True)
+
+    async def test_cursor_page_with_total_in_one_query(self, session: AsyncSession, user: User) -> None:
+        session.add_all(Post(authorId=user.id, title=f"post{i}", content="content") for i in range(5))
+        await session.commit()
+
+        keyset = PostRepository.keyset
+        first = await keyset.fetch(session, select(Post), PaginationSearchParams.model_construct(limit=2))
+
+        with capture_queries() as stats:
+            search_params = PaginationSearchParams.model_construct(limit=2, cursor=first.next_cursor)
+            second = await keyset.fetch(session, select(Post), search_params)
+
+        assert stats.query_count == 1
+        assert first.total_items == second.total_items == 5
+        assert second.has_next_page
@@ -0,0 +1,23 @@
+import pytest
+
+from blog_system_backend.src.api.posts.excerpt import make_excerpt
+
+
+@pytest.mark.anyio
+class TestPostExcerpt:
+    @pytest.mark.parametrize(
+        ("content", "length", "expected"),
+        (
+            ("короткий текст", 20, "короткий текст"),
+            ("  пробелы \n\n и   переносы ", 40, "пробелы и переносы"),
+            ("hello world foo", 12, "hello world…"),
+            ("hello world foo", 11, "hello…"),
+            ("ab, cd ef", 5, "ab…"),
+            ("abcdefghijklmnop", 5, "abcd…"),
+        ),
+    )
+    async def test_make_excerpt(self, content: str, length: int, expected: str) -> None:
+        excerpt = make_excerpt(content, length)
+
+        assert excerpt == expected
+        assert len(excerpt) <= length
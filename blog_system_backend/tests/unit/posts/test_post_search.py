@@ -0,0 +1,91 @@
+import pytest
+
+from blog_system_backend.src.api.posts import repository as post_repository_module
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.posts.schemas import PostUpdateRequest
+from blog_system_backend.src.api.posts.search import fts_query
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.src.api.users.repository import UserRepository
+from blog_system_backend.src.pagination import PaginationSearchParams
+from blog_system_backend.tests.utils.posts import generate_post
+from blog_system_backend.tests.utils.users import generate_user
+
+
+@pytest.mark.anyio
+class TestPostSearch:
+    @staticmethod
+    async def total(post_repository: PostRepository, q: str) -> int | None:
+        return (await post_repository.get_posts_page(PaginationSearchParams.model_construct(q=q))).total_items
+
+    @pytest.mark.parametrize(
+        ("q", "expected"),
+        (
+            ("sqlite", '"sqlite"*'),
+            ("full text", '"full"* "text"*'),
+            ('"quoted" OR -minus', '"quoted"* "OR"* "minus"*'),
+            ("!!!", None),
+        ),
+    )
+    async def test_fts_query(self, q: str, expected: str | None) -> None:
+        assert fts_query(q) == expected
+
+    async def test_search_ranked(self, post_repository: PostRepository, user: User) -> None:
+        weak = await post_repository.create_post(generate_post(title="notes", content="sqlite once"), user.id)
+        strong = await post_repository.create_post(
+            generate_post(title="sqlite tuning", content="sqlite pragmas and sqlite indexes"), user.id
+        )
+        await post_repository.create_post(generate_post(title="other", content="nothing here"), user.id)
+
+        page = await post_repository.get_posts_page(PaginationSearchParams.model_construct(q="sqli"))
+
+        assert [post.id for post in page.items] == [strong.id, weak.id]
+        assert page.total_items == 2
+        assert page.next_cursor is None
+
+    async def test_search_follows_updates_and_deletes(self, post_repository: PostRepository, user: User) -> None:
+        post = await post_repository.create_post(generate_post(title="alpha", content="first"), user.id)
+
+        await post_repository.update_post(post, PostUpdateRequest(title="beta", content="second"))
+
+        assert await self.total(post_repository, "alpha") == 0
+        assert await self.total(post_repository, "beta") == 1
+
+        await post_repository.delete_post(post)
+
+        assert await self.total(post_repository, "beta") == 0
+
+    async def test_snippets(self, post_repository: PostRepository, user: User) -> None:
+        post = await post_repository.create_post(generate_post(content="tuning the sqlite cache"), user.id)
+
+        snippets = await post_repository.get_snippets([post.id], "sqlite")
+
+        assert "<mark>sqlite</mark>" in snippets[post.id]
+
+    async def test_search_by_author(
+        self, post_repository: PostRepository, user_repository: UserRepository, user: User
+    ) -> None:
+        match = await post_repository.create_post(generate_post(content="sqlite"), user.id)
+        await post_repository.create_post(generate_post(content="postgres"), user.id)
+        other = await user_repository.create_user(generate_user())
+        await post_repository.create_post(generate_post(content="sqlite"), other.id)
+        search_params = PaginationSearchParams.model_construct(q="sqlite")
+
+        page = await post_repository.get_posts_page(search_params, author_id=user.id)
+
+        assert [post.id for post in page.items] == [match.id]
+        assert page.total_items == 1
+        assert (await post_repository.get_posts_page(search_params)).total_items == 2
+
+    async def test_search_fallback_without_fts(
+        self, post_repository: PostRepository, user: User, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def has_posts_fts(*args: object) -> bool:
+            return False
+
+        monkeypatch.setattr(post_repository_module, "has_posts_fts", has_posts_fts)
+        post = await post_repository.create_post(generate_post(content="substring"), user.id)
+
+        page = await post_repository.get_posts_page(PaginationSearchParams.model_construct(q="ubstr"))
+
+        assert [item.id for item in page.items] == [post.id]
+        assert await post_repository.get_snippets([post.id], "ubstr") == {}
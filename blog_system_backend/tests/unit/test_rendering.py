@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi import routing as fastapi_routing
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from blog_system_backend.src.rendering import rendered
+
+
+class Item(BaseModel):
+    id: int
+    title: str
+    snippet: str | None = None
+    createdAt: datetime
+
+
+class Row:
+    id = 1
+    title = "заголовок"
+    snippet = None
+    createdAt = datetime(2024, 1, 1)
+
+
+ITEM = Item(id=1, title="заголовок", createdAt=datetime(2024, 1, 1))
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+@app.get("/fast", response_model=Item)
+@rendered
+async def fast(response: Response) -> Item:
+    response.headers["ETag"] = '"etag"'
+    return ITEM
+
+
+@app.get("/plain", response_model=Item)
+async def plain() -> Item:
+    return ITEM
+
+
+@app.get("/list", response_model=list[Item])
+@rendered
+async def items() -> list[Item]:
+    return [ITEM, ITEM]
+
+
+@app.get("/orm", response_model=Item)
+@rendered
+async def orm() -> Item:
+    return Row()  # type: ignore[return-value]
+
+
+@pytest.mark.anyio
+class TestRendering:
+    @pytest.fixture
+    async def client(self) -> Any:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+    async def test_same_body_as_fastapi(self, client: AsyncClient) -> None:
+        fast = await client.get("/fast")
+        plain = await client.get("/plain")
+
+        assert fast.content == plain.content
+        assert fast.headers["content-type"] == plain.headers["content-type"]
+        assert fast.headers["ETag"] == '"etag"'
+
+    async def test_skips_fastapi_serialization(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def fail(**kwargs: Any) -> Any:
+            raise AssertionError("serialize_response не должен вызываться")
+
+        monkeypatch.setattr(fastapi_routing, "serialize_response", fail)
+
+        assert (await client.get("/fast")).json()["title"] == "заголовок"
+        assert len((await client.get("/list")).json()) == 2
+
+    async def test_falls_back_for_other_values(self, client: AsyncClient) -> None:
+        assert (await client.get("/orm")).json() == (await client.get("/plain")).json()
+
+    async def test_requires_model_annotation(self) -> None:
+        async def endpoint() -> dict[str, int]:
+            return {}
+
+        with pytest.raises(TypeError):
+            rendered(endpoint)
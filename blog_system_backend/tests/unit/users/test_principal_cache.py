@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from blog_system_backend.src.api.users.enums import UserRole
+from blog_system_backend.src.api.users.principal import Principal, PrincipalCache
+
+PRINCIPAL = Principal(id=1, role=UserRole.user, login="login")
+
+
+@pytest.mark.anyio
+class TestPrincipalCache:
+    async def test_token(self) -> None:
+        cache = PrincipalCache(maxsize=2, ttl=60)
+
+        assert cache.get_token("token") is None
+
+        cache.set_token("token", 1, datetime.now(UTC) + timedelta(minutes=5))
+
+        assert cache.get_token("token") == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_token_expires_with_jwt(self) -> None:
+        cache = PrincipalCache(maxsize=2, ttl=60)
+
+        cache.set_token("token", 1, datetime.now(UTC) - timedelta(seconds=1))
+
+        assert cache.get_token("token") is None
+
+    async def test_invalidate(self) -> None:
+        cache = PrincipalCache(maxsize=2, ttl=60)
+
+        cache.set_token("token", 1, None)
+        cache.set_principal(PRINCIPAL)
+
+        assert cache.get_principal(1) == PRINCIPAL
+
+        await cache.invalidate(1)
+
+        assert cache.get_principal(1) is None
+        assert cache.get_token("token") == 1
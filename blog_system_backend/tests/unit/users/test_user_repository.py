@@ -6,104 +6,181 @@ from sqlalchemy.exc import IntegrityError
 from blog_system_backend.src.api.users.models import User
 from blog_system_backend.src.api.users.repository import UserRepository
 from blog_system_backend.src.api.users.schemas import UserUpdateRequest
+from blog_system_backend.src.db.instrumentation import capture_queries
 from blog_system_backend.src.pagination import PaginationSearchParams
 from blog_system_backend.tests.utils.users import generate_login, generate_user
 
 
+@pytest.mark.anyio
 class TestUserRepository:
-    def test_create_success(self, user_repository: UserRepository) -> None:
-        user = user_repository.create_user(generate_user())
+    async def test_create_success(self, user_repository: UserRepository) -> None:
+        user = await user_repository.create_user(generate_user())
 
         assert user.id is not None
         assert user.createdAt is not None
         assert user.updatedAt is not None
         assert user.login == user.login
 
-    def test_create_unique_username(self, user_repository: UserRepository) -> None:
+    async def test_create_unique_username(self, user_repository: UserRepository) -> None:
         username = generate_login()
 
         user1 = generate_user(login=username)
         user2 = generate_user(login=username)
 
-        user_repository.create_user(user1)
+        await user_repository.create_user(user1)
 
         with pytest.raises(IntegrityError):
-            user_repository.create_user(user2)
+            await user_repository.create_user(user2)
 
-    def test_get_by_id_existing(self, user: User, user_repository: UserRepository) -> None:
-        result = user_repository.get_user_by_id(user.id)
+    async def test_get_by_id_existing(self, user: User, user_repository: UserRepository) -> None:
+        result = await user_repository.get_user_by_id(user.id)
 
         assert result == user
 
-    def test_get_by_id_non_existing(self, user_repository: UserRepository) -> None:
-        result = user_repository.get_user_by_id(random.randint(1, 100))
+    async def test_get_by_id_non_existing(self, user_repository: UserRepository) -> None:
+        result = await user_repository.get_user_by_id(random.randint(1, 100))
 
         assert result is None
 
-    def test_get_by_username_existing(self, user: User, user_repository: UserRepository) -> None:
-        result = user_repository.get_user_by_login(user.login)
+    async def test_get_by_username_existing(self, user: User, user_repository: UserRepository) -> None:
+        result = await user_repository.get_user_by_login(user.login)
 
         assert result == user
 
-    def test_get_by_username_non_existing(self, user_repository: UserRepository) -> None:
-        result = user_repository.get_user_by_login(generate_login())
+    async def test_get_by_username_non_existing(self, user_repository: UserRepository) -> None:
+        result = await user_repository.get_user_by_login(generate_login())
 
         assert result is None
 
-    def test_update_user(self, user: User, user_repository: UserRepository) -> None:
+    async def test_update_user(self, user: User, user_repository: UserRepository) -> None:
         new_username = generate_login()
         old_username = user.login
 
-        user_repository.update_user(user, UserUpdateRequest(login=new_username, email=user.email))
+        await user_repository.update_user(user, UserUpdateRequest(login=new_username, email=user.email))
 
-        updated_user = user_repository.get_user_by_id(user.id)
+        updated_user = await user_repository.get_user_by_id(user.id)
 
         assert updated_user is not None
         assert updated_user.login == new_username
         assert updated_user.login != old_username
 
-    def test_get_all_empty(self, user_repository: UserRepository) -> None:
-        users = user_repository.get_users()
+    async def test_get_all_empty(self, user_repository: UserRepository) -> None:
+        users = (await user_repository.get_users_page(PaginationSearchParams.model_construct())).items
 
         assert len(users) == 0
 
-    def test_get_all_with_users(self, user_repository: UserRepository) -> None:
+    async def test_get_all_with_users(self, user_repository: UserRepository) -> None:
         count = 3
 
         for _ in range(count):
-            user_repository.create_user(generate_user())
+            await user_repository.create_user(generate_user())
 
-        users = user_repository.get_users()
+        users = (await user_repository.get_users_page(PaginationSearchParams.model_construct())).items
 
         assert len(users) == count
 
-    def test_get_all_pagination(self, user_repository: UserRepository) -> None:
+    async def test_get_all_pagination(self, user_repository: UserRepository) -> None:
         count = 5
 
         for _ in range(count):
-            user_repository.create_user(generate_user())
+            await user_repository.create_user(generate_user())
 
-        page1 = user_repository.get_users(PaginationSearchParams.model_construct(limit=2))
-        assert len(page1) == 2
+        page1 = await user_repository.get_users_page(PaginationSearchParams.model_construct(limit=2))
+        assert len(page1.items) == 2
 
-        page2 = user_repository.get_users(PaginationSearchParams.model_construct(limit=2, offset=2))
-        assert len(page2) == 2
+        page2 = await user_repository.get_users_page(PaginationSearchParams.model_construct(limit=2, offset=2))
+        assert len(page2.items) == 2
 
-        assert page1[0].id != page2[0].id
+        assert page1.items[0].id != page2.items[0].id
 
-    def test_get_all_search(self, user_repository: UserRepository) -> None:
-        user1 = user_repository.create_user(generate_user(login="maria123"))
+    async def test_get_all_cursor_pagination(self, user_repository: UserRepository) -> None:
+        for i in range(5):
+            await user_repository.create_user(generate_user(login=f"user{i}"))
 
-        results = user_repository.get_users(PaginationSearchParams.model_construct(q="mari"))
+        page1 = await user_repository.get_users_page(PaginationSearchParams.model_construct(limit=2))
+        assert page1.next_cursor is not None
+
+        search_params = PaginationSearchParams.model_construct(limit=2, cursor=page1.next_cursor)
+        page2 = await user_repository.get_users_page(search_params)
+
+        assert [user.login for user in page1.items + page2.items] == ["user0", "user1", "user2", "user3"]
+
+    async def test_get_page_single_query(self, user_repository: UserRepository) -> None:
+        for _ in range(5):
+            await user_repository.create_user(generate_user())
+
+        with capture_queries() as stats:
+            page = await user_repository.get_users_page(PaginationSearchParams.model_construct(limit=2, offset=2))
+
+        assert stats.query_count == 1
+        assert len(page.items) == 2
+        assert page.total_items == 5
+        assert page.has_next_page
+
+    async def test_get_page_beyond_last(self, user_repository: UserRepository) -> None:
+        for _ in range(3):
+            await user_repository.create_user(generate_user())
+
+        page = await user_repository.get_users_page(PaginationSearchParams.model_construct(limit=2, offset=10))
+
+        assert page.items == []
+        assert page.total_items == 3
+        assert not page.has_next_page
+
+    @pytest.mark.parametrize(("offset", "has_next_page"), ((0, True), (2, True), (4, False)))
+    async def test_get_page_without_total(
+        self, user_repository: UserRepository, offset: int, has_next_page: bool
+    ) -> None:
+        for _ in range(5):
+            await user_repository.create_user(generate_user())
+
+        search_params = PaginationSearchParams.model_construct(limit=2, offset=offset, include_total=False)
+
+        with capture_queries() as stats:
+            page = await user_repository.get_users_page(search_params)
+
+        assert stats.query_count == 1
+        assert page.total_items is None
+        assert page.has_next_page is has_next_page
+        assert len(page.items) == (2 if has_next_page else 1)
+
+    async def test_get_all_search(self, user_repository: UserRepository) -> None:
+        user1 = await user_repository.create_user(generate_user(login="maria123"))
+
+        results = (await user_repository.get_users_page(PaginationSearchParams.model_construct(q="mari"))).items
 
         assert len(results) == 1
         assert results[0].id == user1.id
 
-    def test_get_all_ordering(self, user_repository: UserRepository) -> None:
-        user_repository.create_user(generate_user(login="z_user"))
-        user_repository.create_user(generate_user(login="a_user"))
+    async def test_get_all_search_case_insensitive(self, user_repository: UserRepository) -> None:
+        user1 = await user_repository.create_user(generate_user(login="Maria123"))
+
+        results = (await user_repository.get_users_page(PaginationSearchParams.model_construct(q="ARIA"))).items
+
+        assert [result.id for result in results] == [user1.id]
+
+    async def test_get_all_search_short_substring(self, user_repository: UserRepository) -> None:
+        user1 = await user_repository.create_user(generate_user(login="maria123"))
+        user2 = await user_repository.create_user(generate_user(login="anna_ma"))
+        await user_repository.create_user(generate_user(login="bob"))
+
+        results = (await user_repository.get_users_page(PaginationSearchParams.model_construct(q="Ma"))).items
+
+        assert {result.id for result in results} == {user1.id, user2.id}
+
+    async def test_get_all_search_typo(self, user_repository: UserRepository) -> None:
+        user1 = await user_repository.create_user(generate_user(login="administrator"))
+        await user_repository.create_user(generate_user(login="bob_builder"))
+
+        results = (await user_repository.get_users_page(PaginationSearchParams.model_construct(q="adminstrator"))).items
+
+        assert [result.id for result in results] == [user1.id]
+
+    async def test_get_all_ordering(self, user_repository: UserRepository) -> None:
+        await user_repository.create_user(generate_user(login="z_user"))
+        await user_repository.create_user(generate_user(login="a_user"))
 
-        users = user_repository.get_users()
+        users = (await user_repository.get_users_page(PaginationSearchParams.model_construct())).items
 
         assert users[0].login == "a_user"
         assert users[1].login == "z_user"
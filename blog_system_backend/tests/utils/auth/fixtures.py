@@ -15,7 +15,7 @@ async def auth_client(client: AsyncClient) -> AuthClient:
 @pytest.fixture(scope="function")
 async def token(auth_client: AuthClient, user_repository: UserRepository, user_client: UserClient) -> str:
     plain_admin = generate_user(login="admin")
-    user_repository.create_user(plain_admin, is_admin=True)
+    await user_repository.create_user(plain_admin, is_admin=True)
 
     response = await auth_client.login(username=plain_admin.login, password=plain_admin.password)
 
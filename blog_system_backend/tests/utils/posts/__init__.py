@@ -0,0 +1,11 @@
+__all__ = [
+    "generate_post",
+    "post_client",
+    "post_repository",
+    "post",
+    "PostClient",
+]
+
+from blog_system_backend.tests.utils.posts.client import PostClient
+from blog_system_backend.tests.utils.posts.fixtures import post, post_client, post_repository
+from blog_system_backend.tests.utils.posts.generator import generate_post
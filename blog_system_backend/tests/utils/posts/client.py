@@ -0,0 +1,17 @@
+from typing import Any
+
+from httpx import AsyncClient, Response
+
+
+class PostClient:
+    def __init__(self, *, client: AsyncClient) -> None:
+        self.client = client
+
+    async def get_posts(self, *, params: dict[str, Any] | None = None) -> Response:
+        return await self.client.get("/api/posts", params=params)
+
+    async def get_post(self, id: int) -> Response:
+        return await self.client.get(f"/api/posts/{id}")
+
+    async def get_user_posts(self, user_id: int, *, params: dict[str, Any] | None = None) -> Response:
+        return await self.client.get(f"/api/users/{user_id}/posts", params=params)
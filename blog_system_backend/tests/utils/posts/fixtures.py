@@ -0,0 +1,24 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog_system_backend.src.api.posts.models import Post
+from blog_system_backend.src.api.posts.repository import PostRepository
+from blog_system_backend.src.api.users.models import User
+from blog_system_backend.tests.utils.posts.client import PostClient
+from blog_system_backend.tests.utils.posts.generator import generate_post
+
+
+@pytest.fixture(scope="function")
+def post_client(client: AsyncClient) -> PostClient:
+    return PostClient(client=client)
+
+
+@pytest.fixture(scope="function")
+def post_repository(session: AsyncSession) -> PostRepository:
+    return PostRepository(session=session)
+
+
+@pytest.fixture(scope="function")
+async def post(post_repository: PostRepository, user: User) -> Post:
+    return await post_repository.create_post(generate_post(), user.id)
@@ -0,0 +1,17 @@
+import random
+import string
+
+from blog_system_backend.src.api.posts.schemas import PostCreateRequest
+
+
+def generate_post(title: str | None = None, content: str | None = None) -> PostCreateRequest:
+    return PostCreateRequest(
+        title=title or generate_text(words=4),
+        content=content or generate_text(words=32),
+    )
+
+
+def generate_text(*, words: int) -> str:
+    return " ".join(
+        "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))) for _ in range(words)
+    )
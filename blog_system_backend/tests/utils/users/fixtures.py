@@ -1,6 +1,6 @@
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from blog_system_backend.src.api.users.models import User
 from blog_system_backend.src.api.users.repository import UserRepository
@@ -14,10 +14,10 @@ def user_client(client: AsyncClient) -> UserClient:
 
 
 @pytest.fixture(scope="function")
-def user_repository(session: Session) -> UserRepository:
+def user_repository(session: AsyncSession) -> UserRepository:
     return UserRepository(session=session)
 
 
 @pytest.fixture(scope="function")
-def user(user_repository: UserRepository) -> User:
-    return user_repository.create_user(generate_user())
+async def user(user_repository: UserRepository) -> User:
+    return await user_repository.create_user(generate_user())